@@ -18,9 +18,17 @@ Assertions for the base classes and abstract hierarchy.
 ## Imports
 ##########################################################################
 
+import os
+import shutil
+import tempfile
 import unittest
+import warnings
+import numpy as np
+import numpy.testing as npt
 
 from yellowbrick.base import *
+from yellowbrick.exceptions import YellowbrickValueError, YellowbrickWarning
+from sklearn.linear_model import LinearRegression
 
 try:
     from unittest import mock
@@ -65,3 +73,239 @@ class BaseTests(unittest.TestCase):
 
         visualizer.fit.assert_called_once_with([], None)
         visualizer.draw.assert_called_once_with()
+
+
+##########################################################################
+## Score Visualizer Tests
+##########################################################################
+
+class ScoreVisualizerTests(unittest.TestCase):
+    """
+    Test the ScoreVisualizer base class
+    """
+
+    X = np.random.RandomState(42).rand(103, 4)
+    y = np.random.RandomState(43).rand(103)
+
+    def test_predict_unbatched(self):
+        """
+        Assert predict passes X straight through without a batch size
+        """
+        model = mock.Mock()
+        model.predict.return_value = self.y
+        visualizer = ScoreVisualizer(model)
+
+        self.assertIs(visualizer.predict(self.X), self.y)
+        model.predict.assert_called_once_with(self.X)
+
+    def test_predict_list(self):
+        """
+        Assert predict accepts lists with and without a batch size
+        """
+        X = self.X.tolist()
+        model = LinearRegression().fit(self.X, self.y)
+        expected = model.predict(self.X)
+
+        for batch_size in (None, 10):
+            visualizer = ScoreVisualizer(model, batch_size=batch_size)
+            npt.assert_array_almost_equal(visualizer.predict(X), expected)
+
+    def test_predict_batched(self):
+        """
+        Assert batched predictions match unbatched predictions
+        """
+        model = LinearRegression().fit(self.X, self.y)
+        expected = model.predict(self.X)
+
+        for n_jobs in (1, 2):
+            visualizer = ScoreVisualizer(model, batch_size=10, n_jobs=n_jobs)
+            npt.assert_array_almost_equal(visualizer.predict(self.X), expected)
+
+    def test_predict_batch_sizes(self):
+        """
+        Assert that no chunk passed to the estimator exceeds the batch size
+        """
+        model = mock.Mock()
+        model.predict.side_effect = lambda X: X[:, 0]
+        visualizer = ScoreVisualizer(model, batch_size=25)
+
+        npt.assert_array_equal(visualizer.predict(self.X), self.X[:, 0])
+        self.assertEqual(model.predict.call_count, 5)
+        for call in model.predict.call_args_list:
+            self.assertLessEqual(call[0][0].shape[0], 25)
+
+    def test_bad_batch_size(self):
+        """
+        Assert that a non-positive batch size raises a value error
+        """
+        visualizer = ScoreVisualizer(mock.Mock(), batch_size=0)
+        with self.assertRaises(YellowbrickValueError):
+            visualizer.predict(self.X)
+
+    def test_prefit(self):
+        """
+        Assert prefit controls whether fit retrains the estimator
+        """
+        model = mock.Mock()
+        ScoreVisualizer(model).fit(self.X, self.y)
+        self.assertEqual(model.fit.call_count, 1)
+
+        ScoreVisualizer(model, prefit=True).fit(self.X, self.y)
+        self.assertEqual(model.fit.call_count, 1)
+
+        with self.assertRaises(YellowbrickValueError):
+            ScoreVisualizer(model, prefit='maybe')
+
+
+##########################################################################
+## Figure Tests
+##########################################################################
+
+class FigureTests(unittest.TestCase):
+
+    def test_new_axes(self):
+        """
+        Assert new axes are on an Agg canvas not managed by pyplot
+        """
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        ax = new_axes(xlim=(-1, 1))
+        self.assertIsInstance(ax.figure.canvas, FigureCanvasAgg)
+        self.assertIsNone(getattr(ax.figure.canvas, 'manager', None))
+        self.assertEqual(ax.get_xlim(), (-1, 1))
+
+    def test_show_unmanaged(self):
+        """
+        Assert showing a figure pyplot does not manage warns and returns it
+        """
+        visualizer = Visualizer(ax=new_axes())
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            figure = visualizer.show()
+
+        self.assertIs(figure, visualizer.ax.figure)
+        self.assertEqual(len(caught), 1)
+        self.assertTrue(issubclass(caught[0].category, YellowbrickWarning))
+
+    def test_show_pyplot(self):
+        """
+        Assert figures managed by pyplot are shown with pyplot without a warning
+        """
+        import matplotlib.pyplot as plt
+
+        figure, ax = plt.subplots()
+        try:
+            visualizer = Visualizer(ax=ax)
+            with mock.patch.object(plt, 'show') as show:
+                with warnings.catch_warnings(record=True) as caught:
+                    warnings.simplefilter("always")
+                    self.assertIs(visualizer.show(), figure)
+
+            show.assert_called_once_with()
+            self.assertEqual(caught, [])
+        finally:
+            plt.close(figure)
+
+    def test_show_outpath(self):
+        """
+        Assert showing with an outpath saves the figure without a warning
+        """
+        tmpdir = tempfile.mkdtemp()
+        try:
+            outpath = os.path.join(tmpdir, 'figure.png')
+            visualizer = Visualizer(ax=new_axes())
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                visualizer.show(outpath)
+
+            self.assertEqual(caught, [])
+            self.assertTrue(os.path.exists(outpath))
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_render_before_draw(self):
+        """
+        Assert rendering a visualizer that has not drawn raises an error
+        """
+        visualizer = Visualizer()
+        with self.assertRaises(YellowbrickValueError):
+            visualizer.render()
+        with self.assertRaises(YellowbrickValueError):
+            visualizer.rgba()
+
+    def test_generate_subplots(self):
+        """
+        Assert one shared axes is created per model
+        """
+        mixin = MultiModelMixin([LinearRegression(), LinearRegression()])
+        axes = mixin.generate_subplots()
+        self.assertEqual(len(axes), 2)
+        self.assertIs(axes[0].figure, axes[1].figure)
+
+
+##########################################################################
+## Cross Validation Tests
+##########################################################################
+
+class CrossValPredictionsTests(unittest.TestCase):
+    """
+    Test the parallel out-of-fold prediction helper
+    """
+
+    def test_cross_val_predictions(self):
+        """
+        Assert out-of-fold predictions match per fold refits
+        """
+        rng = np.random.RandomState(42)
+        X = rng.rand(30, 3)
+        y = X.sum(axis=1) + rng.rand(30)
+
+        for n_jobs in (1, 2):
+            y_pred, folds = cross_val_predictions(LinearRegression(), X, y, cv=3, n_jobs=n_jobs)
+            self.assertEqual(y_pred.shape, (30,))
+            npt.assert_array_equal(np.bincount(folds), [10, 10, 10])
+
+            for fold in range(3):
+                mask = folds == fold
+                model = LinearRegression().fit(X[~mask], y[~mask])
+                npt.assert_array_almost_equal(y_pred[mask], model.predict(X[mask]))
+
+
+##########################################################################
+## Multiple Model Tests
+##########################################################################
+
+class MultiModelMixinTests(unittest.TestCase):
+    """
+    Test the shared fold cross-validation of multiple models
+    """
+
+    def test_predict_shared_folds(self):
+        """
+        Assert each model is cross-validated on the same folds in one pool
+        """
+        rng = np.random.RandomState(42)
+        X = rng.rand(40, 3)
+        y = X.sum(axis=1) + rng.rand(40)
+
+        models = [LinearRegression(), LinearRegression(fit_intercept=False)]
+        for n_jobs in (1, 2):
+            mixin = MultiModelMixin(models, cv=4, n_jobs=n_jobs)
+            predictions = mixin.predict(X, y)
+
+            self.assertEqual(len(predictions), 2)
+            self.assertEqual(mixin.fit_times_.shape, (2, 4))
+            for model, y_pred in zip(models, predictions):
+                expected, _ = cross_val_predictions(model, X, y, cv=4)
+                npt.assert_array_almost_equal(y_pred, expected)
+
+    def test_fit_costs(self):
+        """
+        Assert fits are ordered by train size and previous fit times
+        """
+        mixin = MultiModelMixin([LinearRegression(), LinearRegression()])
+        splits = [(np.arange(8), None), (np.arange(4), None)]
+        npt.assert_array_equal(mixin._fit_costs(splits), [[8, 4], [8, 4]])
+
+        mixin.fit_times_ = np.array([[1.0, 1.0], [3.0, 3.0]])
+        npt.assert_array_equal(mixin._fit_costs(splits), [[8, 4], [24, 12]])
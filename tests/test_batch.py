@@ -0,0 +1,77 @@
+# tests.test_batch
+# Tests for rendering many visualizations across a pool of processes.
+#
+# Copyright (C) 2016 District Data Labs
+# For license information, see LICENSE.txt
+
+"""
+Tests for rendering many visualizations across a pool of processes.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+from tests.base import VisualTestCase
+from yellowbrick.batch import *
+from yellowbrick.features import RadViz
+from sklearn.svm import LinearSVC
+
+
+##########################################################################
+## Batch Rendering Tests
+##########################################################################
+
+class RenderBatchTests(VisualTestCase):
+
+    X = np.random.RandomState(42).rand(40, 4)
+    y = np.array([0, 1] * 20)
+
+    def setUp(self):
+        super(RenderBatchTests, self).setUp()
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def make_jobs(self):
+        datapath = os.path.join(self.path, 'data.npz')
+        np.savez(datapath, X=self.X, y=self.y)
+
+        return [
+            (RadViz(), (self.X, self.y), os.path.join(self.path, 'radviz.png')),
+            (('yellowbrick.features.Rank2D', {}), datapath,
+                os.path.join(self.path, 'rank2d.png')),
+            (('yellowbrick.classifier.ClassificationReport', {'model': LinearSVC()}),
+                (self.X, self.y), os.path.join(self.path, 'report.png')),
+            (('yellowbrick.features.Rank2D', {'algorithm': 'kendall'}),
+                (self.X, self.y), os.path.join(self.path, 'fails.png')),
+        ]
+
+    def test_render_batch(self):
+        """
+        Assert jobs are rendered in a process pool with per job failures
+        """
+        for n_jobs in (1, 2):
+            results = render_batch(self.make_jobs(), n_jobs=n_jobs)
+            self.assertEqual(len(results), 4)
+
+            for result in results[:3]:
+                self.assertIsNone(result.error)
+                self.assertTrue(os.path.exists(result.outpath))
+
+            self.assertIn('YellowbrickValueError', results[3].error)
+            self.assertFalse(os.path.exists(results[3].outpath))
+
+    def test_bad_spec(self):
+        """
+        Assert specs that are not visualizers are reported as failures
+        """
+        result = render_job(((LinearSVC, {}), (self.X, self.y), 'out.png'))
+        self.assertIn('not a Visualizer', result.error)
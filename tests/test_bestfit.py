@@ -70,6 +70,52 @@ class BestFitTests(VisualTestCase):
 
         self.assertEqual(axe, draw_best_fit(X, y, axe, 'linear'))
         self.assertEqual(axe, draw_best_fit(X, y, axe, 'quadratic'))
+        self.assertEqual(axe, draw_best_fit(X, y, axe, 'exponential'))
+        self.assertEqual(axe, draw_best_fit(X, y, axe, 'log'))
+        self.assertEqual(axe, draw_best_fit(X, y, axe, 'lowess'))
+        self.assertEqual(axe, draw_best_fit(X, y, axe, 'select_best'))
+
+
+    def test_draw_best_fit_ci(self):
+        """
+        Test that a bootstrap confidence band is drawn around the line
+        """
+        fig, axe = plt.subplots()
+        X, y = ANSCOMBE[0]
+        axe.scatter(X, y)
+
+        draw_best_fit(X, y, axe, 'linear', ci=0.9, n_boot=200, random_state=42)
+        self.assertEqual(len(axe.lines), 1)
+        self.assertEqual(len(axe.collections), 2)
+
+        # Unsupported families raise before anything is drawn
+        with self.assertRaises(YellowbrickValueError):
+            draw_best_fit(X, y, axe, 'lowess', ci=0.9)
+        self.assertEqual(len(axe.lines), 1)
+
+    def test_bootstrap_band(self):
+        """
+        Test the bootstrap band contains the true line and narrows with n
+        """
+        rng = np.random.RandomState(42)
+        grid = np.linspace(0, 10, 25)
+
+        widths = []
+        for n in (100, 10000):
+            x = rng.uniform(0, 10, n)
+            y = 2 * x + 1 + rng.normal(size=n)
+            lower, upper = bootstrap_band(
+                x, y, grid, n_boot=200, random_state=42, n_jobs=1 if n < 1000 else 2
+            )
+            self.assertTrue(np.all(lower <= upper))
+            self.assertTrue(np.mean((lower <= 2 * grid + 1) & (2 * grid + 1 <= upper)) > 0.8)
+            widths.append(np.mean(upper - lower))
+
+        self.assertLess(widths[1], widths[0])
+
+        x = rng.uniform(1, 2, 100)
+        lower, upper = bootstrap_band(x, np.exp(x), grid[1:], 'exponential', n_boot=50)
+        np.testing.assert_allclose(lower, np.exp(grid[1:]), rtol=1e-6)
 
 
 ##########################################################################
@@ -92,7 +138,14 @@ class EstimatorTests(VisualTestCase):
 
         model = fit_linear(X, y)
         self.assertIsNotNone(model)
-        self.assertIsInstance(model, LinearRegression)
+        self.assertIsInstance(model, PolynomialFit)
+        self.assertEqual(model.degree, 1)
+
+        reference = fit_linear(X, y, engine='sklearn')
+        self.assertIsInstance(reference, LinearRegression)
+        np.testing.assert_array_almost_equal(
+            model.predict(X), reference.predict(X)
+        )
 
 
     def test_quadratic(self):
@@ -106,7 +159,14 @@ class EstimatorTests(VisualTestCase):
 
         model = fit_quadratic(X, y)
         self.assertIsNotNone(model)
-        self.assertIsInstance(model, Pipeline)
+        self.assertIsInstance(model, PolynomialFit)
+        self.assertEqual(model.degree, 2)
+
+        reference = fit_quadratic(X, y, engine='sklearn')
+        self.assertIsInstance(reference, Pipeline)
+        np.testing.assert_array_almost_equal(
+            model.predict(X), reference.predict(X)
+        )
 
     def test_select_best(self):
         """
@@ -119,7 +179,7 @@ class EstimatorTests(VisualTestCase):
 
         model = fit_select_best(X, y)
         self.assertIsNotNone(model)
-        self.assertIsInstance(model, Pipeline)
+        self.assertEqual(model.degree, 2)
 
         X, y = ANSCOMBE[3]
         X = np.array(X)
@@ -128,4 +188,126 @@ class EstimatorTests(VisualTestCase):
 
         model = fit_select_best(X, y)
         self.assertIsNotNone(model)
-        self.assertIsInstance(model, LinearRegression)
+        self.assertEqual(model.degree, 1)
+
+    def test_select_best_families(self):
+        """
+        Test the select best fit estimator chooses the generating family
+        """
+        rng = np.random.RandomState(42)
+        x = np.linspace(1, 10, 200)
+
+        y = np.exp(0.5 * x) * np.exp(rng.normal(scale=0.01, size=200))
+        self.assertIsInstance(fit_select_best(x, y), ExponentialFit)
+
+        y = 3 + 2 * np.log(x) + rng.normal(scale=0.01, size=200)
+        self.assertIsInstance(fit_select_best(x, y, criterion='loo'), LogFit)
+
+        y = 3 + 2 * x + rng.normal(scale=1, size=200)
+        self.assertEqual(fit_select_best(-x, y).degree, 1)
+
+        with self.assertRaises(YellowbrickValueError):
+            fit_select_best(x, y, criterion='mse')
+
+    def test_exponential(self):
+        """
+        Test the exponential best fit estimator
+        """
+        x = np.linspace(0, 2, 20)
+        model = fit_exponential(x[:,np.newaxis], 3 * np.exp(1.5 * x))
+        np.testing.assert_array_almost_equal(model.predict([0, 1]), [3, 3 * np.exp(1.5)])
+
+        with self.assertRaises(YellowbrickValueError):
+            fit_exponential(x, x - 1)
+
+    def test_log(self):
+        """
+        Test the logarithmic best fit estimator
+        """
+        x = np.linspace(1, 5, 20)
+        model = fit_log(x[:,np.newaxis], 2 + 4 * np.log(x))
+        np.testing.assert_array_almost_equal(model.predict([1, np.e]), [2, 6])
+
+        with self.assertRaises(YellowbrickValueError):
+            fit_log(x - 2, x)
+
+
+    def test_lowess(self):
+        """
+        Test the binned LOWESS estimator
+        """
+        rng = np.random.RandomState(42)
+        x = rng.uniform(0, 10, 20000)
+        y = np.sin(x) + rng.normal(scale=0.1, size=20000)
+
+        model = fit_lowess(x[:,np.newaxis], y)
+        self.assertLessEqual(model.counts_.size, 200)
+        self.assertEqual(model.counts_.sum(), 20000)
+
+        grid = np.linspace(1, 9, 50)
+        model.frac = 0.1
+        np.testing.assert_allclose(model.predict(grid), np.sin(grid), atol=0.1)
+
+        # A linear trend is recovered exactly by the local linear fits
+        model = fit_lowess(x, 2 * x + 1)
+        np.testing.assert_array_almost_equal(model.predict(grid), 2 * grid + 1)
+
+        # Constant x falls back to the weighted mean
+        model = fit_lowess(np.ones(10), np.arange(10))
+        np.testing.assert_array_almost_equal(model.predict([1.0]), [4.5])
+
+
+##########################################################################
+## Least squares engine tests
+##########################################################################
+
+class PolynomialFitTests(unittest.TestCase):
+    """
+    Test the closed form polynomial least squares engine.
+    """
+
+    def test_polynomial_fit(self):
+        """
+        Test the polynomial fit matches numpy polyfit
+        """
+        rng = np.random.RandomState(42)
+        x = rng.uniform(1000, 1010, 50)
+        y = 0.5 * x ** 2 - 3 * x + rng.normal(size=50)
+
+        for degree in (1, 2, 3):
+            model = PolynomialFit(degree).fit(x[:, np.newaxis], y)
+            expected = np.polyval(np.polyfit(x, y, degree), x)
+            np.testing.assert_allclose(model.predict(x), expected, rtol=1e-6)
+
+    def test_fit_batch(self):
+        """
+        Test batched fits match the fit of each series
+        """
+        rng = np.random.RandomState(42)
+        X = rng.rand(20, 30) * 10
+        Y = 2 * X - 1 + rng.normal(size=(20, 30))
+        grid = np.linspace(0, 10, 7)
+
+        model = fit_batch(X, Y, degree=2)
+        self.assertEqual(model.coef_.shape, (20, 3))
+        self.assertEqual(model.predict(grid).shape, (20, 7))
+        self.assertEqual(model.predict(X).shape, (20, 30))
+
+        for idx in range(20):
+            single = PolynomialFit(2).fit(X[idx], Y[idx])
+            np.testing.assert_array_almost_equal(
+                model.predict(grid)[idx], single.predict(grid)
+            )
+
+    def test_fit_batch_weights(self):
+        """
+        Test that zero weights exclude padding from batched fits
+        """
+        X = np.array([[1, 2, 3, 0], [1, 2, 3, 4]], dtype=float)
+        Y = np.array([[2, 4, 6, 100], [1, 2, 3, 4]], dtype=float)
+        W = np.array([[1, 1, 1, 0], [1, 1, 1, 1]], dtype=float)
+
+        model = fit_batch(X, Y, weights=W)
+        np.testing.assert_array_almost_equal(
+            model.predict([0, 10]), [[0, 20], [0, 10]]
+        )
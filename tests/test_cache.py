@@ -0,0 +1,252 @@
+# tests.test_cache
+# Tests for the on-disk caches of intermediate results.
+#
+# Copyright (C) 2016 District Data Labs
+# For license information, see LICENSE.txt
+
+"""
+Tests for the on-disk caches of intermediate results.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+import numpy.testing as npt
+
+import matplotlib as mpl
+
+from yellowbrick.cache import *
+from yellowbrick.batch import render_job
+from yellowbrick.features import RadViz, Rank2D
+from yellowbrick.base import MultiModelMixin, _fit_predict_fold
+from yellowbrick.exceptions import YellowbrickValueError
+from sklearn.linear_model import LinearRegression, Ridge
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+##########################################################################
+## Array Cache Tests
+##########################################################################
+
+class ArrayCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_fingerprint(self):
+        """
+        Assert arrays are fingerprinted by shape, dtype, strides and contents
+        """
+        X = np.arange(12.0).reshape(3, 4)
+        for level in (SAMPLE, CHECKSUM, EXACT):
+            key = fingerprint(X, level)
+            self.assertEqual(key, fingerprint(X.copy(), level))
+            self.assertNotEqual(key, fingerprint(X.reshape(4, 3), level))
+            self.assertNotEqual(key, fingerprint(X.astype(np.float32), level))
+            self.assertNotEqual(key, fingerprint(np.asfortranarray(X), level))
+            self.assertNotEqual(key, fingerprint(X + 1, level))
+
+        with self.assertRaises(YellowbrickValueError):
+            fingerprint(X, 'approximate')
+
+    def test_fingerprint_levels(self):
+        """
+        Assert unsampled changes are caught by the checksum and exact levels
+        """
+        X = np.zeros((10000, 3))
+        Y = X.copy()
+        Y[5001, 1] = 1.0
+
+        self.assertEqual(fingerprint(X, SAMPLE, max_rows=100), fingerprint(Y, SAMPLE, max_rows=100))
+        self.assertNotEqual(fingerprint(X, CHECKSUM, max_rows=100), fingerprint(Y, CHECKSUM, max_rows=100))
+        self.assertNotEqual(fingerprint(X, EXACT), fingerprint(Y, EXACT))
+
+        # Non-contiguous arrays fall back to the sample at the checksum level
+        self.assertEqual(
+            fingerprint(X[:, :2], CHECKSUM, max_rows=100),
+            fingerprint(Y[:, :2], CHECKSUM, max_rows=100)
+        )
+
+    def test_fingerprint_memmap(self):
+        """
+        Assert memory maps fingerprint like the arrays they contain
+        """
+        X = np.random.RandomState(42).rand(500, 4)
+        path = os.path.join(self.path, 'X.dat')
+        mm = np.memmap(path, dtype=X.dtype, mode='w+', shape=X.shape)
+        mm[:] = X
+        mm.flush()
+
+        for level in (SAMPLE, CHECKSUM, EXACT):
+            self.assertEqual(fingerprint(mm, level), fingerprint(X, level))
+        del mm
+
+    @unittest.skipIf(pd is None, "pandas is required")
+    def test_fingerprint_dataframe(self):
+        """
+        Assert DataFrames are fingerprinted by columns and values
+        """
+        df = pd.DataFrame({'a': np.arange(5.0), 'b': list('abcde')})
+        other = df.copy()
+        other.loc[2, 'b'] = 'z'
+
+        self.assertEqual(fingerprint(df), fingerprint(df.copy()))
+        self.assertNotEqual(fingerprint(df), fingerprint(other))
+        self.assertNotEqual(fingerprint(df), fingerprint(df.rename(columns={'a': 'c'})))
+
+    def test_get_set(self):
+        """
+        Assert stored arrays are returned as memory maps
+        """
+        cache = ArrayCache(self.path)
+        self.assertIsNone(cache.get('missing'))
+
+        cache.set('a', np.arange(10))
+        array = cache.get('a')
+        self.assertIsInstance(array, np.memmap)
+        npt.assert_array_equal(array, np.arange(10))
+
+    def test_evict_lru(self):
+        """
+        Assert the least recently used arrays are evicted first
+        """
+        cache = ArrayCache(self.path, max_bytes=3000)
+        for idx, key in enumerate('abc'):
+            cache.set(key, np.zeros(100))
+            os.utime(cache.filename(key, ".npy"), (idx, idx))
+
+        # Touch a so that b is the least recently used
+        cache.get('a')
+        cache.set('d', np.zeros(100))
+
+        self.assertIsNone(cache.get('b'))
+        for key in 'acd':
+            self.assertIsNotNone(cache.get(key))
+
+    def test_bad_max_bytes(self):
+        with self.assertRaises(YellowbrickValueError):
+            ArrayCache(self.path, max_bytes=0)
+
+
+##########################################################################
+## Prediction Cache Tests
+##########################################################################
+
+class PredictionCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_multi_model_cache(self):
+        """
+        Assert only models with changed parameters are refit
+        """
+        rng = np.random.RandomState(42)
+        X = rng.rand(40, 3)
+        y = X.sum(axis=1) + rng.rand(40)
+
+        mixin = MultiModelMixin([LinearRegression(), Ridge()], cv=4, cache=self.path)
+        expected = mixin.predict(X, y)
+
+        with mock.patch('yellowbrick.base._fit_predict_fold') as fold:
+            for actual, pred in zip(mixin.predict(X, y), expected):
+                npt.assert_array_equal(actual, pred)
+            fold.assert_not_called()
+
+        mixin.models[1].set_params(alpha=10.0)
+        with mock.patch(
+            'yellowbrick.base._fit_predict_fold', wraps=_fit_predict_fold
+        ) as fold:
+            actual = mixin.predict(X, y)
+            self.assertEqual(fold.call_count, 4)
+            npt.assert_array_equal(actual[0], expected[0])
+            self.assertFalse(np.allclose(actual[1], expected[1]))
+
+    def test_hash_estimator_arrays(self):
+        """
+        Assert array parameters are hashed in full, not by their repr
+        """
+        from sklearn.linear_model import RidgeCV
+
+        alphas = np.logspace(-3, 3, 2000)
+        changed = alphas.copy()
+        changed[500] += 1.0
+
+        key = hash_estimator(RidgeCV(alphas=alphas))
+        self.assertEqual(key, hash_estimator(RidgeCV(alphas=alphas.copy())))
+        self.assertNotEqual(key, hash_estimator(RidgeCV(alphas=changed)))
+
+
+##########################################################################
+## Render Cache Tests
+##########################################################################
+
+class RenderCacheTests(unittest.TestCase):
+
+    X = np.random.RandomState(42).rand(40, 4)
+    y = np.array([0, 1] * 20)
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_key(self):
+        """
+        Assert keys depend on the visualizer options, data and style
+        """
+        cache = RenderCache(self.path)
+        data = {'X': self.X, 'y': self.y}
+
+        key = cache.key(RadViz(), data, format='png')
+        self.assertEqual(key, cache.key(RadViz(), dict(data), format='png'))
+        self.assertNotEqual(key, cache.key(RadViz(classes=['a', 'b']), data, format='png'))
+        self.assertNotEqual(key, cache.key(Rank2D(), data, format='png'))
+        self.assertNotEqual(key, cache.key(RadViz(), {'X': self.X + 1, 'y': self.y}, format='png'))
+        self.assertNotEqual(key, cache.key(RadViz(), data, format='svg'))
+
+        with mpl.rc_context({'lines.linewidth': 7}):
+            self.assertNotEqual(key, cache.key(RadViz(), data, format='png'))
+
+    def test_render_job_cache(self):
+        """
+        Assert cache hits are copied without drawing
+        """
+        cache = RenderCache(self.path)
+        for fmt in ('png', 'svg'):
+            outpath = os.path.join(self.path, 'radviz.' + fmt)
+            job = (RadViz(), (self.X, self.y), outpath)
+
+            self.assertIsNone(render_job(job, cache).error)
+            with open(outpath, 'rb') as f:
+                expected = f.read()
+            os.remove(outpath)
+
+            with mock.patch('yellowbrick.batch._draw') as draw:
+                self.assertIsNone(render_job(job, cache).error)
+                draw.assert_not_called()
+
+            with open(outpath, 'rb') as f:
+                self.assertEqual(f.read(), expected)
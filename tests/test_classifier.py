@@ -16,12 +16,23 @@ Testing for the Classification Score Visualizers
 ##########################################################################
 
 import unittest
+import warnings
 
 from tests.base import VisualTestCase
 from yellowbrick.classifier import *
+from yellowbrick.exceptions import YellowbrickWarning
+
+import numpy.testing as npt
 
 from sklearn.svm import LinearSVC
 from sklearn.metrics import *
+from sklearn.datasets import make_classification
+from sklearn.linear_model import LogisticRegression
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
 
 ##########################################################################
 ## Data
@@ -53,6 +64,23 @@ class ROCAUCTests(VisualTestCase):
         visualizer = ROCAUC(model, classes=["A", "B"])
         visualizer.score(X,y)
 
+    def test_roc_auc_poof(self):
+        """
+        Assert poof shows the figure, warning as it is not managed by pyplot
+        """
+        model = LinearSVC().fit(X, y)
+        visualizer = ROCAUC(model, classes=["A", "B"])
+        visualizer.score(X, y)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            figure = visualizer.poof()
+
+        self.assertIs(figure, visualizer.ax.figure)
+        self.assertTrue(any(
+            issubclass(warning.category, YellowbrickWarning) for warning in caught
+        ))
+
 
 ##########################################################################
 ##  Test for Classification Report
@@ -68,3 +96,219 @@ class ClassificationReportTests(VisualTestCase):
         model.fit(X,y)
         visualizer = ClassificationReport(model, classes=["A", "B"])
         visualizer.score(X,y)
+
+    def test_prefit(self):
+        """
+        Assert prefit models are not retrained and provide their classes
+        """
+        model = LinearSVC().fit(X, y)
+        for prefit in (True, 'auto'):
+            visualizer = ClassificationReport(model, prefit=prefit)
+            with mock.patch.object(model, 'fit') as fit:
+                visualizer.fit(X, y)
+                fit.assert_not_called()
+            npt.assert_array_equal(visualizer.classes_, model.classes_)
+
+        # Scoring without fit reads the classes from the estimator
+        visualizer = ClassificationReport(model, prefit=True)
+        visualizer.score(X, y)
+        npt.assert_array_equal(visualizer.classes_, model.classes_)
+
+        # Unfitted models are fit in auto mode
+        visualizer = ClassificationReport(LinearSVC(), prefit='auto')
+        visualizer.fit(X, y)
+        self.assertTrue(hasattr(visualizer.estimator, 'coef_'))
+
+
+##########################################################################
+##  Test for Discrimination Threshold
+##########################################################################
+
+class DiscriminationThresholdTests(VisualTestCase):
+
+    def test_threshold_metrics(self):
+        """
+        Assert the single pass metrics match the Scikit-Learn metrics
+        """
+        rng = np.random.RandomState(7)
+        yt = rng.randint(0, 2, 200)
+        scores = np.round(rng.rand(200), 2)
+
+        thresholds, metrics = threshold_metrics(yt, scores)
+        npt.assert_array_equal(thresholds, np.unique(scores))
+
+        for idx in (0, 17, 42, len(thresholds) - 1):
+            yp = (scores >= thresholds[idx]).astype(int)
+            p, r, f, _ = precision_recall_fscore_support(
+                yt, yp, average='binary'
+            )
+            self.assertAlmostEqual(metrics['precision'][idx], p)
+            self.assertAlmostEqual(metrics['recall'][idx], r)
+            self.assertAlmostEqual(metrics['f1'][idx], f)
+            self.assertAlmostEqual(metrics['queue_rate'][idx], yp.mean())
+
+    def test_threshold_trials(self):
+        """
+        Assert no errors occur during discrimination threshold trials
+        """
+        Xc, yc = make_classification(n_samples=200, random_state=42)
+        visualizer = DiscriminationThreshold(
+            LogisticRegression(), n_trials=4, num_thresholds=20,
+            random_state=23, n_jobs=2
+        )
+        visualizer.fit(Xc, yc)
+        visualizer.poof()
+
+        for metric in ('precision', 'recall', 'f1', 'queue_rate'):
+            self.assertEqual(visualizer.cv_scores_[metric].shape, (4, 20))
+
+        # The lowest threshold predicts every instance as positive
+        npt.assert_array_equal(visualizer.cv_scores_['queue_rate'][:, 0], 1.0)
+        npt.assert_array_equal(visualizer.cv_scores_['recall'][:, 0], 1.0)
+
+    def test_threshold_score(self):
+        """
+        Assert score draws the curves of a fitted model on a test set
+        """
+        model = LogisticRegression().fit(X, y)
+        visualizer = DiscriminationThreshold(model)
+        visualizer.score(X, y)
+        self.assertEqual(visualizer.cv_scores_['f1'].shape[0], 1)
+
+    def test_threshold_fit_score(self):
+        """
+        Assert fit trains the estimator so that it can then be scored
+        """
+        Xc, yc = make_classification(n_samples=200, random_state=42)
+        visualizer = DiscriminationThreshold(
+            LogisticRegression(), n_trials=3, random_state=23
+        )
+        visualizer.fit(Xc, yc)
+        self.assertTrue(hasattr(visualizer.estimator, 'coef_'))
+
+        visualizer.score(Xc, yc)
+        self.assertEqual(visualizer.cv_scores_['f1'].shape[0], 1)
+
+    def test_threshold_multiclass(self):
+        """
+        Assert that a multiclass target raises a value error
+        """
+        visualizer = DiscriminationThreshold(LogisticRegression())
+        with self.assertRaises(YellowbrickValueError):
+            visualizer.fit(X, np.array([0, 1, 2, 0, 1, 2]))
+
+
+##########################################################################
+##  Test for Calibration Curve
+##########################################################################
+
+class CalibrationCurveTests(VisualTestCase):
+
+    def test_calibration_curve(self):
+        """
+        Assert no errors occur during calibration curve integration
+        """
+        Xc, yc = make_classification(n_samples=200, random_state=42)
+        models = [LogisticRegression().fit(Xc, yc)]
+        visualizer = CalibrationCurve(models, n_bins=5)
+        visualizer.score(Xc, yc)
+        visualizer.poof()
+
+        self.assertEqual(visualizer.counts_.shape, (1, 5))
+        self.assertEqual(visualizer.counts_.sum(), 200)
+
+    def test_partial_score(self):
+        """
+        Assert that streaming chunks accumulates the same statistics
+        """
+        Xc, yc = make_classification(n_samples=300, random_state=42)
+        models = [LogisticRegression().fit(Xc, yc), LogisticRegression(C=0.01).fit(Xc, yc)]
+
+        whole = CalibrationCurve(models)
+        whole.score(Xc, yc)
+
+        stream = CalibrationCurve(models)
+        for idx in range(0, 300, 64):
+            stream.partial_score(Xc[idx:idx+64], yc[idx:idx+64])
+
+        npt.assert_array_equal(stream.counts_, whole.counts_)
+        npt.assert_array_almost_equal(stream.positives_, whole.positives_)
+        npt.assert_array_almost_equal(stream.prob_sums_, whole.prob_sums_)
+        npt.assert_array_almost_equal(stream.brier_scores_, whole.brier_scores_)
+
+    def test_calibration_regressor(self):
+        """
+        Assert that a non-classifier raises a type error
+        """
+        from sklearn.linear_model import LinearRegression
+        with self.assertRaises(YellowbrickTypeError):
+            CalibrationCurve([LogisticRegression(), LinearRegression()])
+
+    def test_calibration_cv_options(self):
+        """
+        Assert that unsupported cross-validation options raise a value error
+        """
+        for key, value in (('cv', 5), ('n_jobs', 4), ('cache', 'cache')):
+            with self.assertRaises(YellowbrickValueError):
+                CalibrationCurve(LogisticRegression(), **{key: value})
+
+        visualizer = CalibrationCurve(LogisticRegression(), names=['logit'])
+        self.assertEqual(visualizer.names, ['logit'])
+
+
+##########################################################################
+##  Test for Class Prediction Error
+##########################################################################
+
+class ClassPredictionErrorTests(VisualTestCase):
+
+    def test_class_prediction_error(self):
+        """
+        Assert the prediction counts match the confusion matrix
+        """
+        Xc, yc = make_classification(
+            n_samples=300, n_classes=3, n_informative=4, random_state=42
+        )
+        model = LogisticRegression().fit(Xc, yc)
+        visualizer = ClassPredictionError(model, classes=["a", "b", "c"])
+        visualizer.score(Xc, yc)
+        visualizer.poof()
+
+        npt.assert_array_equal(
+            visualizer.predictions_, confusion_matrix(yc, model.predict(Xc))
+        )
+
+    def test_class_prediction_labels(self):
+        """
+        Assert that string labels are encoded against the model classes
+        """
+        labels = np.array(["spam", "ham", "eggs"])
+        Xc, yc = make_classification(
+            n_samples=120, n_classes=3, n_informative=4, random_state=42
+        )
+        model = LogisticRegression().fit(Xc, labels[yc])
+        visualizer = ClassPredictionError(model)
+        visualizer.fit(Xc, labels[yc])
+        visualizer.score(Xc, labels[yc])
+
+        self.assertEqual(visualizer.predictions_.sum(), 120)
+        npt.assert_array_equal(
+            visualizer.predictions_,
+            confusion_matrix(labels[yc], model.predict(Xc), labels=model.classes_)
+        )
+
+    def test_class_prediction_unknown_labels(self):
+        """
+        Assert that labels the model never saw raise a value error
+        """
+        Xc, yc = make_classification(
+            n_samples=120, n_classes=3, n_informative=4, random_state=42
+        )
+        model = LogisticRegression().fit(Xc, yc)
+
+        for unknown in (3, -1):
+            yt = yc.copy()
+            yt[0] = unknown
+            visualizer = ClassPredictionError(model)
+            with self.assertRaises(YellowbrickValueError):
+                visualizer.score(Xc, yt)
@@ -17,9 +17,12 @@ Test the RadViz feature analysis visualizers
 ## Imports
 ##########################################################################
 
+import struct
 import unittest
+import threading
 import numpy as np
 import numpy.testing as npt
+import matplotlib.pyplot as plt
 
 from yellowbrick.features.radviz import *
 
@@ -62,3 +65,52 @@ class RadVizTests(unittest.TestCase):
         """
         visualizer = RadViz()
         visualizer.fit_transform(self.X, self.y)
+
+    def test_concurrent_threads(self):
+        """
+        Assert visualizers render in threads without touching pyplot
+        """
+        visualizers = [RadViz() for _ in range(4)]
+        threads = [
+            threading.Thread(target=viz.fit_transform_poof, args=(self.X, self.y))
+            for viz in visualizers
+        ]
+
+        figures = plt.get_fignums()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(plt.get_fignums(), figures)
+        self.assertEqual(len(set(id(viz.ax.figure) for viz in visualizers)), 4)
+        for viz in visualizers:
+            self.assertEqual(len(viz.ax.collections), 2)
+
+    def test_render(self):
+        """
+        Assert the figure is rendered to bytes and raw pixels in memory
+        """
+        visualizer = RadViz()
+        visualizer.fit_transform(self.X, self.y)
+        visualizer.poof()
+
+        self.assertTrue(visualizer.render().startswith(b'\x89PNG'))
+        self.assertIn(b'<svg', visualizer.render(format='svg'))
+
+        figure = visualizer.ax.figure
+        dpi = figure.dpi
+        pixels = visualizer.rgba(dpi=50)
+        width, height = struct.unpack('>II', visualizer.render(dpi=50)[16:24])
+        self.assertEqual(pixels.shape, (height, width, 4))
+        self.assertEqual(pixels.dtype, np.uint8)
+        self.assertFalse(pixels.flags.owndata)
+
+        # The dpi of the figure is restored for later renders
+        self.assertEqual(figure.dpi, dpi)
+        png = visualizer.render()
+        self.assertEqual(
+            struct.unpack('>II', png[16:24]),
+            figure.canvas.get_width_height()
+        )
+
@@ -0,0 +1,151 @@
+# tests.test_parallel
+# Tests for the zero-copy handoff of arrays to parallel workers.
+#
+# Copyright (C) 2016 District Data Labs
+# For license information, see LICENSE.txt
+
+"""
+Tests for the zero-copy handoff of arrays to parallel workers.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import pickle
+import tempfile
+import unittest
+import numpy as np
+import numpy.testing as npt
+
+from yellowbrick.parallel import *
+from yellowbrick.exceptions import YellowbrickValueError
+
+try:
+    from sklearn.externals.joblib import Parallel, delayed
+except ImportError:
+    from joblib import Parallel, delayed
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+
+def _column_sums(X):
+    return np.asarray(attach(X)).sum(axis=0)
+
+
+##########################################################################
+## Shared Array Tests
+##########################################################################
+
+class SharedArrayTests(unittest.TestCase):
+
+    def setUp(self):
+        self.X = np.arange(24.0).reshape(6, 4)
+
+    def test_backends(self):
+        """
+        Assert published arrays attach to equal read-only arrays
+        """
+        backends = [MEMMAP] + ([SHM] if DEFAULT_BACKEND == SHM else [])
+        for backend in backends:
+            for X in (self.X, np.asfortranarray(self.X)):
+                with shared(X, backend=backend) as (handle,):
+                    self.assertIsInstance(handle, SharedArray)
+                    attached = pickle.loads(pickle.dumps(handle)).attach()
+                    npt.assert_array_equal(attached, X)
+                    self.assertFalse(attached.flags.writeable)
+                    del attached
+
+    def test_worker_processes(self):
+        """
+        Assert worker processes attach to the published arrays
+        """
+        with shared(self.X) as (handle,):
+            sums = Parallel(n_jobs=2)(delayed(_column_sums)(handle) for _ in range(4))
+        for result in sums:
+            npt.assert_array_equal(result, self.X.sum(axis=0))
+
+    @unittest.skipIf(DEFAULT_BACKEND != SHM, "shared memory is required")
+    def test_worker_not_tracked(self):
+        """
+        Assert blocks attached outside the publisher are not tracked
+        """
+        from multiprocessing import resource_tracker
+
+        with shared(self.X, backend=SHM) as (handle,):
+            handle = pickle.loads(pickle.dumps(handle))
+            handle.owner = -1
+            with mock.patch.object(resource_tracker, 'register') as register, \
+                    mock.patch.object(resource_tracker, 'unregister') as unregister:
+                attached = handle.attach()
+                npt.assert_array_equal(attached, self.X)
+                del attached
+            register.assert_not_called()
+            unregister.assert_not_called()
+
+    def test_cleanup_on_error(self):
+        """
+        Assert temporary files are removed even if the body raises
+        """
+        with self.assertRaises(ValueError):
+            with shared(self.X, backend=MEMMAP) as (handle,):
+                path = handle.name
+                self.assertTrue(os.path.exists(path))
+                raise ValueError("task failed")
+        self.assertFalse(os.path.exists(path))
+
+    def test_memmap_by_reference(self):
+        """
+        Assert file backed memory maps are shared without copying
+        """
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            X = np.memmap(path, dtype=float, mode='w+', shape=self.X.shape)
+            X[:] = self.X
+            X.flush()
+            with shared(X) as (handle,):
+                self.assertEqual(handle.backend, FILE)
+                self.assertEqual(handle.name, path)
+                npt.assert_array_equal(handle.attach(), self.X)
+            self.assertTrue(os.path.exists(path))
+        finally:
+            del X
+            os.remove(path)
+
+    def test_unshareable(self):
+        """
+        Assert lists, object arrays and disabled sharing pass through
+        """
+        data = [[1, 2], [3, 4]]
+        objs = np.array(['a', None], dtype=object)
+        with shared(data, objs) as (a, b):
+            self.assertIs(a, data)
+            self.assertIs(b, objs)
+        with shared(self.X, enabled=False) as (X,):
+            self.assertIs(X, self.X)
+        self.assertIs(attach(self.X), self.X)
+
+    @unittest.skipIf(pd is None, "pandas is required")
+    def test_dataframe(self):
+        """
+        Assert homogeneous DataFrames are rebuilt with their columns
+        """
+        df = pd.DataFrame(self.X, columns=list('abcd'))
+        with shared(df, backend=MEMMAP) as (handle,):
+            attached = handle.attach()
+            self.assertEqual(list(attached.columns), list('abcd'))
+            npt.assert_array_equal(attached.values, self.X)
+
+    def test_bad_backend(self):
+        with self.assertRaises(YellowbrickValueError):
+            publish(self.X, backend='pickle')
@@ -18,11 +18,14 @@ Ensure that the regressor visualizations work.
 
 import unittest
 import numpy as np
+import matplotlib.pyplot as plt
 
 from tests.base import VisualTestCase
 from yellowbrick.regressor import *
 
 from sklearn.svm import SVR
+from sklearn.linear_model import LinearRegression, Ridge, Lasso
+from sklearn.ensemble import RandomForestRegressor
 from sklearn import cross_validation as cv
 from sklearn.cross_validation import train_test_split as tts
 
@@ -63,6 +66,100 @@ class PredictionErrorTests(VisualTestCase):
         visualizer = PredictionError(model)
         visualizer.score(X, y)
 
+    def test_pred_error_density(self):
+        """
+        Assert the density modes aggregate the points into a single artist
+        """
+        rng = np.random.RandomState(42)
+        yt = rng.normal(size=5000)
+        yp = yt + rng.normal(scale=0.2, size=5000)
+
+        _, ax = plt.subplots()
+        visualizer = PredictionError(SVR(), mode='hist2d')
+        visualizer.ax = ax
+        visualizer.draw(yt, yp)
+        self.assertEqual(len(ax.images), 1)
+        self.assertEqual(len(ax.collections), 0)
+        self.assertEqual(len(ax.lines), 2)
+
+        _, ax = plt.subplots()
+        visualizer = PredictionError(SVR(), mode='hexbin', cell_size=10)
+        visualizer.ax = ax
+        visualizer.draw(yt, yp)
+        self.assertEqual(len(ax.collections), 1)
+        self.assertEqual(len(ax.lines), 2)
+
+    def test_pred_error_cv(self):
+        """
+        Assert cross-validated prediction error colors points by fold
+        """
+        _, ax = plt.subplots()
+        visualizer = PredictionError(LinearRegression(), cv=3, n_jobs=2)
+        visualizer.ax = ax
+        visualizer.score(X, y)
+        visualizer.poof()
+
+        self.assertEqual(sorted(set(visualizer.folds_)), [0, 1, 2])
+        self.assertEqual(len(ax.collections), 3)
+
+    def test_pred_error_updates(self):
+        """
+        Assert repeated scores update the existing artists
+        """
+        rng = np.random.RandomState(42)
+        Xr = rng.rand(400, 3)
+        yr = Xr.sum(axis=1) + rng.normal(scale=0.1, size=400)
+        model = LinearRegression().fit(Xr, yr)
+
+        fig, ax = plt.subplots()
+        visualizer = PredictionError(model)
+        visualizer.ax = ax
+
+        # Later chunks are within the limits set by the first score
+        draws = []
+        fig.canvas.mpl_connect('draw_event', draws.append)
+        visualizer.score(Xr, yr)
+        for start in range(0, 400, 100):
+            visualizer.score(Xr[start:start+100], yr[start:start+100])
+
+        # Only the points and the hidden collection reused to blit are added
+        self.assertEqual(len(ax.collections), 2)
+        visible = [c for c in ax.collections if c.get_visible()]
+        self.assertEqual(visible, [visualizer._points])
+        self.assertEqual(len(ax.lines), 2)
+        self.assertEqual(len(visualizer._points.get_offsets()), 800)
+        self.assertEqual(visualizer._offsets.data.shape[0], 1024)
+
+        # Only the first update fully redraws, the rest are blitted
+        self.assertEqual(len(draws), 1)
+
+        # The best fit line is the least squares fit of all the points
+        slope, intercept = np.polyfit(yr, model.predict(Xr), 1)
+        xs, ys = ax.lines[1].get_data()
+        np.testing.assert_array_almost_equal(ys, intercept + slope * xs)
+
+    def test_pred_error_replaces(self):
+        """
+        Assert repeated density and cv scores replace the previous artists
+        """
+        for kwargs in ({'mode': 'hexbin'}, {'mode': 'hist2d'}, {'cv': 3}):
+            _, ax = plt.subplots()
+            visualizer = PredictionError(LinearRegression().fit(X, y), **kwargs)
+            visualizer.ax = ax
+            visualizer.score(X, y)
+            artists = len(ax.collections) + len(ax.images)
+
+            visualizer.score(X, y)
+            self.assertEqual(len(ax.lines), 2)
+            self.assertEqual(len(ax.collections) + len(ax.images), artists)
+
+    def test_pred_error_bad_mode(self):
+        """
+        Assert that an unknown drawing mode raises a value error
+        """
+        with self.assertRaises(YellowbrickValueError):
+            PredictionError(SVR(), mode='contour')
+
 ##########################################################################
 ## Residuals Plots test case
 ##########################################################################
@@ -78,3 +175,297 @@ class ResidualsPlotTests(VisualTestCase):
         model.fit(X_train, y_train)
         visualizer = ResidualsPlot(model)
         visualizer.score(X_test, y_test)
+
+    def test_resid_plots_cv(self):
+        """
+        Assert cross-validated residuals are drawn per fold
+        """
+        _, ax = plt.subplots()
+        visualizer = ResidualsPlot(LinearRegression(), cv=4)
+        visualizer.ax = ax
+        visualizer.score(X, y)
+
+        self.assertEqual(len(visualizer.folds_), len(y))
+        self.assertEqual(len(ax.collections), 4)
+        self.assertEqual(visualizer.stats_['test'].count, len(y))
+
+    def test_resid_plots_updates(self):
+        """
+        Assert repeated scores extend the scatter collection of a split
+        """
+        model = LinearRegression().fit(X, y)
+        _, ax = plt.subplots()
+        visualizer = ResidualsPlot(model)
+        visualizer.ax = ax
+        for _ in range(3):
+            visualizer.score(X, y)
+
+        self.assertEqual(len(ax.collections), 1)
+        self.assertEqual(len(ax.collections[0].get_offsets()), 3 * len(y))
+
+    def test_train_residuals_strategies(self):
+        """
+        Assert the training residuals strategy is resolved and recorded
+        """
+        rng = np.random.RandomState(42)
+        Xr = rng.rand(120, 3)
+        yr = Xr.sum(axis=1) + rng.normal(scale=0.1, size=120)
+
+        cases = (
+            ('predict', {}, 'predict', 120),
+            ('skip', {}, 'skip', 0),
+            ('sample', {'train_sample_size': 50}, 'sample', 50),
+            ('sample', {'train_sample_size': 500}, 'predict', 120),
+            ('auto', {'train_sample_size': 50}, 'sample', 50),
+        )
+
+        for strategy, kwargs, expected, npoints in cases:
+            _, ax = plt.subplots()
+            visualizer = ResidualsPlot(
+                LinearRegression(), train_residuals=strategy, **kwargs
+            )
+            visualizer.ax = ax
+            self.assertIs(visualizer.fit(Xr, yr), visualizer)
+            self.assertEqual(visualizer.train_residuals_, expected)
+            self.assertEqual(
+                sum(len(c.get_offsets()) for c in ax.collections), npoints
+            )
+
+    def test_train_residuals_sample_list(self):
+        """
+        Assert training residuals can be sampled from list inputs
+        """
+        rng = np.random.RandomState(42)
+        Xr = rng.rand(120, 3)
+        yr = Xr.sum(axis=1)
+
+        _, ax = plt.subplots()
+        visualizer = ResidualsPlot(
+            LinearRegression(), train_residuals='auto', train_sample_size=50
+        )
+        visualizer.ax = ax
+        visualizer.fit(Xr.tolist(), yr.tolist())
+        self.assertEqual(visualizer.train_residuals_, 'sample')
+        self.assertEqual(len(ax.collections[0].get_offsets()), 50)
+
+    def test_sample_rows(self):
+        """
+        Assert sampled training rows are distinct, sorted and reproducible
+        """
+        from yellowbrick.regressor import _sample_rows
+
+        for nrows, size in ((10**8, 1000), (100, 80)):
+            idx = _sample_rows(nrows, size, random_state=42)
+            self.assertEqual(len(np.unique(idx)), size)
+            self.assertTrue((np.diff(idx) > 0).all())
+            self.assertLess(idx.max(), nrows)
+            np.testing.assert_array_equal(idx, _sample_rows(nrows, size, 42))
+
+    def test_train_residuals_oob(self):
+        """
+        Assert out-of-bag predictions are reused for the training residuals
+        """
+        rng = np.random.RandomState(42)
+        Xr = rng.rand(60, 3)
+        yr = Xr.sum(axis=1)
+
+        model = RandomForestRegressor(n_estimators=10, oob_score=True, random_state=0)
+        visualizer = ResidualsPlot(model, train_residuals='auto')
+        visualizer.predict = lambda X: self.fail("training set was predicted")
+        visualizer.fit(Xr, yr)
+        self.assertEqual(visualizer.train_residuals_, 'oob')
+
+        with self.assertRaises(YellowbrickValueError):
+            ResidualsPlot(LinearRegression(), train_residuals='oob').fit(Xr, yr)
+
+    def test_partial_score(self):
+        """
+        Assert streamed residuals keep fixed samples and exact statistics
+        """
+        rng = np.random.RandomState(42)
+        Xr = rng.rand(2000, 3)
+        yr = Xr.sum(axis=1) + rng.normal(scale=0.1, size=2000)
+        model = LinearRegression().fit(Xr, yr)
+        residuals = model.predict(Xr) - yr
+
+        visualizer = ResidualsPlot(model, reservoir_size=100)
+        for start in range(0, 2000, 300):
+            visualizer.partial_score(Xr[start:start+300], yr[start:start+300])
+        visualizer.draw_stream()
+        visualizer.poof()
+
+        stats = visualizer.stats_['test']
+        self.assertEqual(stats.count, 2000)
+        self.assertAlmostEqual(stats.mean, residuals.mean())
+        self.assertAlmostEqual(stats.variance, residuals.var())
+        self.assertEqual(visualizer.samples_['test'].sample.shape, (100, 2))
+        self.assertEqual(visualizer.samples_['train'].sample.shape, (0, 2))
+        self.assertEqual(visualizer.histogram_.counts.sum(), 2000)
+
+    def test_distribution_panel(self):
+        """
+        Assert the histogram and Q-Q panels are drawn beside the residuals
+        """
+        rng = np.random.RandomState(42)
+        Xr = rng.rand(500, 3)
+        yr = Xr.sum(axis=1) + rng.normal(scale=0.1, size=500)
+        model = LinearRegression()
+
+        _, ax = plt.subplots()
+        visualizer = ResidualsPlot(model, hist=True, qqplot=True)
+        visualizer.ax = ax
+        visualizer.fit(Xr[:400], yr[:400])
+        visualizer.score(Xr[400:], yr[400:])
+        visualizer.poof()
+
+        self.assertEqual(len(visualizer.qqax.collections), 2)
+        self.assertGreater(len(visualizer.hax.patches), 0)
+
+        # Drawing again reuses the panels rather than appending new ones
+        naxes, npatches = len(ax.figure.axes), len(visualizer.hax.patches)
+        visualizer.poof()
+        self.assertEqual(len(ax.figure.axes), naxes)
+        self.assertEqual(len(visualizer.hax.patches), npatches)
+        self.assertEqual(len(visualizer.qqax.collections), 2)
+
+        # Exact quantiles come from the kept residuals of each split
+        residuals = model.predict(Xr[400:]) - yr[400:]
+        self.assertAlmostEqual(visualizer.quantiles(0.5), np.sort(residuals)[50])
+
+        # Streamed residuals fall back to the histogram quantiles
+        visualizer.partial_score(Xr[400:], yr[400:])
+        self.assertAlmostEqual(
+            visualizer.quantiles(0.5), np.median(residuals),
+            delta=2 * visualizer.histogram_.width
+        )
+        self.assertEqual(visualizer.residuals_['test'], [])
+
+    def test_exact_quantiles_limit(self):
+        """
+        Assert residuals are released once too many have been scored
+        """
+        rng = np.random.RandomState(42)
+        Xr = rng.rand(300, 3)
+        yr = Xr.sum(axis=1) + rng.normal(scale=0.1, size=300)
+        model = LinearRegression().fit(Xr, yr)
+
+        visualizer = ResidualsPlot(model, max_exact_quantiles=500)
+        visualizer.score(Xr, yr)
+        self.assertEqual(len(visualizer.residuals_['test']), 1)
+
+        for _ in range(3):
+            visualizer.score(Xr, yr)
+            self.assertEqual(visualizer.residuals_['test'], [])
+
+        residuals = model.predict(Xr) - yr
+        self.assertAlmostEqual(
+            visualizer.quantiles(0.5), np.median(residuals),
+            delta=2 * visualizer.histogram_.width
+        )
+
+
+##########################################################################
+## Cook's Distance test case
+##########################################################################
+
+class CooksDistanceTests(VisualTestCase):
+
+    def test_cooks_distance(self):
+        """
+        Assert the leverages and distances match the explicit hat matrix
+        """
+        rng = np.random.RandomState(42)
+        Xr = rng.rand(50, 3)
+        yr = np.dot(Xr, [1.0, -2.0, 3.0]) + rng.normal(scale=0.1, size=50)
+        yr[7] += 5
+
+        X1 = np.column_stack((np.ones(50), Xr))
+        hat = np.dot(np.dot(X1, np.linalg.inv(np.dot(X1.T, X1))), X1.T)
+        resid = yr - np.dot(hat, yr)
+        mse = np.dot(resid, resid) / (50 - 4)
+        h = np.diag(hat)
+        expected = resid ** 2 / (4 * mse) * h / (1 - h) ** 2
+
+        for method in ('qr', 'gram'):
+            _, ax = plt.subplots()
+            visualizer = CooksDistance(method=method, top_k=10)
+            visualizer.ax = ax
+            visualizer.fit(Xr, yr)
+            visualizer.poof()
+
+            np.testing.assert_array_almost_equal(visualizer.leverage_, h)
+            np.testing.assert_array_almost_equal(visualizer.distance_, expected)
+            self.assertEqual(np.argmax(visualizer.distance_), 7)
+            self.assertEqual(len(ax.lines[0].get_xdata()), 10)
+
+    def test_bad_method(self):
+        """
+        Assert that an unknown leverage method raises a value error
+        """
+        with self.assertRaises(YellowbrickValueError):
+            CooksDistance(method='hat')
+
+
+##########################################################################
+## Alpha Selection test case
+##########################################################################
+
+class AlphaSelectionTests(VisualTestCase):
+
+    def setUp(self):
+        super(AlphaSelectionTests, self).setUp()
+        rng = np.random.RandomState(42)
+        self.Xr = rng.rand(40, 5)
+        self.yr = np.dot(self.Xr, rng.normal(size=5)) + rng.normal(size=40)
+
+    def test_ridge_loo(self):
+        """
+        Assert the SVD leave-one-out errors match explicit refits
+        """
+        alphas = np.array([0.01, 1.0, 10.0])
+
+        for fit_intercept in (True, False):
+            visualizer = AlphaSelection(Ridge(fit_intercept=fit_intercept), alphas=alphas)
+            visualizer.fit(self.Xr, self.yr)
+
+            for alpha, error in zip(alphas, visualizer.errors_):
+                squares = []
+                for idx in range(40):
+                    mask = np.arange(40) != idx
+                    model = Ridge(alpha=alpha, fit_intercept=fit_intercept)
+                    model.fit(self.Xr[mask], self.yr[mask])
+                    squares.append((model.predict(self.Xr[idx:idx+1])[0] - self.yr[idx]) ** 2)
+                self.assertAlmostEqual(error, np.mean(squares))
+
+            self.assertEqual(visualizer.estimator.alpha, visualizer.alpha_)
+
+    def test_lasso_path(self):
+        """
+        Assert no errors occur during Lasso alpha selection
+        """
+        visualizer = AlphaSelection(Lasso(), cv=3)
+        visualizer.fit(self.Xr, self.yr)
+        visualizer.poof()
+        self.assertEqual(visualizer.alphas_.shape, visualizer.errors_.shape)
+        self.assertIn(visualizer.alpha_, visualizer.alphas_)
+
+    def test_bad_estimator(self):
+        """
+        Assert that an unregularized estimator raises a type error
+        """
+        with self.assertRaises(YellowbrickTypeError):
+            AlphaSelection(LinearRegression())
+
+    def test_fit_score(self):
+        """
+        Assert score marks the test error of the selected alpha after fit
+        """
+        for model in (Ridge(), Lasso()):
+            visualizer = AlphaSelection(model, cv=3)
+            visualizer.fit(self.Xr[:30], self.yr[:30])
+            visualizer.score(self.Xr[30:], self.yr[30:])
+            visualizer.poof()
+
+            residuals = visualizer.estimator.predict(self.Xr[30:]) - self.yr[30:]
+            self.assertAlmostEqual(visualizer.test_error_, np.mean(residuals ** 2))
+            self.assertEqual(len(visualizer.ax.collections), 1)
@@ -0,0 +1,190 @@
+# tests.test_stream
+# Tests for the fixed memory stream summaries.
+#
+# Copyright (C) 2016 District Data Labs
+# For license information, see LICENSE.txt
+
+"""
+Tests for the fixed memory stream summaries.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import unittest
+import numpy as np
+import numpy.testing as npt
+
+from yellowbrick.stream import *
+from yellowbrick.exceptions import YellowbrickValueError
+
+
+##########################################################################
+## Running Statistics Tests
+##########################################################################
+
+class RunningStatsTests(unittest.TestCase):
+
+    def test_running_stats(self):
+        """
+        Assert chunked statistics match the statistics of the whole stream
+        """
+        values = np.random.RandomState(42).normal(1e6, 3.0, size=1000)
+        stats = RunningStats()
+        for chunk in np.array_split(values, 7):
+            stats.update(chunk)
+        stats.update([])
+
+        self.assertEqual(stats.count, 1000)
+        self.assertAlmostEqual(stats.mean, values.mean())
+        self.assertAlmostEqual(stats.variance, values.var())
+
+    def test_empty_stats(self):
+        """
+        Assert the variance of an empty stream is undefined
+        """
+        self.assertTrue(np.isnan(RunningStats().variance))
+
+
+class RunningRegressionTests(unittest.TestCase):
+
+    def test_running_regression(self):
+        """
+        Assert the chunked fit matches the least squares fit of the stream
+        """
+        rng = np.random.RandomState(42)
+        x = rng.normal(100, 5, size=500)
+        y = 3 * x - 7 + rng.normal(size=500)
+
+        fit = RunningRegression()
+        for idx in range(0, 500, 120):
+            fit.update(x[idx:idx+120], y[idx:idx+120])
+
+        slope, intercept = np.polyfit(x, y, 1)
+        self.assertEqual(fit.count, 500)
+        self.assertAlmostEqual(fit.slope, slope)
+        self.assertAlmostEqual(fit.intercept, intercept)
+        npt.assert_array_almost_equal(fit.predict([0, 1]), [intercept, intercept + slope])
+
+
+##########################################################################
+## Reservoir Tests
+##########################################################################
+
+class ReservoirTests(unittest.TestCase):
+
+    def test_reservoir_fill(self):
+        """
+        Assert the reservoir holds every row until it is full
+        """
+        reservoir = Reservoir(10, 2, random_state=42)
+        reservoir.update(np.arange(8).reshape(4, 2))
+        npt.assert_array_equal(reservoir.sample, np.arange(8).reshape(4, 2))
+
+    def test_reservoir_bounded(self):
+        """
+        Assert the reservoir never exceeds its size and holds only seen rows
+        """
+        reservoir = Reservoir(50, random_state=42)
+        for start in range(0, 10000, 1000):
+            reservoir.update(np.arange(start, start + 1000))
+
+        self.assertEqual(reservoir.seen, 10000)
+        self.assertEqual(reservoir.sample.shape, (50, 1))
+        self.assertEqual(len(np.unique(reservoir.sample)), 50)
+
+    def test_reservoir_uniform(self):
+        """
+        Assert that early and late rows are sampled at similar rates
+        """
+        early = 0
+        for seed in range(200):
+            reservoir = Reservoir(10, random_state=seed)
+            for start in range(0, 100, 25):
+                reservoir.update(np.arange(start, start + 25))
+            early += (reservoir.sample < 50).sum()
+
+        self.assertAlmostEqual(early / 2000.0, 0.5, delta=0.05)
+
+    def test_bad_size(self):
+        """
+        Assert that an empty reservoir raises a value error
+        """
+        with self.assertRaises(YellowbrickValueError):
+            Reservoir(0)
+
+
+##########################################################################
+## Growable Array Tests
+##########################################################################
+
+class GrowableArrayTests(unittest.TestCase):
+
+    def test_growable_append(self):
+        """
+        Assert appended rows are kept in order as the capacity doubles
+        """
+        rows = np.arange(200, dtype=float).reshape(100, 2)
+        array = GrowableArray(2, capacity=4)
+        for start in range(0, 100, 7):
+            array.append(rows[start:start+7])
+
+        npt.assert_array_equal(array.values, rows)
+        self.assertEqual(array.data.shape[0], 128)
+
+    def test_growable_view(self):
+        """
+        Assert the values are a view of the buffer rather than a copy
+        """
+        array = GrowableArray(2).append(np.ones((10, 2)))
+        self.assertIs(array.values.base, array.data)
+
+
+##########################################################################
+## Streaming Histogram Tests
+##########################################################################
+
+class StreamingHistogramTests(unittest.TestCase):
+
+    def test_histogram_exact(self):
+        """
+        Assert streamed counts match a histogram of the whole stream
+        """
+        rng = np.random.RandomState(42)
+        values = np.concatenate([rng.normal(0, 1, 500), rng.normal(0, 50, 500)])
+
+        hist = StreamingHistogram(nrows=2, max_bins=64)
+        for chunk in np.array_split(values, 10):
+            hist.update(chunk, row=1)
+
+        self.assertLessEqual(hist.counts.shape[1], 64)
+        self.assertEqual(hist.counts[0].sum(), 0)
+
+        expected, _ = np.histogram(values, bins=hist.edges)
+        npt.assert_array_equal(hist.counts[1], expected)
+
+    def test_histogram_constant(self):
+        """
+        Assert a constant stream is counted in a single bin
+        """
+        hist = StreamingHistogram()
+        hist.update(np.zeros(10))
+        hist.update([np.nan, np.inf])
+        self.assertEqual(hist.counts.sum(), 10)
+        self.assertEqual((hist.counts > 0).sum(), 1)
+
+    def test_histogram_quantiles(self):
+        """
+        Assert histogram quantiles are within a bin of the exact quantiles
+        """
+        values = np.random.RandomState(42).normal(0, 2, 10000)
+        hist = StreamingHistogram(max_bins=256)
+        for chunk in np.array_split(values, 4):
+            hist.update(chunk)
+
+        q = np.array([0.01, 0.25, 0.5, 0.75, 0.99])
+        npt.assert_allclose(
+            hist.quantiles(q), np.percentile(values, q * 100), atol=hist.width
+        )
+        self.assertTrue(np.isnan(StreamingHistogram().quantiles(0.5)))
@@ -24,7 +24,7 @@ from sklearn.neighbors import LSHForest
 from sklearn.pipeline import Pipeline
 import unittest
 
-from yellowbrick.utils import get_model_name, isestimator
+from yellowbrick.utils import get_model_name, isestimator, isfitted
 
 
 class ModelNameTests(unittest.TestCase):
@@ -93,5 +93,22 @@ class ModelNameTests(unittest.TestCase):
         self.assertFalse(isestimator(things))
 
 
+class FittedTests(unittest.TestCase):
+
+    def test_is_fitted(self):
+        """
+        Test fitted estimators and pipelines are detected
+        """
+        model = LinearRegression()
+        self.assertFalse(isfitted(model))
+        model.fit([[1], [2], [3]], [1, 2, 3])
+        self.assertTrue(isfitted(model))
+
+        pipeline = Pipeline([('reduce_dim', PCA()), ('linreg', LinearRegression())])
+        self.assertFalse(isfitted(pipeline))
+        pipeline.fit([[1, 2], [2, 1], [3, 5]], [1, 2, 3])
+        self.assertTrue(isfitted(pipeline))
+
+
 if __name__ == "__main__":
     unittest.main()
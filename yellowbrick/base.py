@@ -14,12 +14,167 @@
 Abstract base classes and interface for Yellowbrick.
 """
 
-import matplotlib.pyplot as plt
+import time
+import warnings
+import numpy as np
 
-from sklearn.base import BaseEstimator
-from .exceptions import YellowbrickTypeError
-from .utils import get_model_name, isestimator
-from sklearn.cross_validation import cross_val_predict as cvp
+from io import BytesIO
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from sklearn.base import BaseEstimator, clone
+from sklearn.utils.validation import _num_samples
+from .cache import PredictionCache
+from .parallel import attach, shared
+from .exceptions import YellowbrickTypeError, YellowbrickValueError
+from .exceptions import YellowbrickWarning
+from .utils import get_model_name, isestimator, isclassifier, isdataframe, isfitted
+
+try:
+    from sklearn.externals.joblib import Parallel, delayed
+except ImportError:
+    from joblib import Parallel, delayed
+
+try:
+    from sklearn.model_selection import check_cv
+
+    def _split(cv, X, y, classifier=False):
+        return list(check_cv(cv, y, classifier=classifier).split(X, y))
+
+except ImportError:
+    from sklearn.cross_validation import check_cv
+
+    def _split(cv, X, y, classifier=False):
+        return list(check_cv(cv, X, y, classifier=classifier))
+
+
+##########################################################################
+## Cross Validation
+##########################################################################
+
+def _rows(X, index):
+    """
+    Selects rows of an array or DataFrame by position.
+    """
+    if isdataframe(X):
+        return X.iloc[index]
+    return X[index]
+
+
+def _fit_predict_fold(estimator, X, y, train, test):
+    """
+    Fits the estimator on the training rows of a fold and returns the test
+    rows along with their predictions and the time taken to fit.
+    """
+    X, y = attach(X), attach(y)
+    start = time.time()
+    estimator.fit(_rows(X, train), _rows(y, train))
+    elapsed = time.time() - start
+    return test, estimator.predict(_rows(X, test)), elapsed
+
+
+def _parallel(n_jobs, tasks):
+    """
+    Runs delayed tasks with joblib and returns their results in order. Where
+    joblib supports it (1.3 or later), the results are returned as a
+    generator that yields each one once it is ready, so that the caller can
+    consume it and release it before the next; otherwise they are returned
+    as a list once all of them are ready.
+    """
+    try:
+        return Parallel(n_jobs=n_jobs, return_as='generator')(tasks)
+    except TypeError:
+        return Parallel(n_jobs=n_jobs)(tasks)
+
+
+def _assemble_folds(nrows, results):
+    """
+    Writes the (test, predictions) pairs of each fold into a single
+    preallocated output array as they are iterated over, returning it with
+    the fold of every row.
+    """
+    folds = np.full(nrows, -1, dtype=int)
+    y_pred = None
+    for fold, (test, preds) in enumerate(results):
+        preds = np.asarray(preds)
+        if y_pred is None:
+            y_pred = np.empty((nrows,) + preds.shape[1:], dtype=preds.dtype)
+        y_pred[test] = preds
+        folds[test] = fold
+
+    return y_pred, folds
+
+
+def cross_val_predictions(estimator, X, y, cv=12, n_jobs=1):
+    """
+    Generates out-of-fold predictions for every instance in X, fitting a
+    clone of the estimator on each fold in parallel with ``n_jobs``. The
+    predictions of each fold are written into a single preallocated output
+    array as joblib returns them, in fold order, and are then released, so
+    the fold results are not all held in memory alongside the output (with
+    joblib 1.3 or later, see ``_parallel``). When run in parallel, X and y
+    are published once to shared memory (see ``yellowbrick.parallel``)
+    rather than being pickled to every worker.
+
+    Parameters
+    ----------
+    estimator : a Scikit-Learn estimator
+        The (unfitted) model to cross-validate; it is cloned per fold.
+
+    X, y : array-like
+        The instances and targets to cross-validate on.
+
+    cv : int, cross-validation generator or iterable
+        Determines the cross-validation splitting strategy.
+
+    n_jobs : int
+        The number of folds to fit in parallel.
+
+    Returns
+    -------
+    y_pred : ndarray
+        The out-of-fold prediction of every instance.
+
+    folds : ndarray of int
+        The index of the fold each instance was predicted in.
+    """
+    y = np.asarray(y)
+    splits = _split(cv, X, y, classifier=isclassifier(estimator))
+
+    with shared(X, y, enabled=n_jobs != 1) as (Xs, ys):
+        results = _parallel(n_jobs, (
+            delayed(_fit_predict_fold)(clone(estimator), Xs, ys, train, test)
+            for train, test in splits
+        ))
+
+        return _assemble_folds(y.shape[0], (
+            (test, preds) for test, preds, _ in results
+        ))
+
+
+##########################################################################
+## Figures
+##########################################################################
+
+def new_figure(**kwargs):
+    """
+    Creates a figure without using pyplot. The figure is attached to its own
+    Agg canvas rather than being registered with pyplot's global figure
+    manager, so visualizers drawing on separate figures can render
+    concurrently in different threads. Keyword arguments are passed to
+    ``Figure``, e.g. figsize and dpi.
+    """
+    figure = Figure(**kwargs)
+    FigureCanvasAgg(figure)
+    return figure
+
+
+def new_axes(**kwargs):
+    """
+    Creates a pyplot-free figure with a single subplot and returns its axes.
+    Keyword arguments are passed to ``Figure.add_subplot``, e.g. xlim.
+    """
+    return new_figure().add_subplot(111, **kwargs)
 
 
 ##########################################################################
@@ -35,9 +190,14 @@ class Visualizer(BaseEstimator):
 
     The base class for feature visualization and model visualization
     primarily ensures that styling arguments are passed in.
+
+    Visualizers draw only through their ``ax`` (the ``ax`` keyword argument)
+    and never through pyplot's global state. If no axes are given, they are
+    created on a new figure with an Agg canvas (see ``new_axes``).
     """
 
     def __init__(self, **kwargs):
+        self.ax    = kwargs.pop('ax', None)
         self.size  = kwargs.pop('size', None)
         self.color = kwargs.pop('color', None)
 
@@ -61,6 +221,90 @@ class Visualizer(BaseEstimator):
             "All visualizations must specify their own poof methodology"
         )
 
+    def show(self, outpath=None, **kwargs):
+        """
+        Saves the figure to outpath, or if it is None, calls ``plt.show()``
+        as before when the figure is managed by pyplot (e.g. the visualizer
+        was given axes created with pyplot). Figures created by the visualizer
+        are not registered with pyplot and cannot be shown in a window, so a
+        warning is issued instead; they can still be saved, rendered (see
+        ``render``) or displayed inline in a notebook from the returned
+        figure.
+
+        Returns
+        -------
+        figure : matplotlib Figure or None
+            The figure of the visualizer, or None if nothing was drawn.
+        """
+        if self.ax is None: return
+
+        figure = self.ax.figure
+        if outpath is not None:
+            figure.savefig(outpath, **kwargs)
+        elif getattr(figure.canvas, 'manager', None) is not None:
+            # Only pyplot managed figures get here, so importing it is safe
+            import matplotlib.pyplot as plt
+            plt.show()
+        else:
+            warnings.warn(
+                "the figure is not managed by pyplot so it cannot be shown in "
+                "a window; pass an outpath, pass axes created with pyplot "
+                "(ax=plt.gca()) or display the returned figure",
+                YellowbrickWarning
+            )
+
+        return figure
+
+    def render(self, format='png', dpi=None, **kwargs):
+        """
+        Returns the figure encoded in the given format (e.g. png, svg or pdf)
+        as bytes, written to an in-memory buffer rather than to disk; e.g. to
+        serve the image over HTTP. Call it after poof so that the titles and
+        legends are included. Keyword arguments are passed to savefig.
+        """
+        if self.ax is None:
+            raise YellowbrickValueError(
+                "nothing has been drawn yet, fit the visualizer before rendering"
+            )
+
+        buffer = BytesIO()
+        self.ax.figure.savefig(buffer, format=format, dpi=dpi, **kwargs)
+        return buffer.getvalue()
+
+    def rgba(self, dpi=None):
+        """
+        Draws the figure with Agg and returns its pixels as an array of shape
+        (height, width, 4) of uint8 RGBA values. The array is a view of the
+        renderer's buffer, not a copy, so it is only valid until the figure
+        is drawn again; copy it to keep it. If a dpi is given the figure is
+        drawn at that resolution and its own dpi is then restored.
+        """
+        if self.ax is None:
+            raise YellowbrickValueError(
+                "nothing has been drawn yet, fit the visualizer before rendering"
+            )
+
+        figure = self.ax.figure
+        canvas = figure.canvas
+        if not isinstance(canvas, FigureCanvasAgg):
+            raise YellowbrickTypeError(
+                "raw pixels require an Agg based canvas, not {}".format(
+                    canvas.__class__.__name__
+                )
+            )
+
+        original = figure.dpi
+        if dpi is not None:
+            figure.set_dpi(dpi)
+
+        try:
+            canvas.draw()
+            renderer = canvas.get_renderer()
+            pixels = np.frombuffer(canvas.buffer_rgba(), dtype=np.uint8)
+            return pixels.reshape(int(renderer.height), int(renderer.width), 4)
+        finally:
+            figure.set_dpi(original)
+
     def fit_draw(self, X, y=None, **kwargs):
         """
         Fits a transformer to X and y then returns
@@ -83,18 +327,93 @@ class ScoreVisualizer(Visualizer):
     Base class to follow an estimator in a visual pipeline.
 
     Draws the score for the fitted model.
+
+    Keyword arguments ``batch_size`` and ``n_jobs`` control how predictions
+    are made during scoring. If ``batch_size`` is set, X is passed to the
+    estimator in chunks of at most that many rows so that the peak memory of
+    estimators that create large intermediate arrays (e.g. kernel SVMs or
+    nearest neighbors) is bounded by the batch size, not the test set size.
+    If ``n_jobs`` is greater than one, the chunks are predicted in a thread
+    pool, which is beneficial for estimators that release the GIL.
+
+    The ``prefit`` keyword argument allows already trained models to be
+    visualized without retraining them: if True, fit does not call the fit
+    method of the estimator, and if 'auto', it only does so when the
+    estimator does not appear to be fitted (see ``utils.is_fitted``). The
+    default, False, always fits the estimator.
     """
 
+    PREFIT_OPTIONS = (True, False, 'auto')
+
     def __init__(self, model, **kwargs):
-        self.estimator = model
+        self.estimator  = model
+        self.batch_size = kwargs.pop('batch_size', None)
+        self.n_jobs     = kwargs.pop('n_jobs', 1)
+        self.prefit     = kwargs.pop('prefit', False)
         super(ScoreVisualizer, self).__init__(**kwargs)
 
+        if self.prefit not in self.PREFIT_OPTIONS:
+            raise YellowbrickValueError(
+                "prefit must be True, False or 'auto' not {!r}".format(self.prefit)
+            )
+
+    def is_prefit(self):
+        """
+        Returns True if the estimator should be used as it is rather than
+        being fit by the visualizer.
+        """
+        if self.prefit == 'auto':
+            return isfitted(self.estimator)
+        return self.prefit
+
     def fit(self, X, y=None, **kwargs):
-        self.estimator.fit(X, y, **kwargs)
+        if not self.is_prefit():
+            self.estimator.fit(X, y, **kwargs)
         return self
 
     def predict(self, X):
-        return self.estimator.predict(X)
+        """
+        Predicts X with the wrapped estimator. If a batch size was specified
+        the predictions are made in row chunks and written into a single
+        preallocated output array.
+        """
+        if self.batch_size is None:
+            return self.estimator.predict(X)
+
+        nrows = _num_samples(X)
+        if nrows <= self.batch_size:
+            return self.estimator.predict(X)
+
+        if self.batch_size < 1:
+            raise YellowbrickValueError(
+                "batch_size must be a positive integer not {}".format(
+                    self.batch_size
+                )
+            )
+
+        def predict_into(out, start, stop):
+            out[start:stop] = self.estimator.predict(_rows(X, slice(start, stop)))
+
+        # Predict the first batch to discover the output shape and dtype.
+        bounds = [
+            (start, min(start + self.batch_size, nrows))
+            for start in range(0, nrows, self.batch_size)
+        ]
+        first  = np.asarray(self.estimator.predict(_rows(X, slice(*bounds[0]))))
+        y_pred = np.empty((nrows,) + first.shape[1:], dtype=first.dtype)
+        y_pred[:first.shape[0]] = first
+
+        # Predict the remaining batches, in a thread pool if requested.
+        if self.n_jobs == 1:
+            for start, stop in bounds[1:]:
+                predict_into(y_pred, start, stop)
+        else:
+            Parallel(n_jobs=self.n_jobs, backend="threading")(
+                delayed(predict_into)(y_pred, start, stop)
+                for start, stop in bounds[1:]
+            )
+
+        return y_pred
 
     def score(self, X, y=None):
         """
@@ -153,6 +472,17 @@ class ModelVisualizer(Visualizer):
 class MultiModelMixin(object):
     """
     Does predict for each of the models and generates subplots.
+
+    Keyword arguments ``cv`` and ``n_jobs`` control the cross-validation used
+    by ``predict``: the folds are generated once and shared by every model,
+    and all (model, fold) fits are scheduled together in a single joblib
+    pool of ``n_jobs`` workers. Fits are dispatched largest first, so that a
+    slow model is started early instead of becoming the tail of the pool.
+
+    The ``cache`` keyword argument, a directory or a ``PredictionCache``,
+    persists the out-of-fold predictions of each model on disk. Models whose
+    parameters, data and folds have not changed since they were last cached
+    are then not refit, so that re-rendering a comparison is near-instant.
     """
 
     def __init__(self, models, **kwargs):
@@ -164,18 +494,93 @@ class MultiModelMixin(object):
         # Keep track of the models
         self.models = models
         self.names  = kwargs.pop('names', list(map(get_model_name, models)))
+        self.cv     = kwargs.pop('cv', 12)
+        self.n_jobs = kwargs.pop('n_jobs', 1)
+        self.cache  = kwargs.pop('cache', None)
+        if self.cache is not None and not isinstance(self.cache, PredictionCache):
+            self.cache = PredictionCache(self.cache)
 
     def generate_subplots(self):
         """
         Generates the subplots for the number of given models.
         """
-        _, axes = plt.subplots(len(self.models), sharex=True, sharey=True)
-        return axes
+        figure = new_figure()
+        axes = [figure.add_subplot(len(self.models), 1, 1)]
+        for idx in range(2, len(self.models) + 1):
+            axes.append(figure.add_subplot(
+                len(self.models), 1, idx, sharex=axes[0], sharey=axes[0]
+            ))
+
+        if len(axes) == 1:
+            return axes[0]
+        return np.array(axes)
+
+    def _fit_costs(self, splits):
+        """
+        Estimates the relative cost of fitting each (model, fold) pair as the
+        size of the training split times the mean fit time of the model on
+        the previous call to predict (or one if it is not known yet).
+        """
+        times = getattr(self, 'fit_times_', None)
+        if times is None or times.shape[0] != len(self.models):
+            rates = np.ones(len(self.models))
+        else:
+            rates = times.mean(axis=1)
+
+        sizes = np.array([len(train) for train, _ in splits], dtype=float)
+        return np.outer(rates, sizes)
 
     def predict(self, X, y):
         """
-        Returns a generator containing the predictions for each of the
-        internal models (using cross_val_predict and a CV=12).
+        Returns a list containing the out-of-fold predictions for each of the
+        internal models, cross-validated on the same folds.
+
+        The time taken by each fit is stored in ``fit_times_``, an array of
+        shape (models, folds), and is used to order the fits of later calls;
+        the times of models loaded from the cache are zero.
         """
-        for model in self.models:
-            yield cvp(model, X, y, cv=12)
+        y = np.asarray(y)
+        classifier = all(isclassifier(model) for model in self.models)
+        splits = _split(self.cv, X, y, classifier=classifier)
+
+        # Load the predictions of any unchanged models from the cache.
+        predictions = [None] * len(self.models)
+        if self.cache is not None:
+            data_key = self.cache.data_key(X, y, splits)
+            keys = [self.cache.key(model, data_key) for model in self.models]
+            predictions = [self.cache.get(key) for key in keys]
+
+        # Schedule every remaining (model, fold) fit in one pool, most
+        # expensive first.
+        costs = self._fit_costs(splits)
+        tasks = sorted(
+            (task for task in np.ndindex(*costs.shape) if predictions[task[0]] is None),
+            key=lambda task: costs[task], reverse=True
+        )
+
+        # Write the predictions of each fit into the output of its model as
+        # the results are returned rather than holding all of them.
+        self.fit_times_ = np.zeros(costs.shape)
+        with shared(X, y, enabled=self.n_jobs != 1 and len(tasks) > 0) as (Xs, ys):
+            results = _parallel(self.n_jobs, (
+                delayed(_fit_predict_fold)(
+                    clone(self.models[idx]), Xs, ys, *splits[fold]
+                ) for idx, fold in tasks
+            ))
+
+            outputs = {}
+            for (idx, fold), (test, preds, elapsed) in zip(tasks, results):
+                preds = np.asarray(preds)
+                if idx not in outputs:
+                    outputs[idx] = np.empty(
+                        (y.shape[0],) + preds.shape[1:], dtype=preds.dtype
+                    )
+                outputs[idx][test] = preds
+                self.fit_times_[idx, fold] = elapsed
+
+        for idx, y_pred in outputs.items():
+            predictions[idx] = y_pred
+            if self.cache is not None:
+                self.cache.set(keys[idx], y_pred)
+
+        return predictions
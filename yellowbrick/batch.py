@@ -0,0 +1,237 @@
+# yellowbrick.batch
+# Renders many visualizations to disk across a pool of processes.
+#
+# Copyright (C) 2016 District Data Labs
+# For license information, see LICENSE.txt
+
+"""
+Renders many visualizations to disk across a pool of processes. Each job is
+a (visualizer spec, data reference, output path) triple; every worker warms
+up the Agg renderer and applies the style of the calling process once, then
+renders its share of the jobs on pyplot-free figures. Failures are reported
+per job instead of aborting the batch.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import copy
+import time
+import warnings
+import importlib
+import traceback
+import multiprocessing
+import numpy as np
+import matplotlib as mpl
+
+from six import string_types
+from functools import partial
+from collections import namedtuple
+
+from .base import Visualizer, ScoreVisualizer, new_figure
+from .parallel import attach
+from .cache import RenderCache, PROCESS_RC_PARAMS
+from .exceptions import YellowbrickTypeError, YellowbrickValueError
+from .exceptions import YellowbrickWarning
+
+
+##########################################################################
+## Jobs and Results
+##########################################################################
+
+# A visualization to render; see render_batch for the accepted specs and data.
+RenderJob = namedtuple('RenderJob', 'spec, data, outpath')
+
+# The outcome of a job: error is None on success or the formatted traceback.
+RenderResult = namedtuple('RenderResult', 'outpath, error, elapsed')
+
+
+##########################################################################
+## Batch Rendering
+##########################################################################
+
+def render_batch(jobs, n_jobs=-1, rc=None, chunksize=1, cache=None):
+    """
+    Renders each job to its output path, in a pool of ``n_jobs`` processes.
+
+    Parameters
+    ----------
+    jobs : iterable of RenderJob or (spec, data, outpath) tuples
+        The spec is a Visualizer instance (pickled to the worker) or a
+        ``(class, params)`` pair where class is a Visualizer class or its
+        dotted import path and params are its keyword arguments. The data is
+        a mapping with keys ``X``, ``y`` and optionally ``X_test`` and
+        ``y_test``, a tuple of (X, y) or (X, y, X_test, y_test), the path of
+        an ``.npz`` file with those arrays or a picklable callable returning
+        any of those. Arrays can be passed as ``parallel.SharedArray``
+        handles to avoid pickling them into every job.
+
+    n_jobs : int, default: -1
+        The number of worker processes, -1 for one per core. If 1 the jobs
+        are rendered in the calling process.
+
+    rc : dict or None
+        The rcParams every worker applies once at startup; defaults to the
+        current rcParams of the calling process so that the workers render
+        in the same style regardless of how the processes are started.
+
+    chunksize : int, default: 1
+        The number of jobs sent to a worker at a time.
+
+    cache : str, RenderCache or None
+        A render cache (or its directory) to look each job up in before
+        rendering it and to store the rendered images in.
+
+    Returns
+    -------
+    results : list of RenderResult
+        The output path, formatted traceback of any error (or None) and the
+        time taken by each job, in the order of the jobs.
+    """
+    jobs = [RenderJob(*job) for job in jobs]
+    if cache is not None and not isinstance(cache, RenderCache):
+        cache = RenderCache(cache)
+
+    if n_jobs == 1 or len(jobs) <= 1:
+        return [render_job(job, cache) for job in jobs]
+
+    if n_jobs is None or n_jobs < 0:
+        n_jobs = multiprocessing.cpu_count()
+
+    if rc is None:
+        rc = dict(mpl.rcParams)
+
+    pool = multiprocessing.Pool(
+        min(n_jobs, len(jobs)), initializer=_init_worker, initargs=(rc,)
+    )
+    try:
+        results = pool.map(partial(render_job, cache=cache), jobs, chunksize)
+        pool.close()
+    except:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+    return results
+
+
+def render_job(job, cache=None):
+    """
+    Renders a single job, returning a RenderResult rather than raising. If a
+    RenderCache is given and it holds the image of the job (same visualizer
+    options, style, data and format) the image is copied to the output path
+    without fitting or drawing; otherwise the rendered image is cached.
+    """
+    job = RenderJob(*job)
+    start = time.time()
+    try:
+        visualizer = _build_visualizer(job.spec)
+        data = _load_data(job.data)
+
+        if cache is None:
+            _draw(visualizer, data)
+            visualizer.show(job.outpath)
+        else:
+            fmt = cache.format(job.outpath)
+            key = cache.key(visualizer, data, format=fmt)
+            if cache.get(key, fmt, job.outpath) is None:
+                _draw(visualizer, data)
+                visualizer.show(job.outpath)
+                cache.set(key, fmt, job.outpath)
+    except Exception:
+        return RenderResult(job.outpath, traceback.format_exc(), time.time() - start)
+    return RenderResult(job.outpath, None, time.time() - start)
+
+
+def _init_worker(rc):
+    """
+    Applies the style of the parent process and warms up the Agg renderer
+    (font cache and text layout) once per worker process.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        mpl.rcParams.update(dict(
+            (key, val) for key, val in rc.items()
+            if key not in PROCESS_RC_PARAMS
+        ))
+
+    figure = new_figure(figsize=(1, 1))
+    figure.add_subplot(111).set_title("warmup")
+    figure.canvas.draw()
+
+
+##########################################################################
+## Job Helpers
+##########################################################################
+
+def _build_visualizer(spec):
+    """
+    Returns the visualizer described by a spec (see render_batch). Instances
+    are copied so that rendering never mutates the caller's visualizer.
+    """
+    if isinstance(spec, Visualizer):
+        return copy.deepcopy(spec)
+
+    try:
+        klass, params = spec
+    except (TypeError, ValueError):
+        raise YellowbrickTypeError(
+            "a visualizer spec must be a Visualizer or a (class, params) pair"
+        )
+
+    if isinstance(klass, string_types):
+        module, _, name = klass.rpartition('.')
+        klass = getattr(importlib.import_module(module), name)
+
+    if not (isinstance(klass, type) and issubclass(klass, Visualizer)):
+        raise YellowbrickTypeError("{!r} is not a Visualizer".format(klass))
+
+    return klass(**dict(params or {}))
+
+
+def _load_data(data):
+    """
+    Resolves a data reference (see render_batch) into a dict of arrays.
+    """
+    if callable(data):
+        data = data()
+
+    if isinstance(data, string_types):
+        if not data.endswith('.npz'):
+            raise YellowbrickValueError(
+                "data paths must be .npz files with X and y arrays"
+            )
+        data = np.load(data)
+
+    if isinstance(data, (tuple, list)):
+        if len(data) not in (2, 4):
+            raise YellowbrickValueError(
+                "data tuples must be (X, y) or (X, y, X_test, y_test)"
+            )
+        data = dict(zip(('X', 'y', 'X_test', 'y_test'), data))
+
+    return dict((key, attach(data[key])) for key in data.keys())
+
+
+def _draw(visualizer, data):
+    """
+    Fits and draws a visualizer: score visualizers are fit on X and y and
+    scored on X_test and y_test (or on X and y if there is no test data),
+    feature visualizers are fit and transform X and y.
+    """
+    X, y = data['X'], data.get('y')
+
+    if isinstance(visualizer, ScoreVisualizer):
+        visualizer.fit(X, y)
+        visualizer.score(data.get('X_test', X), data.get('y_test', y))
+    else:
+        visualizer.fit(X, y)
+        if hasattr(visualizer, 'transform'):
+            visualizer.transform(X)
+
+    # The figure is saved by the caller, so poof cannot show it
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", YellowbrickWarning)
+        visualizer.poof()
@@ -22,23 +22,37 @@ import numpy as np
 from sklearn import linear_model
 from sklearn.preprocessing import PolynomialFeatures
 from sklearn.pipeline import make_pipeline
-from sklearn.metrics import mean_squared_error as mse
 
 from operator import itemgetter
+from yellowbrick.parallel import attach, shared
 from yellowbrick.exceptions import YellowbrickValueError
 
+try:
+    from sklearn.externals.joblib import Parallel, delayed
+except ImportError:
+    from joblib import Parallel, delayed
+
 
 ##########################################################################
 ## Module Constants
 ##########################################################################
 
+# Engines used to fit polynomial best fit lines
+LSTSQ       = 'lstsq'
+SKLEARN     = 'sklearn'
+
 # Names of the various estimator functions
 LINEAR      = 'linear'
 QUADRATIC   = 'quadratic'
 EXPONENTIAL = 'exponential'
 LOG         = 'log'
+LOWESS      = 'lowess'
 SELECT_BEST = 'select_best'
 
+# Criteria used to select the best fit
+GCV         = 'gcv'
+LOO         = 'loo'
+
 
 ##########################################################################
 ## Draw Line of Best Fit
@@ -54,21 +68,34 @@ def draw_best_fit(X, y, ax, estimator='linear', **kwargs):
 
         'linear':      Uses OLS to fit the regression
         'quadratic':   Uses OLS with Polynomial order 2
-        'exponential': Not implemented yet
-        'log':         Not implemented yet
-        'select_best': Selects the best fit via MSE
+        'exponential': Uses OLS on log(y) to fit y = a * exp(b * x)
+        'log':         Uses OLS on log(x) to fit y = a + b * log(x)
+        'lowess':      Uses binned locally weighted linear regression
+        'select_best': Selects the best fit via generalized cross-validation
+
+    If the ``ci`` keyword argument is given (e.g. 0.95), a bootstrap
+    confidence band of the linear, quadratic, exponential or log fit is
+    drawn around the line with ``fill_between``, computed from ``n_boot``
+    (default 1000) resamples by ``bootstrap_band``; ``n_jobs`` and
+    ``random_state`` are passed to it.
 
     The remaining keyword arguments are passed to ax.plot to define and
     describe the line of best fit.
     """
+    ci = kwargs.pop('ci', None)
+    n_boot = kwargs.pop('n_boot', 1000)
+    n_jobs = kwargs.pop('n_jobs', 1)
+    random_state = kwargs.pop('random_state', None)
+    method = estimator
 
     # Estimators are the types of best fit lines that can be drawn.
     estimators = {
         LINEAR: fit_linear,               # Uses OLS to fit the regression
         QUADRATIC: fit_quadratic,         # Uses OLS with Polynomial order 2
-        EXPONENTIAL: fit_exponential,     # Not implemented yet
-        LOG: fit_log,                     # Not implemented yet
-        SELECT_BEST: fit_select_best,     # Selects the best fit via MSE
+        EXPONENTIAL: fit_exponential,     # Uses OLS on log(y)
+        LOG: fit_log,                     # Uses OLS on log(x)
+        LOWESS: fit_lowess,               # Uses binned LOWESS
+        SELECT_BEST: fit_select_best,     # Selects the best fit via GCV
     }
 
     # Check to make sure that a correct estimator value was passed in.
@@ -79,6 +106,14 @@ def draw_best_fit(X, y, ax, estimator='linear', **kwargs):
             )
         )
 
+    # Confidence bands can only be bootstrapped for the linearized families.
+    if ci is not None and estimator not in BOOTSTRAP_FAMILIES:
+        raise YellowbrickValueError(
+            "cannot bootstrap '{}' best fit lines; choose from {}".format(
+                estimator, ", ".join(BOOTSTRAP_FAMILIES.keys())
+            )
+        )
+
     # Then collect the estimator function from the mapping.
     estimator = estimators[estimator]
 
@@ -115,38 +150,268 @@ def draw_best_fit(X, y, ax, estimator='linear', **kwargs):
     # Plot line of best fit onto the axes that were passed in.
     # TODO: determin if xlim or X.min(), X.max() are better params
     xr = np.linspace(*ax.get_xlim(), num=100)
-    ax.plot(xr, model.predict(xr[:,np.newaxis]), **kwargs)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        line = ax.plot(xr, model.predict(xr[:,np.newaxis]), **kwargs)[0]
+
+    # Draw the bootstrap confidence band behind the line
+    if ci is not None:
+        lower, upper = bootstrap_band(
+            X, y, xr, method, ci=ci, n_boot=n_boot, n_jobs=n_jobs,
+            random_state=random_state,
+        )
+        ax.fill_between(
+            xr, lower, upper, color=line.get_color(), alpha=0.2, linewidth=0
+        )
+
     return ax
 
 
+##########################################################################
+## Bootstrap Confidence Bands
+##########################################################################
+
+# Linearizing transforms (of x, of y, inverse of y) and degree per family
+BOOTSTRAP_FAMILIES = {
+    LINEAR: (None, None, None, 1),
+    QUADRATIC: (None, None, None, 2),
+    EXPONENTIAL: (None, np.log, np.exp, 1),
+    LOG: (np.log, None, None, 1),
+}
+
+# Maximum number of resampled elements (resamples x n) fit in one batch
+BOOTSTRAP_BATCH_ELEMENTS = 1000000
+
+
+def bootstrap_band(X, y, grid, estimator=LINEAR, ci=0.95, n_boot=1000,
+                   n_jobs=1, random_state=None):
+    """
+    Computes a percentile bootstrap confidence band of a best fit line on
+    the plotting grid.
+
+    Resamples are fit in vectorized batches: each batch draws a stacked
+    (B x n) index array, counts how many times each point was drawn in each
+    resample and fits all B polynomials at once with ``fit_batch`` (the
+    counts weight the shared points, so the normal equations of the whole
+    batch come from one matrix product), keeping only their predictions on
+    the grid. Batches are sized to bound memory, and if ``n_jobs`` is not 1
+    they are run in a process pool.
+
+    Parameters
+    ----------
+    X, y : array-like
+        The points the line was fit to.
+
+    grid : array-like
+        The x values the band is evaluated at.
+
+    estimator : one of 'linear', 'quadratic', 'exponential' or 'log'
+        The family of the best fit line.
+
+    ci : float, default: 0.95
+        The confidence level of the band.
+
+    n_boot : int, default: 1000
+        The number of bootstrap resamples.
+
+    n_jobs : int, default: 1
+        The number of processes to fit the batches in.
+
+    random_state : int or None
+        Seeds the resampling.
+
+    Returns
+    -------
+    lower, upper : ndarray
+        The lower and upper percentiles of the fits at each grid point.
+    """
+    if estimator not in BOOTSTRAP_FAMILIES:
+        raise YellowbrickValueError(
+            "cannot bootstrap '{}' best fit lines; choose from {}".format(
+                estimator, ", ".join(BOOTSTRAP_FAMILIES.keys())
+            )
+        )
+
+    xfunc, yfunc, yinv, degree = BOOTSTRAP_FAMILIES[estimator]
+    x = np.asarray(X, dtype=float).ravel()
+    y = np.asarray(y, dtype=float)
+    grid = np.asarray(grid, dtype=float)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if xfunc is not None:
+            x, grid = xfunc(x), xfunc(grid)
+        if yfunc is not None:
+            y = yfunc(y)
+
+    batch = max(1, min(n_boot, BOOTSTRAP_BATCH_ELEMENTS // x.size))
+    sizes = [min(batch, n_boot - start) for start in range(0, n_boot, batch)]
+    seeds = np.random.RandomState(random_state).randint(
+        np.iinfo(np.int32).max, size=len(sizes)
+    )
+
+    if n_jobs == 1 or len(sizes) == 1:
+        preds = [
+            _bootstrap_batch(x, y, grid, degree, size, seed)
+            for size, seed in zip(sizes, seeds)
+        ]
+    else:
+        with shared(x, y) as (xs, ys):
+            preds = Parallel(n_jobs=n_jobs)(
+                delayed(_bootstrap_batch)(xs, ys, grid, degree, size, seed)
+                for size, seed in zip(sizes, seeds)
+            )
+
+    preds = np.concatenate(preds)
+    if yinv is not None:
+        preds = yinv(preds)
+
+    alpha = (1.0 - ci) / 2.0 * 100
+    return np.nanpercentile(preds, [alpha, 100 - alpha], axis=0)
+
+
+def _bootstrap_batch(x, y, grid, degree, size, seed):
+    """
+    Fits a batch of bootstrap resamples and returns their predictions on the
+    grid with shape (size, len(grid)).
+    """
+    x, y   = attach(x), attach(y)
+    nrows  = x.size
+    index  = np.random.RandomState(seed).randint(nrows, size=(size, nrows))
+    index += nrows * np.arange(size)[:, np.newaxis]
+    counts = np.bincount(index.ravel(), minlength=size * nrows)
+    return fit_batch(x, y, degree, counts.reshape(size, nrows)).predict(grid)
+
+
 ##########################################################################
 ## Estimator Functions
 ##########################################################################
 
-def fit_select_best(X, y):
+def fit_select_best(X, y, criterion=GCV):
+    """
+    Selects the best fit of the linear, quadratic, exponential and log
+    families by choosing the model with the smallest estimated out of sample
+    error, since the training error always favors the most flexible model.
+
+    A single Vandermonde matrix up to the quadratic degree is built and
+    factorized once with QR; because its columns are nested, the linear and
+    quadratic fits, their residuals and hat matrix diagonals all come from
+    leading columns of the same factorization, as does the exponential fit
+    (a linear fit of log(y)). Only the log family needs a second, n x 2
+    factorization. The criterion is either generalized cross-validation
+    ('gcv') or the exact leave-one-out error ('loo') computed from the hat
+    matrix diagonals. Families whose fit is undefined (e.g. non-positive y
+    for the exponential) or rank deficient are skipped.
+    """
+    x = np.asarray(X, dtype=float).ravel()
+    y = np.asarray(y, dtype=float)
+
+    scoring = {GCV: _gcv_error, LOO: _loo_error}
+    if criterion not in scoring:
+        raise YellowbrickValueError(
+            "'{}' not a valid criterion; choose from {}".format(
+                criterion, ", ".join(scoring.keys())
+            )
+        )
+    scoring = scoring[criterion]
+
+    # Factorize the nested Vandermonde matrix of the polynomial families once
+    base = PolynomialFit(2)
+    base.x_mean_, base.x_scale_ = x.mean(), x.std() or 1.0
+    Q, R = np.linalg.qr(base.vander(x))
+    rank = _rank(R)
+
+    candidates = []
+    for degree in (1, 2):
+        if degree + 1 > rank:
+            continue
+        model, fitted = _nested_fit(base, Q, R, degree, y)
+        candidates.append((model, scoring(y, fitted, Q, degree + 1)))
+
+    if np.all(y > 0) and rank >= 2:
+        inner, fitted = _nested_fit(base, Q, R, 1, np.log(y))
+        model = ExponentialFit()
+        model.inner_ = inner
+        candidates.append((model, scoring(y, np.exp(fitted), Q, 2)))
+
+    if np.all(x > 0):
+        model = fit_log(x, y)
+        Ql, Rl = np.linalg.qr(model.inner_.vander(np.log(x)))
+        if _rank(Rl) == 2:
+            candidates.append((model, scoring(y, model.predict(x), Ql, 2)))
+
+    if not candidates:
+        raise YellowbrickValueError("could not fit any best fit line to the data")
+
+    return min(candidates, key=itemgetter(1))[0]
+
+
+def _rank(R, tol=1e-10):
+    """
+    Returns the number of leading well conditioned columns of a QR R factor.
+    """
+    diag = np.abs(np.diag(R))
+    small = diag <= tol * diag.max()
+    return int(np.argmax(small)) if small.any() else diag.size
+
+
+def _nested_fit(base, Q, R, degree, y):
+    """
+    Solves the polynomial fit of the given degree from the leading columns of
+    the QR factorization of the full Vandermonde matrix, returning the model
+    and its fitted values.
+    """
+    ncols = degree + 1
+    qty = np.dot(Q[:, :ncols].T, y)
+
+    model = PolynomialFit(degree)
+    model.x_mean_, model.x_scale_ = base.x_mean_, base.x_scale_
+    model.coef_ = np.linalg.solve(R[:ncols, :ncols], qty)
+    return model, np.dot(Q[:, :ncols], qty)
+
+
+def _gcv_error(y, fitted, Q, ncols):
     """
-    Selects the best fit of the estimators already implemented by choosing the
-    model with the smallest mean square error metric for the trained values.
+    Generalized cross-validation error: the mean squared residual inflated
+    by the effective degrees of freedom.
     """
-    models = [fit(X,y) for fit in [fit_linear, fit_quadratic]]
-    errors = map(lambda model: mse(y, model.predict(X)), models)
+    nrows = float(y.size)
+    if ncols >= nrows:
+        return np.inf
+    return np.mean((y - fitted) ** 2) / (1.0 - ncols / nrows) ** 2
+
 
-    return min(zip(models, errors), key=itemgetter(1))[0]
+def _loo_error(y, fitted, Q, ncols):
+    """
+    Leave-one-out error from the hat matrix diagonal, the row wise squared
+    norms of the leading columns of Q.
+    """
+    hat = (Q[:, :ncols] ** 2).sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        loo = (y - fitted) / (1.0 - hat)
+    return np.mean(loo ** 2) if np.all(np.isfinite(loo)) else np.inf
 
 
-def fit_linear(X, y):
+def fit_linear(X, y, engine=LSTSQ):
     """
-    Uses OLS to fit the regression.
+    Uses OLS to fit the regression. By default the closed form least squares
+    PolynomialFit is used; pass engine='sklearn' for a LinearRegression.
     """
+    if engine == LSTSQ:
+        return PolynomialFit(1).fit(X, y)
+
     model = linear_model.LinearRegression()
     model.fit(X, y)
     return model
 
 
-def fit_quadratic(X, y):
+def fit_quadratic(X, y, engine=LSTSQ):
     """
-    Uses OLS with Polynomial order 2.
+    Uses OLS with Polynomial order 2. By default the closed form least
+    squares PolynomialFit is used; pass engine='sklearn' for a pipeline of
+    PolynomialFeatures and LinearRegression.
     """
+    if engine == LSTSQ:
+        return PolynomialFit(2).fit(X, y)
+
     model = make_pipeline(
         PolynomialFeatures(2), linear_model.LinearRegression()
     )
@@ -156,17 +421,273 @@ def fit_quadratic(X, y):
 
 def fit_exponential(X, y):
     """
-    Fits an exponential curve to the data.
+    Fits an exponential curve y = a * exp(b * x) to the data by linearized
+    least squares, i.e. a linear fit of log(y) on x. Requires positive y.
     """
-    raise NotImplementedError("Exponential best fit lines are not implemented")
+    return ExponentialFit().fit(X, y)
 
 
 def fit_log(X, y):
     """
-    Fit a logrithmic curve to the data.
+    Fit a logrithmic curve y = a + b * log(x) to the data by linearized least
+    squares, i.e. a linear fit of y on log(x). Requires positive x.
+    """
+    return LogFit().fit(X, y)
+
+
+
+##########################################################################
+## Least Squares Engine
+##########################################################################
+
+class PolynomialFit(object):
+    """
+    A lightweight polynomial least squares model of y on a single feature x,
+    solved in closed form from the Vandermonde matrix of x with
+    ``np.linalg.lstsq``. It has none of the validation and pipeline overhead
+    of the equivalent Scikit-Learn models, which matters when drawing
+    thousands of small best fit lines.
+
+    x is centered and scaled before the Vandermonde matrix is built to keep
+    the problem well conditioned. The coefficients ``coef_`` are in
+    increasing powers of the scaled x; ``coef_`` is 2D with one row per
+    series when the model was fit with ``fit_batch`` (or y had several
+    columns).
+
+    Parameters
+    ----------
+    degree : int, default: 1
+        The degree of the polynomial.
+    """
+
+    def __init__(self, degree=1):
+        self.degree = degree
+
+    def _scale(self, X):
+        X = np.asarray(X, dtype=float)
+        if X.ndim == 2 and X.shape[-1] == 1:
+            X = X[:, 0]
+        return (X - self.x_mean_) / self.x_scale_
+
+    def vander(self, X):
+        """
+        Returns the Vandermonde matrix of the scaled X in increasing powers.
+        """
+        return np.vander(self._scale(X), self.degree + 1, increasing=True)
+
+    def fit(self, X, y):
+        """
+        Fits the polynomial to X of shape (n,) or (n, 1) and y of shape (n,)
+        or (n, k) for k series that share the same X.
+        """
+        X = np.asarray(X, dtype=float).ravel()
+        self.x_mean_  = X.mean()
+        self.x_scale_ = X.std() or 1.0
+
+        coef = np.linalg.lstsq(self.vander(X), np.asarray(y, dtype=float), rcond=-1)[0]
+        self.coef_ = coef.T
+        return self
+
+    def fit_batch(self, X, Y, weights=None):
+        """
+        Fits one polynomial per row of X and Y, both of shape (b, n), in a
+        single vectorized call by solving the stacked (weighted) normal
+        equations with ``np.linalg.solve``. Series of different lengths can
+        be fit together by padding them and giving the padding zero weight.
+
+        If X and Y are 1D and weights is (b, n), the b series share the same
+        points and differ only by their weights (e.g. bootstrap resample
+        counts); the normal equations are then assembled from the weighted
+        power sums of x with a single matrix product.
+        """
+        X = np.asarray(X, dtype=float)
+        Y = np.asarray(Y, dtype=float)
+        W = np.ones_like(X) if weights is None else np.asarray(weights, dtype=float)
+        powers = np.arange(self.degree + 1)
+
+        if X.ndim == 1 and W.ndim == 2:
+            self.x_mean_  = X.mean()
+            self.x_scale_ = X.std() or 1.0
+
+            V = self.vander(X)
+            moments = np.dot(W, np.power(V[:, 1:2], np.arange(2 * self.degree + 1)))
+            gram = moments[:, powers[:, np.newaxis] + powers]
+            rhs  = np.dot(W, V * Y[:, np.newaxis])
+        else:
+            total = W.sum(axis=1, keepdims=True)
+            self.x_mean_  = (W * X).sum(axis=1, keepdims=True) / total
+            scale = np.sqrt((W * (X - self.x_mean_) ** 2).sum(axis=1, keepdims=True) / total)
+            self.x_scale_ = np.where(scale > 0, scale, 1.0)
+
+            V  = np.power(self._scale(X)[..., np.newaxis], powers)
+            VW = V * W[..., np.newaxis]
+            gram = np.einsum('bni,bnj->bij', VW, V)
+            rhs  = np.einsum('bni,bn->bi', VW, Y)
+
+        try:
+            self.coef_ = np.linalg.solve(gram, rhs[..., np.newaxis])[..., 0]
+        except np.linalg.LinAlgError:
+            # Some series are rank deficient, use the minimum norm solutions
+            self.coef_ = np.einsum('bij,bj->bi', np.linalg.pinv(gram), rhs)
+        return self
+
+    def predict(self, X):
+        """
+        Evaluates the polynomial at X. For batched models X may be shared by
+        every series (shape (m,) or (m, 1)) or given per series (b, m); the
+        predictions then have shape (b, m).
+        """
+        X = np.asarray(X, dtype=float)
+        if X.ndim == 2 and X.shape[-1] == 1:
+            X = X[:, 0]
+
+        V = np.power(self._scale(X)[..., np.newaxis], np.arange(self.degree + 1))
+        if self.coef_.ndim == 1:
+            return np.dot(V, self.coef_)
+        if V.ndim == 2:
+            return np.dot(self.coef_, V.T)
+        return np.einsum('bmi,bi->bm', V, self.coef_)
+
+
+class ExponentialFit(object):
+    """
+    An exponential curve y = a * exp(b * x) fit as a line through log(y).
+    """
+
+    def fit(self, X, y):
+        y = np.asarray(y, dtype=float)
+        if np.any(y <= 0):
+            raise YellowbrickValueError(
+                "exponential best fit lines require positive y values"
+            )
+
+        self.inner_ = PolynomialFit(1).fit(X, np.log(y))
+        return self
+
+    def predict(self, X):
+        return np.exp(self.inner_.predict(X))
+
+
+class LogFit(object):
+    """
+    A logarithmic curve y = a + b * log(x) fit as a line against log(x).
+    """
+
+    def fit(self, X, y):
+        X = np.asarray(X, dtype=float)
+        if np.any(X <= 0):
+            raise YellowbrickValueError(
+                "logarithmic best fit lines require positive X values"
+            )
+
+        self.inner_ = PolynomialFit(1).fit(np.log(X), y)
+        return self
+
+    def predict(self, X):
+        return self.inner_.predict(np.log(np.asarray(X, dtype=float)))
+
+
+class LowessFit(object):
+    """
+    A binned approximation of LOWESS (locally weighted linear regression
+    with tricube weights), whose cost does not grow with n squared.
+
+    Rather than weighting every point for every evaluation, x is first
+    binned into a fixed grid of ``n_bins`` bins with ``np.bincount``
+    accumulating the sufficient statistics of each bin (count, sum of x, y,
+    x^2 and x*y). Each prediction then solves a weighted linear regression
+    over the bins, with vectorized tricube weights of the distance from the
+    bin mean to the evaluation point and a bandwidth that covers ``frac`` of
+    the points. Fitting is O(n) and evaluating m points is O(m * n_bins), so
+    the curve should only be evaluated where it is drawn.
+
+    Parameters
+    ----------
+    frac : float, default: 2/3
+        The fraction of the points used in each local regression.
+
+    n_bins : int, default: 200
+        The number of bins to divide the range of x into.
     """
-    raise NotImplementedError("Logrithmic best fit lines are not implemented")
 
+    def __init__(self, frac=2.0/3.0, n_bins=200):
+        self.frac = frac
+        self.n_bins = n_bins
+
+    def fit(self, X, y):
+        """
+        Accumulates the sufficient statistics of the (centered) points in
+        each bin of x.
+        """
+        x = np.asarray(X, dtype=float).ravel()
+        y = np.asarray(y, dtype=float)
+
+        self.x_mean_  = x.mean()
+        self.x_scale_ = x.std() or 1.0
+        x = (x - self.x_mean_) / self.x_scale_
+
+        lo, hi = x.min(), x.max()
+        width = (hi - lo) / self.n_bins or 1.0
+        bins  = np.minimum(((x - lo) / width).astype(int), self.n_bins - 1)
+
+        stats = np.array([
+            np.bincount(bins, weights, self.n_bins)
+            for weights in (None, x, y, x * x, x * y)
+        ])
+
+        # Only keep the bins that hold any points
+        keep = stats[0] > 0
+        self.counts_, self.sx_, self.sy_, self.sxx_, self.sxy_ = stats[:, keep]
+        self.centers_ = self.sx_ / self.counts_
+        return self
+
+    def predict(self, X):
+        """
+        Evaluates the local regression at each point of X.
+        """
+        x0 = (np.asarray(X, dtype=float).ravel() - self.x_mean_) / self.x_scale_
+        dist = np.abs(self.centers_[np.newaxis, :] - x0[:, np.newaxis])
+
+        # The bandwidth is the distance that covers frac of the points
+        order  = np.argsort(dist, axis=1)
+        cover  = np.cumsum(self.counts_[order], axis=1)
+        needed = self.frac * self.counts_.sum()
+        kth    = np.minimum((cover < needed).sum(axis=1), dist.shape[1] - 1)
+        band   = dist[np.arange(x0.size), order[np.arange(x0.size), kth]]
+        band   = np.maximum(band * 1.000001, 1e-12)[:, np.newaxis]
+
+        # Vectorized tricube weights of every bin for every point
+        weights = np.clip(1 - (dist / band) ** 3, 0, None) ** 3
+
+        # Weighted sums of the statistics centered on each evaluation point
+        s0 = np.dot(weights, self.counts_)
+        s1 = np.dot(weights, self.sx_) - x0 * s0
+        t0 = np.dot(weights, self.sy_)
+        s2 = np.dot(weights, self.sxx_) - 2 * x0 * np.dot(weights, self.sx_) + x0 ** 2 * s0
+        t1 = np.dot(weights, self.sxy_) - x0 * t0
+
+        # Solve the 2x2 normal equations for the intercept at x0
+        det = s0 * s2 - s1 * s1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            local = (s2 * t0 - s1 * t1) / det
+            flat  = t0 / s0
+
+        return np.where(np.abs(det) > 1e-12 * np.maximum(s0 * s2, 1e-300), local, flat)
+
+
+def fit_lowess(X, y):
+    """
+    Fits a binned LOWESS curve to the data.
+    """
+    return LowessFit().fit(X, y)
+
+
+def fit_batch(X, Y, degree=1, weights=None):
+    """
+    Fits a polynomial of the given degree to each row of X and Y in a single
+    vectorized call, see ``PolynomialFit.fit_batch``.
+    """
+    return PolynomialFit(degree).fit_batch(X, Y, weights)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,467 @@
+# yellowbrick.cache
+# On-disk caches of expensive intermediate results.
+#
+# Copyright (C) 2016 District Data Labs
+# For license information, see LICENSE.txt
+
+"""
+On-disk caches of expensive intermediate results, such as the out-of-fold
+predictions of the models compared by a multiple model visualizer or the
+encoded images of rendered visualizations, so that re-rendering does not
+require refitting unchanged models or redrawing unchanged figures.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import zlib
+import pickle
+import shutil
+import hashlib
+import tempfile
+import numpy as np
+import matplotlib as mpl
+
+from .utils import isdataframe, isestimator, isfitted
+from .exceptions import YellowbrickValueError
+
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+# The rcParams that describe the process rather than the style of a figure
+PROCESS_RC_PARAMS = ('backend', 'backend_fallback', 'interactive')
+
+# Fingerprint levels from the fastest to the most exact
+SAMPLE   = "sample"
+CHECKSUM = "checksum"
+EXACT    = "exact"
+FINGERPRINT_LEVELS = (SAMPLE, CHECKSUM, EXACT)
+
+# The default number of sampled rows and bytes checksummed at a time
+FINGERPRINT_ROWS  = 1024
+FINGERPRINT_CHUNK = 2**26
+
+
+##########################################################################
+## Hashing
+##########################################################################
+
+def fingerprint(X, level=CHECKSUM, max_rows=FINGERPRINT_ROWS):
+    """
+    Returns a cheap hex digest that identifies an array or DataFrame without
+    reading all of it (depending on the level). The digest always includes
+    the shape, dtype and strides of the data and a hash of a deterministic
+    strided sample of at most ``max_rows`` rows; only the sampled rows are
+    copied, so memory maps are not read in full. DataFrames are fingerprinted
+    column by column to avoid consolidating them into a single array.
+
+    Parameters
+    ----------
+    X : array-like
+        The data to fingerprint.
+
+    level : {'sample', 'checksum', 'exact'}, default: 'checksum'
+        The tradeoff between speed and exactness: 'sample' only hashes the
+        sampled rows, 'checksum' also computes a running Adler-32 checksum of
+        the whole buffer if it is contiguous (at memory speed, without
+        copying), and 'exact' hashes every byte of the data with SHA-1.
+
+    max_rows : int, default: 1024
+        The maximum number of rows in the sample.
+    """
+    if level not in FINGERPRINT_LEVELS:
+        raise YellowbrickValueError(
+            "'{}' is not a valid fingerprint level; choose from {}".format(
+                level, ", ".join(FINGERPRINT_LEVELS)
+            )
+        )
+
+    digest = hashlib.sha1()
+    if isdataframe(X):
+        digest.update(repr(list(X.columns)).encode('utf-8'))
+        for column in range(X.shape[1]):
+            values = X.iloc[:, column].values
+            digest.update(fingerprint(values, level, max_rows).encode('utf-8'))
+        return digest.hexdigest()
+
+    X = np.atleast_1d(np.asarray(X))
+    digest.update(repr((X.shape, X.dtype.str, X.strides)).encode('utf-8'))
+    if X.size == 0:
+        return digest.hexdigest()
+
+    if X.dtype.hasobject:
+        rows = X if level == EXACT else X[::_row_stride(X, max_rows)]
+        digest.update(repr(rows.tolist()).encode('utf-8'))
+        return digest.hexdigest()
+
+    contiguous = X.flags.c_contiguous or X.flags.f_contiguous
+    if level == EXACT:
+        for chunk in _byte_chunks(X if contiguous else np.ascontiguousarray(X)):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    sample = np.ascontiguousarray(X[::_row_stride(X, max_rows)])
+    digest.update(sample.view(np.uint8).data)
+    digest.update(np.ascontiguousarray(X[-1:]).view(np.uint8).data)
+
+    if level == CHECKSUM and contiguous:
+        checksum = 1
+        for chunk in _byte_chunks(X):
+            checksum = zlib.adler32(chunk, checksum)
+        digest.update(str(checksum & 0xffffffff).encode('utf-8'))
+
+    return digest.hexdigest()
+
+
+def _row_stride(X, max_rows):
+    """
+    Returns the stride between sampled rows so that at most max_rows rows
+    are sampled.
+    """
+    return max(1, -(-X.shape[0] // max_rows))
+
+
+def _byte_chunks(X, size=FINGERPRINT_CHUNK):
+    """
+    Yields the bytes of a contiguous array in chunks, without copying.
+    """
+    flat = X.reshape(-1, order='A').view(np.uint8)
+    for start in range(0, flat.size, size):
+        yield flat[start:start+size].data
+
+
+def hash_estimator(estimator):
+    """
+    Returns a hex digest of the class and hyperparameters of an estimator.
+    Each parameter is hashed with ``hash_value`` so that array parameters
+    are fingerprinted in full rather than by their (summarized) repr.
+    """
+    params = estimator.get_params(deep=True)
+    digest = hashlib.sha1()
+    digest.update(estimator.__class__.__name__.encode('utf-8'))
+    for key in sorted(params):
+        digest.update(key.encode('utf-8'))
+        digest.update(hash_value(params[key]).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def hash_value(value, level=EXACT):
+    """
+    Returns a hex digest of a parameter value: arrays are fingerprinted at
+    the given level, estimators are hashed by their parameters (and their
+    fitted state if they are fitted) and anything else by its repr.
+    """
+    if isinstance(value, np.ndarray) or isdataframe(value):
+        return fingerprint(value, level)
+
+    if isestimator(value) and not isinstance(value, type):
+        if isfitted(value):
+            return hashlib.sha1(pickle.dumps(value, protocol=2)).hexdigest()
+        return hash_estimator(value)
+
+    return hashlib.sha1(repr(value).encode('utf-8')).hexdigest()
+
+
+def hash_visualizer(visualizer):
+    """
+    Returns a hex digest of the class, ``get_params()`` and other public
+    attributes of an unfitted visualizer, which include the styling options
+    passed as keyword arguments. The axes are ignored.
+    """
+    params = dict(
+        (key, val) for key, val in vars(visualizer).items()
+        if not key.startswith('_')
+    )
+    try:
+        params.update(visualizer.get_params(deep=False))
+    except AttributeError:
+        pass
+    params.pop('ax', None)
+
+    digest = hashlib.sha1()
+    klass = visualizer.__class__
+    digest.update("{}.{}".format(klass.__module__, klass.__name__).encode('utf-8'))
+    for key in sorted(params):
+        digest.update(key.encode('utf-8'))
+        digest.update(hash_value(params[key]).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def hash_style():
+    """
+    Returns a hex digest of the active matplotlib rcParams that affect how a
+    figure is drawn.
+    """
+    params = sorted(
+        (key, val) for key, val in mpl.rcParams.items()
+        if key not in PROCESS_RC_PARAMS
+    )
+    return hashlib.sha1(repr(params).encode('utf-8')).hexdigest()
+
+
+def hash_splits(splits):
+    """
+    Returns a hex digest of the train and test indices of a list of folds,
+    which identifies the cross-validation strategy as it was realized on
+    the data (e.g. including its shuffling).
+    """
+    digest = hashlib.sha1()
+    for train, test in splits:
+        digest.update(np.asarray(train, dtype=np.int64).data)
+        digest.update(b'|')
+        digest.update(np.asarray(test, dtype=np.int64).data)
+        digest.update(b'#')
+    return digest.hexdigest()
+
+
+##########################################################################
+## File Caches
+##########################################################################
+
+class FileCache(object):
+    """
+    A directory of files named by their key, whose total size is bounded by
+    ``max_bytes``: after every store the least recently used files (by file
+    modification time, which is refreshed on every hit) are evicted. Only
+    files with one of the ``EXTENSIONS`` of the cache are considered, so
+    caches of different kinds can share a directory.
+
+    Parameters
+    ----------
+    path : str, default: None
+        The directory to store the files in; by default a ``yellowbrick``
+        directory in the system temporary directory.
+
+    max_bytes : int, default: 1 GB
+        The maximum total size of the stored files.
+
+    level : {'sample', 'checksum', 'exact'}, default: 'checksum'
+        The fingerprint level used to identify data in cache keys, see
+        ``fingerprint``.
+    """
+
+    EXTENSIONS = ()
+
+    def __init__(self, path=None, max_bytes=2**30, level=CHECKSUM):
+        if max_bytes < 1:
+            raise YellowbrickValueError(
+                "max_bytes must be a positive integer not {}".format(max_bytes)
+            )
+
+        if level not in FINGERPRINT_LEVELS:
+            raise YellowbrickValueError(
+                "'{}' is not a valid fingerprint level".format(level)
+            )
+
+        self.path = path or os.path.join(tempfile.gettempdir(), 'yellowbrick')
+        self.max_bytes = max_bytes
+        self.level = level
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+
+    def filename(self, key, ext):
+        return os.path.join(self.path, key + ext)
+
+    def lookup(self, key, ext):
+        """
+        Returns the path of the file stored under key, refreshing its access
+        time, or None if there is no such file.
+        """
+        path = self.filename(key, ext)
+        try:
+            os.utime(path, None)
+        except OSError:
+            return None
+        return path
+
+    def store(self, key, ext, write):
+        """
+        Stores a file under key by calling write with an open binary file,
+        then evicts the least recently used files. The file is written to a
+        temporary path and renamed so readers never see a partial file.
+        """
+        path = self.filename(key, ext)
+        temp = "{}.{}.tmp".format(path, os.getpid())
+        try:
+            with open(temp, 'wb') as f:
+                write(f)
+            os.rename(temp, path)
+        finally:
+            if os.path.exists(temp):
+                os.remove(temp)
+
+        self.evict()
+        return path
+
+    def entries(self):
+        """
+        Returns the (mtime, size, name) of every file of the cache.
+        """
+        entries = []
+        for name in os.listdir(self.path):
+            if not name.endswith(self.EXTENSIONS):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.path, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+        return entries
+
+    def evict(self):
+        """
+        Deletes the least recently used files until the total size of the
+        cache is at most max_bytes.
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.path, name))
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        """
+        Deletes every file of the cache.
+        """
+        for _, _, name in self.entries():
+            os.remove(os.path.join(self.path, name))
+
+
+class ArrayCache(FileCache):
+    """
+    A file cache of arrays stored as ``.npy`` files. Hits are returned as
+    read-only memory maps, so loading them is near-instant regardless of
+    their size.
+    """
+
+    EXTENSIONS = ('.npy',)
+
+    def get(self, key):
+        """
+        Returns the array stored under key as a memory map or None.
+        """
+        path = self.lookup(key, '.npy')
+        if path is None:
+            return None
+
+        try:
+            return np.load(path, mmap_mode='r')
+        except (IOError, OSError, ValueError):
+            return None
+
+    def set(self, key, array):
+        """
+        Stores the array under key then evicts the least recently used
+        arrays until the cache is within its size bound. Arrays larger than
+        the bound are not stored.
+        """
+        array = np.asarray(array)
+        if array.dtype.hasobject or array.nbytes > self.max_bytes:
+            return
+        self.store(key, '.npy', lambda f: np.save(f, array))
+
+
+##########################################################################
+## Prediction Cache
+##########################################################################
+
+class PredictionCache(ArrayCache):
+    """
+    Caches the out-of-fold predictions of estimators, keyed by the class
+    and ``get_params()`` of the estimator, a fingerprint of X and y and the
+    folds of the cross-validation, so that only estimators whose parameters,
+    data or folds have changed need to be refit.
+    """
+
+    def data_key(self, X, y, splits):
+        """
+        Returns a hash of the data and folds, shared by every estimator
+        cross-validated on them.
+        """
+        digest = hashlib.sha1()
+        for part in (
+            fingerprint(X, self.level), fingerprint(y, self.level),
+            hash_splits(splits),
+        ):
+            digest.update(part.encode('utf-8'))
+        return digest.hexdigest()
+
+    def key(self, estimator, data_key):
+        """
+        Returns the cache key of the predictions of estimator on the data
+        identified by data_key.
+        """
+        digest = hashlib.sha1()
+        digest.update(hash_estimator(estimator).encode('utf-8'))
+        digest.update(data_key.encode('utf-8'))
+        return digest.hexdigest()
+
+
+##########################################################################
+## Render Cache
+##########################################################################
+
+class RenderCache(FileCache):
+    """
+    Caches the encoded images (e.g. PNG or SVG bytes) of rendered
+    visualizations, keyed by the class, ``get_params()`` and options of the
+    visualizer, the active style (rcParams), a fingerprint of the input data
+    and the savefig options. On a hit, rendering to a path is a file copy;
+    see ``batch.render_job`` which fits, draws and saves through the cache.
+    """
+
+    EXTENSIONS = ('.png', '.svg', '.pdf', '.ps', '.eps', '.jpg', '.jpeg', '.tif', '.tiff')
+
+    @staticmethod
+    def format(outpath, format=None):
+        """
+        Returns the image format from the explicit format, the extension of
+        the output path or the savefig.format rcParam, in that order.
+        """
+        if format is None:
+            format = os.path.splitext(outpath)[1][1:] or mpl.rcParams['savefig.format']
+        return format.lower()
+
+    def key(self, visualizer, data, **kwargs):
+        """
+        Returns the cache key of rendering the (unfitted) visualizer on the
+        data, a mapping of names to arrays, with the savefig kwargs.
+        """
+        digest = hashlib.sha1()
+        digest.update(hash_visualizer(visualizer).encode('utf-8'))
+        digest.update(hash_style().encode('utf-8'))
+        for name in sorted(data):
+            digest.update(name.encode('utf-8'))
+            digest.update(hash_value(data[name], self.level).encode('utf-8'))
+        digest.update(repr(sorted(kwargs.items())).encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key, format, outpath=None):
+        """
+        Returns the path of the cached image or None on a miss. If outpath
+        is given the image is copied there on a hit.
+        """
+        path = self.lookup(key, '.' + format)
+        if path is not None and outpath is not None:
+            shutil.copyfile(path, outpath)
+        return path
+
+    def set(self, key, format, path):
+        """
+        Stores a copy of the image rendered at path under key and returns
+        the path of the cached image.
+        """
+        def copy(f):
+            with open(path, 'rb') as src:
+                shutil.copyfileobj(src, f)
+
+        return self.store(key, '.' + format, copy)
@@ -19,17 +19,28 @@ Visualizations related to evaluating Scikit-Learn classification models
 ##########################################################################
 
 import numpy as np
-import matplotlib.pyplot as plt
 
+from sklearn.base import clone
 from sklearn.pipeline import Pipeline
 from sklearn.metrics import auc, roc_auc_score, roc_curve
 from sklearn.metrics import precision_recall_fscore_support
 
 from .style.palettes import ddlheatmap
-from .exceptions import YellowbrickTypeError
+from .exceptions import YellowbrickTypeError, YellowbrickValueError
 from .style.palettes import PALETTES as YELLOWBRICK_PALETTES
 from .utils import get_model_name, isestimator, isclassifier
-from .base import Visualizer, ScoreVisualizer, MultiModelMixin
+from .parallel import attach, shared
+from .base import Visualizer, ScoreVisualizer, MultiModelMixin, new_axes
+
+try:
+    from sklearn.externals.joblib import Parallel, delayed
+except ImportError:
+    from joblib import Parallel, delayed
+
+try:
+    from sklearn.model_selection import train_test_split
+except ImportError:
+    from sklearn.cross_validation import train_test_split
 
 ##########################################################################
 ## Classification Visualization Base Object
@@ -49,6 +60,23 @@ class ClassificationScoreVisualizer(ScoreVisualizer):
 
         super(ClassificationScoreVisualizer, self).__init__(model, **kwargs)
 
+    def fit(self, X, y=None, **kwargs):
+        """
+        Fits the estimator (unless it is prefit) and reads the classes from
+        it if they were not specified.
+        """
+        super(ClassificationScoreVisualizer, self).fit(X, y, **kwargs)
+        self._set_classes()
+        return self
+
+    def _set_classes(self):
+        """
+        Sets classes_ from the fitted estimator unless it was specified, so
+        that a prefit estimator can be scored without calling fit.
+        """
+        if getattr(self, 'classes_', None) is None:
+            self.classes_ = getattr(self.estimator, 'classes_', None)
+
 ##########################################################################
 ## Classification Report
 ##########################################################################
@@ -64,24 +92,15 @@ class ClassificationReport(ClassificationScoreVisualizer):
         """
         super(ClassificationReport, self).__init__(model, **kwargs)
 
-        # TODO: hoist
-        self.estimator = model
-        self.ax = None
-
         self.name = get_model_name(self.estimator)
         self.cmap = kwargs.pop('cmap', ddlheatmap)
         self.classes_ = classes
 
-    def fit(self, X, y=None, **kwargs):
-        super(ClassificationReport, self).fit(X, y, **kwargs)
-        if self.classes_ is None:
-            self.classes_ = self.estimator.classes_
-        return self
-
     def score(self, X, y=None, **kwargs):
         """
         Generates the Scikit-Learn classification_report
         """
+        self._set_classes()
         y_pred = self.predict(X)
         keys   = ('precision', 'recall', 'f1')
         self.scores = precision_recall_fscore_support(y, y_pred)
@@ -94,7 +113,7 @@ class ClassificationReport(ClassificationScoreVisualizer):
         Renders the classification report across each axis.
         """
         if self.ax is None:
-            self.ax = plt.gca()
+            self.ax = new_axes()
 
         self.matrix = []
         for cls in self.classes_:
@@ -104,27 +123,29 @@ class ClassificationReport(ClassificationScoreVisualizer):
             for row in range(len(self.classes_)):
                 self.ax.text(column,row,self.matrix[row][column],va='center',ha='center')
 
-        fig = plt.imshow(self.matrix, interpolation='nearest', cmap=self.cmap, vmin=0, vmax=1)
+        self.image = self.ax.imshow(self.matrix, interpolation='nearest', cmap=self.cmap, vmin=0, vmax=1)
 
         return self.ax
 
 
-    def poof(self):
+    def poof(self, outpath=None, **kwargs):
         """
         Plots a classification report as a heatmap.
         """
         if self.ax is None: return
 
-        plt.title('{} Classification Report'.format(self.name))
-        plt.colorbar()
+        self.ax.set_title('{} Classification Report'.format(self.name))
+        self.ax.figure.colorbar(self.image, ax=self.ax)
         x_tick_marks = np.arange(len(self.classes_)+1)
         y_tick_marks = np.arange(len(self.classes_))
-        plt.xticks(x_tick_marks, ['precision', 'recall', 'f1-score'], rotation=45)
-        plt.yticks(y_tick_marks, self.classes_)
-        plt.ylabel('Classes')
-        plt.xlabel('Measures')
+        self.ax.set_xticks(x_tick_marks)
+        self.ax.set_xticklabels(['precision', 'recall', 'f1-score'], rotation=45)
+        self.ax.set_yticks(y_tick_marks)
+        self.ax.set_yticklabels(self.classes_)
+        self.ax.set_ylabel('Classes')
+        self.ax.set_xlabel('Measures')
 
-        return self.ax
+        return self.show(outpath, **kwargs)
 
 
 ##########################################################################
@@ -144,9 +165,7 @@ class ROCAUC(ClassificationScoreVisualizer):
 
         # TODO hoist to main
         self.name = get_model_name(self.estimator)
-        self.ax = None
 
-        super(ROCAUC, self).__init__(model, **kwargs)
         self.colors = {
             'roc': kwargs.pop('roc_color', '#2B94E9'),
             'diagonal': kwargs.pop('diagonal_color', '#666666'),
@@ -164,32 +183,30 @@ class ROCAUC(ClassificationScoreVisualizer):
         Called internally by score, possibly more than once
         """
         if self.ax is None:
-            self.ax = plt.gca()
-        plt.plot(self.fpr, self.tpr, c=self.colors['roc'], label='AUC = {:0.2f}'.format(self.roc_auc))
+            self.ax = new_axes()
+        self.ax.plot(self.fpr, self.tpr, c=self.colors['roc'], label='AUC = {:0.2f}'.format(self.roc_auc))
 
         # Plot the line of no discrimination to compare the curve to.
-        plt.plot([0,1],[0,1],'m--',c=self.colors['diagonal'])
+        self.ax.plot([0,1],[0,1],'m--',c=self.colors['diagonal'])
 
         return self.ax
 
-    def poof(self, **kwargs):
+    def poof(self, outpath=None, **kwargs):
         """
         Called by user.
 
-        Only takes self.
-
         Take in the model as input and generates a plot of
         the ROC plots with AUC metrics embedded.
         """
         if self.ax is None: return
 
-        plt.title('ROC for {}'.format(self.name))
-        plt.legend(loc='lower right')
+        self.ax.set_title('ROC for {}'.format(self.name))
+        self.ax.legend(loc='lower right')
 
-        plt.xlim([-0.02,1])
-        plt.ylim([0,1.1])
+        self.ax.set_xlim([-0.02,1])
+        self.ax.set_ylim([0,1.1])
 
-        return self.ax
+        return self.show(outpath, **kwargs)
 
 ##########################################################################
 ## Class Balance Chart
@@ -204,26 +221,17 @@ class ClassBalance(ClassificationScoreVisualizer):
         """
         Pass in a fitted model to generate a class balance chart.
         """
-
-        # TODO: hoist
-        self.estimator = model
-        self.ax = None
-
+        super(ClassBalance, self).__init__(model, **kwargs)
 
         self.name      = get_model_name(self.estimator)
         self.colors    = kwargs.pop('colors', YELLOWBRICK_PALETTES['paired'])
         self.classes_  = classes
 
-    def fit(self, X, y=None, **kwargs):
-        super(ClassBalance, self).fit(X, y, **kwargs)
-        if self.classes_ is None:
-            self.classes_ = self.estimator.classes_
-        return self
-
     def score(self, X, y=None, **kwargs):
         """
         Generates the Scikit-Learn precision_recall_fscore_support
         """
+        self._set_classes()
         y_pred = self.predict(X)
         self.scores  = precision_recall_fscore_support(y, y_pred)
         self.support = dict(zip(self.classes_, self.scores[-1]))
@@ -238,24 +246,559 @@ class ClassBalance(ClassificationScoreVisualizer):
 
         """
         if self.ax is None:
-            self.ax = plt.gca()
+            self.ax = new_axes()
 
         colors = self.colors[0:len(self.classes_)]
-        plt.bar(np.arange(len(self.support)), self.support.values(), color=colors, align='center', width=0.5)
+        self.ax.bar(np.arange(len(self.support)), list(self.support.values()), color=colors, align='center', width=0.5)
 
         return self.ax
 
-    def poof(self):
+    def poof(self, outpath=None, **kwargs):
         """
         Plots a class balance chart
         """
         if self.ax is None: return
 
-        plt.xticks(np.arange(len(self.support)), self.support.keys())
+        self.ax.set_xticks(np.arange(len(self.support)))
+        self.ax.set_xticklabels(list(self.support.keys()))
         cmax, cmin = max(self.support.values()), min(self.support.values())
         ceiling = cmax + cmax*0.1
         span = cmax - cmin
-        plt.ylim(0, ceiling)
-        plt.show()
+        self.ax.set_ylim(0, ceiling)
+
+        return self.show(outpath, **kwargs)
+
+
+##########################################################################
+## Discrimination Threshold
+##########################################################################
+
+# Names of the metrics computed at every discrimination threshold
+PRECISION  = 'precision'
+RECALL     = 'recall'
+F1_SCORE   = 'f1'
+QUEUE_RATE = 'queue_rate'
+THRESHOLD_METRICS = (PRECISION, RECALL, F1_SCORE, QUEUE_RATE)
+
+
+def threshold_metrics(y, scores):
+    """
+    Computes the precision, recall, f1 and queue rate of a binary classifier
+    at every unique threshold of its scores. An instance is predicted as the
+    positive class if its score is greater than or equal to the threshold.
+
+    Rather than computing the metrics once per threshold, the scores are
+    sorted once in descending order and the number of true positives at each
+    cutoff is taken from the cumulative sum of the sorted labels.
+
+    Parameters
+    ----------
+    y : array-like of shape (n,)
+        Binary targets where the positive class is encoded as 1 (or True).
+
+    scores : array-like of shape (n,)
+        The probability or decision function of the positive class.
+
+    Returns
+    -------
+    thresholds : ndarray
+        The unique thresholds in ascending order.
+
+    metrics : dict
+        Maps each metric name to an array aligned with the thresholds.
+    """
+    y = np.asarray(y).astype(bool)
+    scores = np.asarray(scores, dtype=float)
+
+    # Sort descending so that index k holds the (k+1)th highest score
+    order  = np.argsort(scores, kind="mergesort")[::-1]
+    scores = scores[order]
+    tps    = np.cumsum(y[order])
+
+    # Only keep the last index of each run of tied scores
+    distinct = np.r_[np.flatnonzero(np.diff(scores)), scores.size - 1]
+    tps = tps[distinct].astype(float)
+    pps = distinct + 1.0
+
+    return scores[distinct][::-1], _threshold_scores(tps, pps, y.sum(), y.size)
+
+
+def _threshold_scores(tps, pps, positives, total, reverse=True):
+    """
+    Computes the metrics from the true and predicted positive counts. If
+    reverse is True the counts are in descending threshold order and the
+    metrics are returned in ascending threshold order.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        precision = np.where(pps > 0, tps / pps, 1.0)
+        recall    = tps / positives if positives else np.zeros_like(tps)
+        f1        = np.where(
+            precision + recall > 0,
+            2 * precision * recall / (precision + recall), 0.0
+        )
+
+    metrics = {
+        PRECISION: precision,
+        RECALL: recall,
+        F1_SCORE: f1,
+        QUEUE_RATE: pps / float(total),
+    }
+
+    if reverse:
+        return dict((key, val[::-1]) for key, val in metrics.items())
+    return metrics
+
+
+def _positive_scores(estimator, X):
+    """
+    Returns the score of the positive class from a fitted binary classifier,
+    preferring predict_proba and falling back to decision_function.
+    """
+    if hasattr(estimator, 'predict_proba'):
+        return estimator.predict_proba(X)[:, 1]
+
+    if hasattr(estimator, 'decision_function'):
+        return estimator.decision_function(X)
+
+    raise YellowbrickTypeError(
+        "Discrimination thresholds require a classifier with either "
+        "predict_proba or decision_function"
+    )
+
+
+def _threshold_trial(estimator, X, y, test_size, random_state):
+    """
+    Runs a single shuffled train/test trial and returns the sorted test
+    scores and the cumulative true positive counts at each of them.
+    """
+    X_train, X_test, y_train, y_test = train_test_split(
+        attach(X), attach(y), test_size=test_size, random_state=random_state
+    )
+    estimator.fit(X_train, y_train)
+    scores = _positive_scores(estimator, X_test)
+
+    order = np.argsort(scores, kind="mergesort")[::-1]
+    return scores[order], np.cumsum(y_test[order])
+
+
+class DiscriminationThreshold(ClassificationScoreVisualizer):
+    """
+    Visualizes how the precision, recall, f1 score and queue rate (the
+    proportion of instances predicted as the positive class) of a binary
+    classifier change as the discrimination threshold is varied.
+
+    Each metric is computed at every unique threshold from a single sort of
+    the scores per trial (see ``threshold_metrics``) rather than one pass
+    over the data per threshold. Calling fit runs ``n_trials`` random
+    train/test shuffles (in parallel with ``n_jobs``) and draws the median
+    curve of each metric along with a band between the outer quantiles to
+    show its variability. Calling score on an already fitted model draws the
+    curves for the given test set alone.
+
+    Parameters
+    ----------
+    model : a Scikit-Learn binary classifier
+        Must implement either predict_proba or decision_function.
+
+    n_trials : int, default: 50
+        The number of shuffled train/test splits to compute the curves on.
+
+    test_size : float, default: 0.1
+        The proportion of the data held out for testing in each trial.
+
+    quantiles : sequence of three floats, default: (0.1, 0.5, 0.9)
+        The lower band, central curve and upper band quantiles.
+
+    num_thresholds : int, default: 100
+        The size of the shared threshold grid the trials are evaluated on.
+
+    random_state : int or None
+        Seeds the shuffles so that the trials are reproducible.
+
+    kwargs : dict
+        Keyword arguments passed to the super class, e.g. ``n_jobs``.
+    """
+
+    def __init__(self, model, n_trials=50, test_size=0.1,
+                 quantiles=(0.1, 0.5, 0.9), num_thresholds=100,
+                 random_state=None, **kwargs):
+        super(DiscriminationThreshold, self).__init__(model, **kwargs)
+
+        self.name = get_model_name(self.estimator)
+        self.n_trials = n_trials
+        self.test_size = test_size
+        self.quantiles = quantiles
+        self.num_thresholds = num_thresholds
+        self.random_state = random_state
+        self.colors = kwargs.pop('colors', YELLOWBRICK_PALETTES['yellowbrick'])
+
+    def fit(self, X, y=None, **kwargs):
+        """
+        Runs the shuffled trials, computes the metric curves of each trial on
+        a shared grid of thresholds and draws them, then fits the estimator
+        on all of the data (unless it is prefit) so that it can be scored.
+        """
+        yb = self._check_binary(y)
+        seeds = np.random.RandomState(self.random_state).randint(
+            np.iinfo(np.int32).max, size=self.n_trials
+        )
+
+        with shared(X, yb, enabled=self.n_jobs != 1) as (Xs, ys):
+            trials = Parallel(n_jobs=self.n_jobs)(
+                delayed(_threshold_trial)(
+                    clone(self.estimator), Xs, ys, self.test_size, seed
+                ) for seed in seeds
+            )
+
+        # Build a shared grid of thresholds across every trial
+        lo = min(scores[-1] for scores, _ in trials)
+        hi = max(scores[0] for scores, _ in trials)
+        self.thresholds_ = np.linspace(lo, hi, self.num_thresholds)
+
+        # Evaluate the step function of each trial on the grid: the number of
+        # predicted positives at a threshold is the count of scores above it.
+        self.cv_scores_ = dict((metric, []) for metric in THRESHOLD_METRICS)
+        for scores, tps in trials:
+            pps = np.searchsorted(-scores, -self.thresholds_, side='right')
+            metrics = _threshold_scores(
+                np.r_[0, tps][pps].astype(float), pps.astype(float),
+                tps[-1], scores.size, reverse=False
+            )
+            for metric, values in metrics.items():
+                self.cv_scores_[metric].append(values)
+
+        self.cv_scores_ = dict(
+            (metric, np.array(values))
+            for metric, values in self.cv_scores_.items()
+        )
+
+        self.draw()
+        return super(DiscriminationThreshold, self).fit(X, y, **kwargs)
+
+    def score(self, X, y=None, **kwargs):
+        """
+        Replaces the drawn curves with the metric curves at every unique
+        threshold of the fitted estimator's scores on X.
+        """
+        y = self._check_binary(y)
+        if self.ax is not None:
+            self.ax.cla()
+
+        self.thresholds_, metrics = threshold_metrics(
+            y, _positive_scores(self.estimator, X)
+        )
+        self.cv_scores_ = dict(
+            (metric, values[np.newaxis, :])
+            for metric, values in metrics.items()
+        )
+        return self.draw()
+
+    def draw(self, **kwargs):
+        """
+        Draws the central quantile of each metric as a line with a band
+        between the lower and upper quantiles.
+        """
+        if self.ax is None:
+            self.ax = new_axes()
+
+        for color, metric in zip(self.colors, THRESHOLD_METRICS):
+            lower, median, upper = np.percentile(
+                self.cv_scores_[metric],
+                [q * 100.0 for q in self.quantiles], axis=0
+            )
+            self.ax.plot(self.thresholds_, median, color=color, label=metric)
+            if self.cv_scores_[metric].shape[0] > 1:
+                self.ax.fill_between(
+                    self.thresholds_, upper, lower, alpha=0.35,
+                    linewidth=0, color=color
+                )
+
+        return self.ax
+
+    def poof(self, outpath=None, **kwargs):
+        """
+        Sets the title, labels and legend of the threshold plot.
+        """
+        if self.ax is None: return
+
+        self.ax.set_title('Threshold Plot for {}'.format(self.name))
+        self.ax.legend(frameon=True, loc='best')
+        self.ax.set_xlabel('discrimination threshold')
+        self.ax.set_ylabel('score')
+        self.ax.set_ylim(0.0, 1.05)
+
+        return self.show(outpath, **kwargs)
+
+    def _check_binary(self, y):
+        """
+        Ensures that the target is binary and encodes it as 0 and 1.
+        """
+        y = np.asarray(y)
+        classes = np.unique(y)
+        if classes.size > 2:
+            raise YellowbrickValueError(
+                "Discrimination thresholds require a binary target, "
+                "{} classes found".format(classes.size)
+            )
+        return (y == classes[-1]).astype(int)
+
+
+##########################################################################
+## Calibration Curve
+##########################################################################
+
+class CalibrationCurve(MultiModelMixin, Visualizer):
+    """
+    Reliability diagram that compares the mean predicted probability of the
+    positive class against the observed fraction of positives in equal width
+    probability bins, for one or more binary classifiers.
+
+    Predicted probabilities are binned with ``np.digitize`` and the per-bin
+    counts, sums of positives and sums of probabilities are accumulated with
+    ``np.bincount``, so only O(bins x models) memory is kept regardless of
+    how much data is scored. The ``partial_score`` method accumulates a chunk
+    of data into those sums (every model is evaluated on the same chunk), so
+    calibration can be measured over a stream that is read only once.
+
+    Parameters
+    ----------
+    models : a Scikit-Learn classifier or list of classifiers
+        Each model must implement predict_proba.
+
+    n_bins : int, default: 10
+        The number of equal width bins to divide [0, 1] into.
+
+    kwargs : dict
+        Keyword arguments passed to the super class, e.g. ``names``.
+    """
+
+    def __init__(self, models, n_bins=10, **kwargs):
+        # The models are scored as they are, never cross-validated
+        for key in ('cv', 'n_jobs', 'cache'):
+            if key in kwargs:
+                raise YellowbrickValueError(
+                    "calibration curves are computed on the given data "
+                    "without cross-validation, '{}' is not supported".format(key)
+                )
+
+        MultiModelMixin.__init__(self, models, **kwargs)
+        kwargs.pop('names', None)
+        Visualizer.__init__(self, **kwargs)
+
+        for model in self.models:
+            if not isclassifier(model):
+                raise YellowbrickTypeError(
+                    "This estimator is not a classifier; try a regression or clustering score visualizer instead!"
+                )
+
+        self.n_bins = n_bins
+        self.edges  = np.linspace(0.0, 1.0, n_bins + 1)
+        self.colors = kwargs.pop('colors', YELLOWBRICK_PALETTES['paired'])
+        self.reset()
+
+    def reset(self):
+        """
+        Clears the accumulated bin statistics of every model.
+        """
+        shape = (len(self.models), self.n_bins)
+        self.counts_     = np.zeros(shape)
+        self.positives_  = np.zeros(shape)
+        self.prob_sums_  = np.zeros(shape)
+        self.brier_sums_ = np.zeros(len(self.models))
+
+    def fit(self, X, y=None, **kwargs):
+        """
+        Fits every model and clears any previously accumulated statistics.
+        """
+        for model in self.models:
+            model.fit(X, y, **kwargs)
+        self.reset()
+        return self
+
+    def partial_score(self, X, y=None, **kwargs):
+        """
+        Accumulates the calibration statistics of each model on a chunk of
+        (already fitted) data without drawing.
+        """
+        y = np.asarray(y)
+        for idx, model in enumerate(self.models):
+            if not hasattr(model, 'predict_proba'):
+                raise YellowbrickTypeError(
+                    "Calibration curves require a classifier with predict_proba"
+                )
+
+            probs = model.predict_proba(X)[:, -1]
+            truth = (y == model.classes_[-1]).astype(float)
+            bins  = np.digitize(probs, self.edges[1:-1])
+
+            self.counts_[idx]     += np.bincount(bins, minlength=self.n_bins)
+            self.positives_[idx]  += np.bincount(bins, truth, self.n_bins)
+            self.prob_sums_[idx]  += np.bincount(bins, probs, self.n_bins)
+            self.brier_sums_[idx] += np.dot(probs - truth, probs - truth)
+
+        return self
+
+    def score(self, X, y=None, **kwargs):
+        """
+        Computes the calibration statistics of each model on X and y then
+        draws the reliability diagram.
+        """
+        self.reset()
+        self.partial_score(X, y)
+        return self.draw()
+
+    @property
+    def brier_scores_(self):
+        """
+        The Brier score of each model over all of the accumulated data.
+        """
+        return self.brier_sums_ / np.maximum(self.counts_.sum(axis=1), 1)
+
+    def draw(self, **kwargs):
+        """
+        Renders the fraction of positives against the mean predicted
+        probability of every non-empty bin for each model.
+        """
+        if self.ax is None:
+            self.ax = new_axes()
+
+        self.ax.plot([0, 1], [0, 1], 'k:', label='perfectly calibrated')
+
+        for idx, name in enumerate(self.names):
+            mask = self.counts_[idx] > 0
+            mean_probs = self.prob_sums_[idx][mask] / self.counts_[idx][mask]
+            fractions  = self.positives_[idx][mask] / self.counts_[idx][mask]
+            label = '{} (Brier = {:0.3f})'.format(name, self.brier_scores_[idx])
+
+            self.ax.plot(
+                mean_probs, fractions, 's-', label=label,
+                color=self.colors[idx % len(self.colors)]
+            )
 
         return self.ax
+
+    def poof(self, outpath=None, **kwargs):
+        """
+        Sets the title, labels and legend of the reliability diagram.
+        """
+        if self.ax is None: return
+
+        self.ax.set_title('Calibration Curve')
+        self.ax.set_xlabel('mean predicted probability')
+        self.ax.set_ylabel('fraction of positives')
+        self.ax.set_xlim(-0.02, 1.02)
+        self.ax.set_ylim(-0.02, 1.02)
+        self.ax.legend(loc='lower right')
+
+        return self.show(outpath, **kwargs)
+
+
+##########################################################################
+## Class Prediction Error
+##########################################################################
+
+def _encode_labels(labels, values):
+    """
+    Returns the index of each value in labels, raising a value error if any
+    of the values is not one of the labels.
+    """
+    values = np.asarray(values)
+    sorter = np.argsort(labels)
+    index  = np.searchsorted(labels, values, sorter=sorter)
+    index  = sorter[np.minimum(index, labels.size - 1)]
+
+    unknown = labels[index] != values
+    if unknown.any():
+        raise YellowbrickValueError(
+            "labels {} are not among the classes {}".format(
+                np.unique(values[unknown]).tolist(), labels.tolist()
+            )
+        )
+    return index
+
+
+class ClassPredictionError(ClassificationScoreVisualizer):
+    """
+    Stacked bar chart that shows, for each actual class, how many instances
+    were predicted as each of the classes, making it easy to see which
+    classes are confused with which.
+
+    All bar heights are taken from a single (actual x predicted) count
+    table computed with one vectorized ``np.bincount`` over the encoded
+    targets and predictions, and one bar call is made per predicted class,
+    so the chart remains interactive for millions of instances and hundreds
+    of classes.
+    """
+
+    def __init__(self, model, classes=None, **kwargs):
+        """
+        Pass in a fitted model to generate a class prediction error chart.
+        """
+        super(ClassPredictionError, self).__init__(model, **kwargs)
+
+        self.name = get_model_name(self.estimator)
+        self.colors = kwargs.pop('colors', YELLOWBRICK_PALETTES['paired'])
+        self.classes_ = classes
+
+    def score(self, X, y=None, **kwargs):
+        """
+        Computes the table of prediction counts of every actual class.
+        """
+        y_pred = self.predict(X)
+
+        # Encode the targets and predictions against the same sorted labels
+        labels = getattr(self.estimator, 'classes_', None)
+        if labels is None:
+            labels = np.unique(np.concatenate((np.unique(y), np.unique(y_pred))))
+        labels = np.asarray(labels)
+
+        y_enc = _encode_labels(labels, y)
+        p_enc = _encode_labels(labels, y_pred)
+
+        nlabels = labels.size
+        self.predictions_ = np.bincount(
+            y_enc * nlabels + p_enc, minlength=nlabels * nlabels
+        ).reshape(nlabels, nlabels)
+
+        if self.classes_ is None:
+            self.classes_ = labels
+
+        return self.draw(y, y_pred)
+
+    def draw(self, y, y_pred):
+        """
+        Renders one bar series per predicted class, stacked over the actual
+        classes on the x axis.
+        """
+        if self.ax is None:
+            self.ax = new_axes()
+
+        indices = np.arange(self.predictions_.shape[0])
+        bottoms = np.zeros(self.predictions_.shape[0])
+
+        for idx, name in enumerate(self.classes_):
+            heights = self.predictions_[:, idx]
+            self.ax.bar(
+                indices, heights, bottom=bottoms, label=str(name),
+                color=self.colors[idx % len(self.colors)], align='center',
+                width=0.5
+            )
+            bottoms += heights
+
+        self.ax.set_ylim(0, bottoms.max() * 1.1 if bottoms.max() else 1)
+        return self.ax
+
+    def poof(self, outpath=None, **kwargs):
+        """
+        Plots the class prediction error chart.
+        """
+        if self.ax is None: return
+
+        self.ax.set_title('Class Prediction Error for {}'.format(self.name))
+        self.ax.set_xticks(np.arange(len(self.classes_)))
+        self.ax.set_xticklabels(self.classes_)
+        self.ax.set_xlabel('actual class')
+        self.ax.set_ylabel('number of predicted class')
+        self.ax.legend(loc='best')
+
+        return self.show(outpath, **kwargs)
@@ -50,3 +50,14 @@ class YellowbrickValueError(YellowbrickError, ValueError):
     A bad value was passed into a function.
     """
     pass
+
+
+##########################################################################
+## Warnings
+##########################################################################
+
+class YellowbrickWarning(UserWarning):
+    """
+    The root warning for all yellowbrick related warnings.
+    """
+    pass
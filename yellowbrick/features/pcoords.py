@@ -20,9 +20,9 @@ coordinates that optimize column order.
 ##########################################################################
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 from yellowbrick.utils import is_dataframe
+from yellowbrick.base import new_axes
 from yellowbrick.features.base import FeatureVisualizer
 from yellowbrick.exceptions import YellowbrickTypeError
 from yellowbrick.style.colors import resolve_colors, get_color_cycle
@@ -214,7 +214,7 @@ class ParallelCoordinates(FeatureVisualizer):
         x = list(range(ncols))
 
         # Create the axis if it doesn't exist
-        if self.ax is None: self.ax = plt.gca()
+        if self.ax is None: self.ax = new_axes()
 
         # Create the colors
         # TODO: Allow both colormap, listed colors, and palette definition
@@ -259,7 +259,14 @@ class ParallelCoordinates(FeatureVisualizer):
         Parameters
         ----------
         outpath: path or None
-            Save the figure to disk or if None show in a window
+            Save the figure to disk or if None show in a window (only if
+            the axes were created with pyplot, otherwise a warning is
+            issued, see ``Visualizer.show``)
+
+        Returns
+        -------
+        figure : matplotlib Figure
+            The figure, e.g. to display it inline in a notebook.
 
         """
         if self.ax is None: return
@@ -267,7 +274,4 @@ class ParallelCoordinates(FeatureVisualizer):
         self.ax.legend(loc='best')
         self.ax.grid()
 
-        if outpath is not None:
-            plt.savefig(outpath, **kwargs)
-        else:
-            plt.show()
+        return self.show(outpath, **kwargs)
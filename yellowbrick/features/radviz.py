@@ -18,10 +18,10 @@ Implements radviz for feature analysis.
 ##########################################################################
 
 import numpy as np
-import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 
 from yellowbrick.utils import is_dataframe
+from yellowbrick.base import new_axes
 from yellowbrick.features.base import FeatureVisualizer
 from yellowbrick.exceptions import YellowbrickTypeError
 from yellowbrick.style.colors import resolve_colors, get_color_cycle
@@ -212,7 +212,7 @@ class RadialVisualizer(FeatureVisualizer):
 
         # Create the axes if they don't exist
         if self.ax is None:
-            self.ax = plt.gca(xlim=[-1,1], ylim=[-1,1])
+            self.ax = new_axes(xlim=[-1,1], ylim=[-1,1])
 
         # Create the colors
         # TODO: Allow both colormap, listed colors, and palette definition
@@ -282,15 +282,19 @@ class RadialVisualizer(FeatureVisualizer):
         Parameters
         ----------
         outpath: path or None
-            Save the figure to disk or if None show in a window
+            Save the figure to disk or if None show in a window (only if
+            the axes were created with pyplot, otherwise a warning is
+            issued, see ``Visualizer.show``)
+
+        Returns
+        -------
+        figure : matplotlib Figure
+            The figure, e.g. to display it inline in a notebook.
         """
         if self.ax is None: return
         self.ax.legend(loc='best')
 
-        if outpath is not None:
-            plt.savefig(outpath, **kwargs)
-        else:
-            plt.show()
+        return self.show(outpath, **kwargs)
 
 # Alias for RadViz
 RadViz = RadialVisualizer
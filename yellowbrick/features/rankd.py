@@ -18,9 +18,9 @@ Implements 1D (histograms) and 2D (joint plot) feature rankings.
 ##########################################################################
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 from yellowbrick.utils import is_dataframe
+from yellowbrick.base import new_axes
 from yellowbrick.features.base import FeatureVisualizer
 from yellowbrick.exceptions import YellowbrickValueError
 from yellowbrick.style.colors import resolve_colors, get_color_cycle
@@ -237,7 +237,7 @@ class Rank2D(FeatureVisualizer):
         """
         # Create the axes if they don't exist
         if self.ax is None:
-            self.ax = plt.gca()
+            self.ax = new_axes()
             self.ax.set_aspect("equal")
 
         # Generate a mask for the upper triangle
@@ -269,7 +269,14 @@ class Rank2D(FeatureVisualizer):
         Parameters
         ----------
         outpath: path or None
-            Save the figure to disk or if None show in a window
+            Save the figure to disk or if None show in a window (only if
+            the axes were created with pyplot, otherwise a warning is
+            issued, see ``Visualizer.show``)
+
+        Returns
+        -------
+        figure : matplotlib Figure
+            The figure, e.g. to display it inline in a notebook.
         """
         if self.ax is None: return
 
@@ -280,7 +287,4 @@ class Rank2D(FeatureVisualizer):
             )
         )
 
-        if outpath is not None:
-            plt.savefig(outpath, **kwargs)
-        else:
-            plt.show()
+        return self.show(outpath, **kwargs)
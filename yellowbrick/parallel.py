@@ -0,0 +1,258 @@
+# yellowbrick.parallel
+# Zero-copy handoff of arrays to parallel workers.
+#
+# Copyright (C) 2016 District Data Labs
+# For license information, see LICENSE.txt
+
+"""
+Zero-copy handoff of arrays to parallel workers. Rather than pickling a
+(potentially very large) array into every task, the array is published once
+to shared memory or a memory mapped file and the tasks receive a lightweight
+``SharedArray`` handle that workers ``attach`` to without copying.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import weakref
+import threading
+import tempfile
+import numpy as np
+
+from contextlib import contextmanager
+
+from .utils import isdataframe
+from .exceptions import YellowbrickValueError
+
+try:
+    from multiprocessing import shared_memory, resource_tracker
+except ImportError:
+    shared_memory = None
+
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+SHM    = "shm"
+MEMMAP = "memmap"
+FILE   = "file"
+
+# Publish to shared memory where it is available, otherwise to a temp file
+DEFAULT_BACKEND = SHM if shared_memory is not None else MEMMAP
+
+# Serializes the patching of the resource tracker in _attach_shm
+_TRACKER_LOCK = threading.Lock()
+
+
+##########################################################################
+## Shared Array Handles
+##########################################################################
+
+class SharedArray(object):
+    """
+    A picklable handle to an array published by ``publish``. Calling
+    ``attach`` in any process on the same host returns a read-only view of
+    the array (or of a DataFrame's values, rebuilt into a DataFrame) that is
+    backed by the shared buffer rather than a copy.
+    """
+
+    def __init__(self, backend, name, shape, dtype, order='C', offset=0,
+                 columns=None):
+        self.backend = backend
+        self.name    = name
+        self.shape   = tuple(shape)
+        self.dtype   = np.dtype(dtype).str
+        self.order   = order
+        self.offset  = offset
+        self.columns = columns
+        self.owner   = os.getpid()
+        self._shm    = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_shm'] = None
+        return state
+
+    @property
+    def nbytes(self):
+        return int(np.prod(self.shape)) * np.dtype(self.dtype).itemsize
+
+    def attach(self):
+        """
+        Returns a read-only array (or DataFrame) backed by the shared buffer.
+        """
+        if self.backend == SHM:
+            shm = self._shm or _attach_shm(self.name, self.owner)
+            array = np.ndarray(
+                self.shape, dtype=self.dtype, buffer=shm.buf, order=self.order
+            )
+            # Release the mapping once the last view of the array is gone
+            if shm is not self._shm:
+                weakref.finalize(array, shm.close)
+        else:
+            array = np.memmap(
+                self.name, dtype=self.dtype, mode='r', shape=self.shape,
+                offset=self.offset, order=self.order,
+            )
+
+        array.flags.writeable = False
+        if self.columns is not None:
+            from pandas import DataFrame
+            return DataFrame(array, columns=self.columns, copy=False)
+        return array
+
+    def unlink(self):
+        """
+        Frees the shared buffer; only the publishing process should call it.
+        """
+        if self.backend == SHM and self._shm is not None:
+            try:
+                self._shm.close()
+            except BufferError:
+                # Views are still alive, the mapping is freed along with them
+                pass
+            self._shm.unlink()
+            self._shm = None
+        elif self.backend == MEMMAP and os.path.exists(self.name):
+            os.remove(self.name)
+
+
+def _attach_shm(name, owner):
+    """
+    Opens an existing shared memory block. Blocks attached in a process
+    other than the publisher are not registered with the resource tracker,
+    which is shared with the publisher: its registration is then the only
+    one, so the block is freed if the publisher dies without unlinking it
+    and the tracker does not complain when the publisher does unlink it.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 always registers the block; suppress it instead
+        if os.getpid() == owner:
+            return shared_memory.SharedMemory(name=name)
+
+        with _TRACKER_LOCK:
+            register = resource_tracker.register
+            resource_tracker.register = _skip_register
+            try:
+                return shared_memory.SharedMemory(name=name)
+            finally:
+                resource_tracker.register = register
+
+
+def _skip_register(name, rtype):
+    """
+    Stands in for ``resource_tracker.register`` while attaching to a block.
+    """
+    pass
+
+
+##########################################################################
+## Publishing
+##########################################################################
+
+def publish(X, backend=None):
+    """
+    Publishes an array or DataFrame for zero-copy access by other processes
+    and returns a ``SharedArray`` handle to it. Objects that cannot be shared
+    without pickling (e.g. lists, sparse matrices, object or mixed dtype
+    DataFrames) are returned unchanged so they can still be passed to tasks.
+
+    Memory mapped arrays that are already backed by a contiguous file are
+    shared by reference to that file, without copying.
+
+    Parameters
+    ----------
+    X : array-like
+        The data to publish.
+
+    backend : {'shm', 'memmap'} or None
+        Publish to a ``multiprocessing.shared_memory`` block or to a memory
+        mapped temporary file; defaults to ``DEFAULT_BACKEND``.
+    """
+    backend = backend or DEFAULT_BACKEND
+    if backend not in (SHM, MEMMAP):
+        raise YellowbrickValueError(
+            "'{}' is not a valid shared array backend".format(backend)
+        )
+
+    if backend == SHM and shared_memory is None:
+        raise YellowbrickValueError(
+            "shared memory is not available, use the memmap backend instead"
+        )
+
+    columns = None
+    if isdataframe(X):
+        if len(set(X.dtypes)) != 1:
+            return X
+        columns = list(X.columns)
+        X = X.values
+
+    if not isinstance(X, np.ndarray) or X.dtype.hasobject or X.size == 0:
+        return X
+
+    order = 'F' if X.flags.f_contiguous and not X.flags.c_contiguous else 'C'
+
+    # Memory maps of a file can be shared as they are
+    if (isinstance(X, np.memmap) and X.filename
+            and not isinstance(X.base, np.ndarray)):
+        return SharedArray(
+            FILE, X.filename, X.shape, X.dtype, order, X.offset, columns
+        )
+
+    if backend == SHM:
+        shm = shared_memory.SharedMemory(create=True, size=X.nbytes)
+        handle = SharedArray(SHM, shm.name, X.shape, X.dtype, order, 0, columns)
+        handle._shm = shm
+        target = np.ndarray(X.shape, dtype=X.dtype, buffer=shm.buf, order=order)
+        target[...] = X
+        del target
+        return handle
+
+    fd, path = tempfile.mkstemp(prefix='yellowbrick-', suffix='.mmap')
+    os.close(fd)
+    handle = SharedArray(MEMMAP, path, X.shape, X.dtype, order, 0, columns)
+    target = np.memmap(path, dtype=X.dtype, mode='w+', shape=X.shape, order=order)
+    target[...] = X
+    target.flush()
+    del target
+    return handle
+
+
+def attach(X):
+    """
+    Returns the data behind a ``SharedArray`` handle, or X if it is not one.
+    Worker functions call this on their inputs so that they accept either.
+    """
+    if isinstance(X, SharedArray):
+        return X.attach()
+    return X
+
+
+@contextmanager
+def shared(*arrays, **kwargs):
+    """
+    Context manager that publishes the arrays and yields their handles (or
+    the arrays themselves if ``enabled`` is False, e.g. when the work is not
+    run in parallel). The shared buffers are always freed on exit, even if
+    the body raises.
+
+        with shared(X, y, enabled=n_jobs != 1) as (X, y):
+            Parallel(n_jobs=n_jobs)(delayed(task)(X, y) for ...)
+    """
+    backend = kwargs.pop('backend', None)
+    enabled = kwargs.pop('enabled', True)
+
+    handles = []
+    try:
+        for array in arrays:
+            handles.append(publish(array, backend) if enabled else array)
+        yield tuple(handles)
+    finally:
+        for handle in handles:
+            if isinstance(handle, SharedArray):
+                handle.unlink()
@@ -18,13 +18,22 @@ Visualizations related to evaluating Scikit-Learn regressor models
 ## Imports
 ##########################################################################
 
+import numpy as np
 import matplotlib as mpl
-import matplotlib.pyplot as plt
+
+from scipy.stats import norm
+from sklearn.linear_model import Ridge, Lasso, ElasticNet, LassoCV, ElasticNetCV
+from sklearn.utils.validation import _num_samples
+from mpl_toolkits.axes_grid1 import make_axes_locatable
 
 from .bestfit import draw_best_fit
-from .exceptions import YellowbrickTypeError
-from .utils import get_model_name, isestimator, isregressor
+from .stream import RunningStats, RunningRegression, Reservoir, StreamingHistogram
+from .stream import GrowableArray
+from .exceptions import YellowbrickTypeError, YellowbrickValueError
+from .utils import get_model_name, isestimator, isregressor, isdataframe
+from .style.colors import get_color_cycle
 from .base import Visualizer, ScoreVisualizer, MultiModelMixin
+from .base import cross_val_predictions, new_axes
 
 ##########################################################################
 ## Regression Visualization Base Object
@@ -53,17 +62,70 @@ class PredictionError(RegressionScoreVisualizer):
     """
     Plot the actual targets from the dataset against the
     predicted values generated by our model(s).
+
+    By default every (y, y_pred) point is drawn in a scatter plot. For large
+    test sets the ``mode`` keyword argument can be set to 'hexbin' or
+    'hist2d' to aggregate the points into a grid whose cell count is derived
+    from the size of the axes in pixels (``cell_size`` pixels per cell), so
+    that a single image (or hexagon collection) is rendered no matter how
+    many points there are. The identity and best fit lines are drawn in
+    every mode.
+
+    If the ``cv`` keyword argument is set, score draws the out-of-fold
+    predictions of the estimator across X and y (see
+    ``cross_val_predictions``) with folds fitted in parallel with
+    ``n_jobs``; in scatter mode the points are colored by fold, and the
+    fold of each instance is stored in ``folds_``.
+
+    When score is called repeatedly (e.g. inside a monitoring loop) in
+    scatter mode, the existing artists are updated rather than new ones
+    added: the new points are appended to a buffer of offsets whose
+    capacity doubles as it fills (see ``stream.GrowableArray``), a view of
+    which is set as the offsets of a single PathCollection; the line of best
+    fit is recomputed once per call from running sums; and the figure is
+    updated by blitting only the new points (with a reused hidden
+    collection) and the best fit line over the previous frame, so the cost
+    of an update is proportional to the number of new points. A full redraw
+    only happens when the new points expand the axes limits. In the density
+    modes or with ``cv``, each score instead replaces the artists drawn by
+    the previous one.
     """
+
+    # Modes of drawing the points
+    SCATTER = 'scatter'
+    HEXBIN  = 'hexbin'
+    HIST2D  = 'hist2d'
+    MODES   = (SCATTER, HEXBIN, HIST2D)
+
     def __init__(self, model, **kwargs):
         super(PredictionError, self).__init__(model, **kwargs)
 
-        self.ax = None
         self.name = get_model_name(self.estimator)
         self.colors = {
             'point': kwargs.pop('point_color', '#F2BE2C'),
             'line': kwargs.pop('line_color', '#2B94E9'),
+            'identity': kwargs.pop('identity_color', '#666666'),
         }
-        # self.fig, self.ax = plt.subplots()
+        self.mode = kwargs.pop('mode', self.SCATTER)
+        self.cmap = kwargs.pop('cmap', 'YlOrBr')
+        self.cell_size = kwargs.pop('cell_size', 5)
+        self.cv = kwargs.pop('cv', None)
+        self.folds_ = None
+
+        # Artists and state updated by repeated calls to score
+        self._artists = []
+        self._points  = None
+        self._offsets = None
+        self._blitted = None
+        self._bestfit = None
+        self._frame   = None
+
+        if self.mode not in self.MODES:
+            raise YellowbrickValueError(
+                "'{}' not a valid mode; choose from {}".format(
+                    self.mode, ", ".join(self.MODES)
+                )
+            )
 
     def score(self, X, y=None, **kwargs):
         """
@@ -73,7 +135,9 @@ class PredictionError(RegressionScoreVisualizer):
 
             y_pred = cv.cross_val_predict(model, X, y, cv=12)
 
-        With the new API, there's not much for score to do.
+        With the new API, there's not much for score to do, unless the
+        visualizer was created with a ``cv`` argument, in which case the
+        out-of-fold predictions are drawn.
 
         Parameters
         ----------
@@ -84,36 +148,217 @@ class PredictionError(RegressionScoreVisualizer):
             y (also y_test) is the independent actual variables to score against
 
         """
-        y_pred = self.predict(X)
-        return self.draw(y, y_pred)
+        if self.cv is not None:
+            y_pred, self.folds_ = cross_val_predictions(
+                self.estimator, X, y, self.cv, self.n_jobs
+            )
+        else:
+            y_pred, self.folds_ = self.predict(X), None
+        return self.draw(y, y_pred, folds=self.folds_)
 
-    def draw(self, y, y_pred):
+    def draw(self, y, y_pred, folds=None):
         """
-        If score is happening inside a loop, draw would get called multiple times.
-
-        But, ideally we'd want the best fit line to be drawn only once?
+        If score is happening inside a loop, draw gets called multiple times;
+        in scatter mode the later calls are passed to update, which extends
+        the existing artists instead of drawing new ones.
         """
         if self.ax is None:
-            self.ax = plt.gca()
+            self.ax = new_axes()
+
+        y = np.asarray(y)
+        y_pred = np.asarray(y_pred)
+
+        if self._points is not None and folds is None:
+            return self.update(y, y_pred)
+
+        # Density and cross-validated plots are replaced rather than updated
+        self.clear()
 
-        self.ax.scatter(y, y_pred, c='#F2BE2C')
+        xlim = (y.min()-1, y.max()+1)
+        ylim = (y_pred.min()-1, y_pred.max()+1)
+        self.ax.set_xlim(*xlim)
+        self.ax.set_ylim(*ylim)
+
+        if self.mode == self.SCATTER and folds is not None:
+            cycle = get_color_cycle()
+            for fold in np.unique(folds):
+                mask = folds == fold
+                self._artists.append(self.ax.scatter(
+                    y[mask], y_pred[mask], c=cycle[fold % len(cycle)],
+                    label='fold {}'.format(fold)
+                ))
+        elif self.mode == self.SCATTER:
+            self._offsets = GrowableArray(2).append(np.column_stack((y, y_pred)))
+            self._points = self.ax.scatter(y, y_pred, c=self.colors['point'])
+            self._artists.append(self._points)
+        else:
+            self._artists.append(self.draw_density(y, y_pred, xlim, ylim))
+
+        # Draw the identity line and the line of best fit over the points
+        lim = (max(xlim[0], ylim[0]), min(xlim[1], ylim[1]))
+        self._identity = self.ax.plot(lim, lim, ls=':', lw=1, c=self.colors['identity'])[0]
         draw_best_fit(y, y_pred, self.ax, 'linear', ls='--', lw=2, c=self.colors['line'])
+        self._bestfit = self.ax.lines[-1]
+        self._artists.extend((self._identity, self._bestfit))
+        self._fit = RunningRegression().update(y, y_pred)
 
-        self.ax.set_xlim(y.min()-1, y.max()+1)
-        self.ax.set_ylim(y_pred.min()-1, y_pred.max()+1)
+        self.ax.set_xlim(*xlim)
+        self.ax.set_ylim(*ylim)
 
         return self.ax
 
-    def poof(self):
+    def clear(self):
+        """
+        Removes the artists drawn by previous calls to score from the axes
+        and resets the state used to update them.
+        """
+        for artist in self._artists:
+            artist.remove()
+
+        self._artists = []
+        self._points  = None
+        self._offsets = None
+        self._blitted = None
+        self._frame   = None
+
+    def update(self, y, y_pred):
+        """
+        Adds new points to the existing scatter plot, refits the line of best
+        fit from its running sums and blits the changes onto the canvas.
+        """
+        self._offsets.append(np.column_stack((y, y_pred)))
+        self._points.set_offsets(self._offsets.values)
+        self._fit.update(y, y_pred)
+
+        # Expand the limits to fit the new points if required
+        xlim, ylim = self.ax.get_xlim(), self.ax.get_ylim()
+        nxlim = (min(xlim[0], y.min()-1), max(xlim[1], y.max()+1))
+        nylim = (min(ylim[0], y_pred.min()-1), max(ylim[1], y_pred.max()+1))
+        expanded = nxlim != tuple(xlim) or nylim != tuple(ylim)
+        if expanded:
+            self.ax.set_xlim(*nxlim)
+            self.ax.set_ylim(*nylim)
+            lim = (max(nxlim[0], nylim[0]), min(nxlim[1], nylim[1]))
+            self._identity.set_data(lim, lim)
+
+        xr = np.linspace(*nxlim, num=100)
+        self._bestfit.set_data(xr, self._fit.predict(xr))
+
+        canvas = self.ax.figure.canvas
+        if not hasattr(canvas, 'copy_from_bbox'):
+            canvas.draw_idle()
+        elif expanded or self._frame is None:
+            self.redraw()
+        else:
+            self.blit(y, y_pred)
+
+        return self.ax
+
+    def redraw(self):
+        """
+        Fully renders the figure and captures the axes without the line of
+        best fit as the frame that later updates are blitted onto.
+        """
+        canvas = self.ax.figure.canvas
+        self._bestfit.set_visible(False)
+        canvas.draw()
+        self._frame = canvas.copy_from_bbox(self.ax.bbox)
+        self._bestfit.set_visible(True)
+        self.ax.draw_artist(self._bestfit)
+        canvas.blit(self.ax.bbox)
+
+    def blit(self, y, y_pred):
+        """
+        Draws only the new points over the previous frame, captures the result
+        as the next frame, then draws the line of best fit on top.
+        """
+        canvas = self.ax.figure.canvas
+        canvas.restore_region(self._frame)
+
+        # The new points are drawn with a hidden collection that is reused
+        # by every blit, so that no artists are added to the axes.
+        if self._blitted is None:
+            self._blitted = self.ax.scatter([], [], c=self.colors['point'])
+            self._blitted.set_visible(False)
+            self._artists.append(self._blitted)
+
+        self._blitted.set_offsets(np.column_stack((y, y_pred)))
+        self._blitted.set_visible(True)
+        self.ax.draw_artist(self._blitted)
+        self._blitted.set_visible(False)
+
+        self._frame = canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self._bestfit)
+        canvas.blit(self.ax.bbox)
+
+    def gridsize(self):
+        """
+        Returns the number of (x, y) grid cells that fit in the axes given
+        the pixel size of each cell.
+        """
+        bbox = self.ax.get_window_extent()
+        return (
+            max(int(bbox.width // self.cell_size), 1),
+            max(int(bbox.height // self.cell_size), 1),
+        )
+
+    def draw_density(self, y, y_pred, xlim, ylim):
+        """
+        Aggregates the points into a grid sized from the axes pixels and
+        draws the counts as a hexbin collection or a single 2D histogram
+        image, so the render cost does not depend on the number of points.
+        """
+        nx, ny = self.gridsize()
+
+        if self.mode == self.HEXBIN:
+            return self.ax.hexbin(
+                y, y_pred, gridsize=(nx, ny), extent=xlim + ylim,
+                cmap=self.cmap, mincnt=1, bins='log', linewidths=0,
+            )
+
+        counts, _, _ = np.histogram2d(
+            y, y_pred, bins=(nx, ny), range=(xlim, ylim)
+        )
+        counts = np.ma.masked_equal(counts.T, 0)
+        return self.ax.imshow(
+            counts, origin='lower', extent=xlim + ylim, aspect='auto',
+            interpolation='nearest', cmap=self.cmap,
+            norm=mpl.colors.LogNorm(),
+        )
+
+    def poof(self, outpath=None, **kwargs):
+        if self.ax is None: return
+
         self.ax.set_title('Prediction Error for {}'.format(self.name))
         self.ax.set_ylabel('Predicted')
-        plt.xlabel('Measured')
-        return self.ax
+        self.ax.set_xlabel('Measured')
+
+        if self.ax.get_legend_handles_labels()[0]:
+            self.ax.legend(loc='best')
+
+        return self.show(outpath, **kwargs)
 
 ##########################################################################
 ## Residuals Plots
 ##########################################################################
 
+def _sample_rows(nrows, size, random_state=None):
+    """
+    Returns the sorted indices of a random sample of size distinct rows.
+    Unlike ``RandomState.choice`` without replacement, which permutes all of
+    the rows, random indices are drawn and deduplicated until there are
+    enough, so time and memory depend on the sample size rather than nrows.
+    """
+    rng = np.random.RandomState(random_state)
+    if 2 * size > nrows:
+        return np.sort(rng.permutation(nrows)[:size])
+
+    idx = np.unique(rng.randint(0, nrows, size))
+    while idx.size < size:
+        idx = np.unique(np.concatenate((idx, rng.randint(0, nrows, size - idx.size))))
+    return idx
+
+
 class ResidualsPlot(RegressionScoreVisualizer):
     """
     A residual plot shows the residuals on the vertical axis
@@ -122,11 +367,65 @@ class ResidualsPlot(RegressionScoreVisualizer):
     If the points are randomly dispersed around the horizontal axis,
     a linear regression model is appropriate for the data;
     otherwise, a non-linear model is more appropriate.
+
+    After the estimator is fit, the residuals of the training data are drawn
+    according to the ``train_residuals`` keyword argument, which avoids a
+    second full pass of inference over very large training sets:
+
+        'predict': Predicts the entire training set (the default)
+        'sample':  Predicts a deterministic subsample of ``train_sample_size``
+                   rows selected with ``random_state``
+        'oob':     Reuses the out-of-bag predictions the estimator computed
+                   while fitting (``oob_prediction_``, e.g. a bagging or random
+                   forest regressor with ``oob_score=True``)
+        'skip':    Does not draw training residuals
+        'auto':    'oob' if available, otherwise 'sample' if the training set
+                   is larger than the sample size, otherwise 'predict'
+
+    The strategy that was actually used is stored in ``train_residuals_``.
+
+    Residuals can also be accumulated over a stream of chunks with
+    ``partial_score``, which keeps a fixed size reservoir sample of
+    ``reservoir_size`` (y_pred, residual) points per split for plotting,
+    along with exact running statistics (count, mean and variance) and an
+    exact histogram of the residuals of every split on shared bins (at most
+    ``max_bins``). Memory is fixed no matter how long the stream runs. Call
+    ``draw_stream`` to plot the sampled points.
+
+    Setting the ``hist`` or ``qqplot`` keyword arguments adds a side panel
+    to poof with a histogram of the residuals of each split (on the shared
+    bins of the streaming histogram) or a Q-Q plot of the residuals against
+    the normal distribution. The Q-Q quantiles are exact order statistics
+    selected with a single ``np.partition`` of the residuals if fewer than
+    ``max_exact_quantiles`` were scored, otherwise they are interpolated
+    from the streaming histogram. Scored residuals are only kept in memory
+    until that limit is passed, or until partial_score is called.
+
+    If the ``cv`` keyword argument is set, score draws the out-of-fold
+    residuals of the estimator across X and y, with folds fitted in parallel
+    with ``n_jobs`` and the points colored by fold (stored in ``folds_``).
+
+    Repeated calls to score extend the existing scatter collection of each
+    split with the new points rather than adding new artists, by appending
+    them to a growable buffer of the offsets of the split.
     """
+
+    # Strategies for computing the training residuals
+    PREDICT = 'predict'
+    SAMPLE  = 'sample'
+    OOB     = 'oob'
+    SKIP    = 'skip'
+    AUTO    = 'auto'
+    TRAIN_RESIDUALS = (PREDICT, SAMPLE, OOB, SKIP, AUTO)
+
+    # Names of the splits accumulated by partial_score
+    TRAIN  = 'train'
+    TEST   = 'test'
+    SPLITS = (TRAIN, TEST)
+
     def __init__(self, model, **kwargs):
         super(ResidualsPlot, self).__init__(model, **kwargs)
 
-        self.ax = None
         self.name = get_model_name(self.estimator)
         self.colors = {
             'train_point': kwargs.pop('train_point_color', '#2B94E9'),
@@ -134,10 +433,82 @@ class ResidualsPlot(RegressionScoreVisualizer):
             'line': kwargs.pop('line_color', '#333333'),
         }
 
+        self.train_residuals = kwargs.pop('train_residuals', self.PREDICT)
+        self.train_sample_size = kwargs.pop('train_sample_size', 10000)
+        self.random_state = kwargs.pop('random_state', 0)
+        self.reservoir_size = kwargs.pop('reservoir_size', 1000)
+        self.max_bins = kwargs.pop('max_bins', 512)
+        self.hist = kwargs.pop('hist', False)
+        self.qqplot = kwargs.pop('qqplot', False)
+        self.qq_points = kwargs.pop('qq_points', 100)
+        self.max_exact_quantiles = kwargs.pop('max_exact_quantiles', 1000000)
+        self.cv = kwargs.pop('cv', None)
+        self.folds_ = None
+        self._points = {}
+        self._offsets = {}
+        self.hax = None
+        self.qqax = None
+        self.reset_stream()
+
+        if self.train_residuals not in self.TRAIN_RESIDUALS:
+            raise YellowbrickValueError(
+                "'{}' not a valid train residuals strategy; choose from {}".format(
+                    self.train_residuals, ", ".join(self.TRAIN_RESIDUALS)
+                )
+            )
 
     def fit(self, X, y=None, **kwargs):
         super(ResidualsPlot, self).fit(X, y, **kwargs)
-        self.score(X, y, train=True)
+
+        self.train_residuals_ = self._train_strategy(X)
+
+        if self.train_residuals_ == self.PREDICT:
+            self.score(X, y, train=True)
+
+        elif self.train_residuals_ == self.SAMPLE:
+            idx = _sample_rows(
+                _num_samples(X), self.train_sample_size, self.random_state
+            )
+            if isdataframe(X):
+                X_sample = X.iloc[idx]
+            elif hasattr(X, 'shape'):
+                X_sample = X[idx]
+            else:
+                X_sample = np.asarray(X)[idx]
+            self.score(X_sample, np.asarray(y)[idx], train=True)
+
+        elif self.train_residuals_ == self.OOB:
+            y_pred = np.asarray(self.estimator.oob_prediction_)
+            residuals = y_pred - np.asarray(y)
+            self.record(y_pred, residuals, train=True)
+            self.draw(y_pred, residuals, train=True)
+
+        return self
+
+    def _train_strategy(self, X):
+        """
+        Resolves the requested strategy for the training residuals against
+        the fitted estimator and the size of the training data.
+        """
+        strategy = self.train_residuals
+        has_oob = getattr(self.estimator, 'oob_prediction_', None) is not None
+
+        if strategy == self.AUTO:
+            if has_oob:
+                return self.OOB
+            if _num_samples(X) > self.train_sample_size:
+                return self.SAMPLE
+            return self.PREDICT
+
+        if strategy == self.OOB and not has_oob:
+            raise YellowbrickValueError(
+                "{} does not provide out-of-bag predictions".format(self.name)
+            )
+
+        if strategy == self.SAMPLE and _num_samples(X) <= self.train_sample_size:
+            return self.PREDICT
+
+        return strategy
 
     def score(self, X, y=None, train=False, **kwargs):
         """
@@ -146,25 +517,128 @@ class ResidualsPlot(RegressionScoreVisualizer):
         We'd like to color them differently in draw...
         Can the user pass those in as keyword arguments?
         """
-        y_pred = self.predict(X)
+        folds = None
+        if self.cv is not None and not train:
+            y_pred, folds = cross_val_predictions(
+                self.estimator, X, y, self.cv, self.n_jobs
+            )
+            self.folds_ = folds
+        else:
+            y_pred = self.predict(X)
+
         scores = y_pred - y
-        self.draw(y_pred, scores, train=train)
+        self.record(y_pred, scores, train=train)
+        self.draw(y_pred, scores, train=train, folds=folds)
+
+    def record(self, y_pred, residuals, train=False):
+        """
+        Adds scored residuals to the running statistics and histogram of
+        their split and keeps them for computing exact quantiles, until more
+        than ``max_exact_quantiles`` residuals of the split have been scored;
+        from then on the kept residuals are released and none are kept.
+        """
+        split = self.TRAIN if train else self.TEST
+        residuals = np.asarray(residuals, dtype=float)
+
+        self.stats_[split].update(residuals)
+        self.histogram_.update(residuals, self.SPLITS.index(split))
+
+        if self.stats_[split].count <= self.max_exact_quantiles:
+            self.residuals_[split].append(residuals)
+        else:
+            del self.residuals_[split][:]
+
+    def reset_stream(self):
+        """
+        Clears the reservoirs, running statistics and histogram accumulated
+        by partial_score.
+        """
+        rng = np.random.RandomState(self.random_state)
+        self.samples_ = dict(
+            (split, Reservoir(self.reservoir_size, 2, rng))
+            for split in self.SPLITS
+        )
+        self.stats_ = dict((split, RunningStats()) for split in self.SPLITS)
+        self.histogram_ = StreamingHistogram(len(self.SPLITS), self.max_bins)
+        self.residuals_ = dict((split, []) for split in self.SPLITS)
+
+    def partial_score(self, X, y=None, train=False, **kwargs):
+        """
+        Accumulates the residuals of a chunk of data into the reservoir
+        sample, running statistics and histogram of its split without
+        drawing anything.
+        """
+        y_pred = np.asarray(self.predict(X), dtype=float)
+        residuals = y_pred - np.asarray(y)
+        split = self.TRAIN if train else self.TEST
+
+        self.samples_[split].update(np.column_stack((y_pred, residuals)))
+        self.stats_[split].update(residuals)
+        self.histogram_.update(residuals, self.SPLITS.index(split))
+
+        # Streamed residuals are not kept, so the kept ones are now unusable
+        del self.residuals_[split][:]
+        return self
+
+    def draw_stream(self, **kwargs):
+        """
+        Draws the reservoir sample of each split accumulated by
+        partial_score, labeled with the exact statistics of the split.
+        """
+        for split in self.SPLITS:
+            sample = self.samples_[split].sample
+            if sample.shape[0] == 0:
+                continue
+
+            stats = self.stats_[split]
+            label = '{} (n={}, mean={:0.3g}, std={:0.3g})'.format(
+                split, stats.count, stats.mean, stats.std
+            )
+            self.draw(
+                sample[:, 0], sample[:, 1], train=split == self.TRAIN,
+                label=label
+            )
+
+        return self.ax
 
     def draw(self, y_pred, residuals, train=False, **kwargs):
         """
 
         """
         if self.ax is None:
-            self.ax = plt.gca()
+            self.ax = new_axes()
 
         color = self.colors['train_point'] if train else self.colors['test_point']
         alpha = 0.5 if train else 1.0
 
-        self.ax.scatter(y_pred, residuals, c=color, s=40, alpha=alpha)
+        folds = kwargs.get('folds')
+        if folds is not None:
+            cycle = get_color_cycle()
+            for fold in np.unique(folds):
+                mask = folds == fold
+                self.ax.scatter(
+                    y_pred[mask], residuals[mask], c=cycle[fold % len(cycle)],
+                    s=40, alpha=alpha, label='fold {}'.format(fold)
+                )
+            return self.ax
+
+        split = self.TRAIN if train else self.TEST
+        xy = np.column_stack((y_pred, residuals))
+        if split in self._points:
+            self._offsets[split].append(xy)
+            self._points[split].set_offsets(self._offsets[split].values)
+            self.ax.update_datalim(xy)
+            self.ax.autoscale_view()
+        else:
+            self._offsets[split] = GrowableArray(2).append(xy)
+            self._points[split] = self.ax.scatter(
+                y_pred, residuals, c=color, s=40, alpha=alpha,
+                label=kwargs.get('label')
+            )
 
         return self.ax
 
-    def poof(self):
+    def poof(self, outpath=None, **kwargs):
         """
         The user calls poof
         """
@@ -173,6 +647,388 @@ class ResidualsPlot(RegressionScoreVisualizer):
         self.ax.hlines(y=0, xmin=0, xmax=100)
         self.ax.set_title('Residuals for {} Model'.format(self.name))
         self.ax.set_ylabel('Residuals')
-        plt.xlabel("Predicted Value")
+        self.ax.set_xlabel("Predicted Value")
+
+        if self.ax.get_legend_handles_labels()[0]:
+            self.ax.legend(loc='best')
+
+        if self.hist or self.qqplot:
+            self.draw_distribution()
+
+        return self.show(outpath, **kwargs)
+
+    def quantiles(self, probs, train=False):
+        """
+        Returns the quantiles of the residuals of a split, exactly from a
+        single partition of the kept residuals if every residual of the split
+        was kept (see ``record``), otherwise from the streaming histogram.
+        """
+        split  = self.TRAIN if train else self.TEST
+        probs  = np.asarray(probs)
+        nkept  = sum(part.size for part in self.residuals_[split])
+
+        if 0 < nkept == self.stats_[split].count:
+            values = np.concatenate(self.residuals_[split])
+            kth = np.round(probs * (values.size - 1)).astype(int)
+            return np.partition(values, np.unique(kth))[kth]
+
+        return self.histogram_.quantiles(probs, self.SPLITS.index(split))
+
+    def draw_distribution(self):
+        """
+        Draws the residual histogram and/or normal Q-Q plot of each split in
+        panels to the right of the residuals plot. The panels are created on
+        the first call and cleared and redrawn on the following ones.
+        """
+        divider = None
+        colors  = {
+            self.TRAIN: self.colors['train_point'],
+            self.TEST: self.colors['test_point'],
+        }
+
+        if self.hist:
+            if self.hax is None:
+                divider = divider or make_axes_locatable(self.ax)
+                self.hax = divider.append_axes("right", size=1, pad=0.1, sharey=self.ax)
+            else:
+                self.hax.cla()
+
+            edges = self.histogram_.edges
+            for idx, split in enumerate(self.SPLITS):
+                counts = self.histogram_.counts[idx]
+                if counts.sum() == 0:
+                    continue
+                self.hax.barh(
+                    edges[:-1], counts / counts.sum(), height=np.diff(edges),
+                    align='edge', color=colors[split], alpha=0.5, linewidth=0
+                )
+            self.hax.set_xlabel('Distribution')
+            self.hax.tick_params(labelleft=False)
+
+        if self.qqplot:
+            if self.qqax is None:
+                divider = divider or make_axes_locatable(self.ax)
+                self.qqax = divider.append_axes("right", size=2, pad=0.6)
+            else:
+                self.qqax.cla()
+
+            probs = (np.arange(self.qq_points) + 0.5) / self.qq_points
+            theoretical = norm.ppf(probs)
+
+            for split in self.SPLITS:
+                stats = self.stats_[split]
+                if stats.count == 0:
+                    continue
+
+                observed = self.quantiles(probs, train=split == self.TRAIN)
+                self.qqax.scatter(theoretical, observed, c=colors[split], s=10)
+                self.qqax.plot(
+                    theoretical, stats.mean + stats.std * theoretical,
+                    c=self.colors['line'], lw=1
+                )
+
+            self.qqax.set_title('Q-Q plot')
+            self.qqax.set_xlabel('Theoretical quantiles')
+            self.qqax.set_ylabel('Observed quantiles')
+
+
+##########################################################################
+## Cook's Distance
+##########################################################################
+
+class CooksDistance(Visualizer):
+    """
+    Cook's distance measures the influence of each instance on an ordinary
+    least squares fit; instances with a large distance (conventionally above
+    4/n) may be outliers that distort the model.
+
+    The leverage of each instance (the diagonal of the hat matrix) is
+    computed without ever forming the n x n hat matrix, either as the row
+    wise squared norms of Q from the thin QR decomposition of the design
+    matrix ('qr', the default) or with ``einsum`` against the inverse of the
+    p x p Gram matrix ('gram'), so memory is O(n*p). The distances are drawn
+    as a stem plot of only the ``top_k`` most influential instances so that
+    the plot stays responsive for millions of rows.
+
+    Parameters
+    ----------
+    method : 'qr' or 'gram', default: 'qr'
+        How the leverages are computed.
+
+    top_k : int, default: 1000
+        The maximum number of instances to draw.
+
+    fit_intercept : bool, default: True
+        Adds a constant column to the design matrix.
+    """
+
+    METHODS = ('qr', 'gram')
+
+    def __init__(self, method='qr', top_k=1000, fit_intercept=True, **kwargs):
+        super(CooksDistance, self).__init__(**kwargs)
+
+        if method not in self.METHODS:
+            raise YellowbrickValueError(
+                "'{}' not a valid leverage method; choose from {}".format(
+                    method, ", ".join(self.METHODS)
+                )
+            )
+
+        self.method = method
+        self.top_k = top_k
+        self.fit_intercept = fit_intercept
+        self.colors = {
+            'stem': kwargs.pop('stem_color', '#2B94E9'),
+            'threshold': kwargs.pop('threshold_color', '#CA0B03'),
+        }
+
+    def fit(self, X, y=None, **kwargs):
+        """
+        Fits an OLS model from the leverage decomposition and computes the
+        Cook's distance of every instance, then draws the plot.
+        """
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+
+        if X.ndim == 1:
+            X = X[:, np.newaxis]
+        if self.fit_intercept:
+            X = np.column_stack((np.ones(X.shape[0]), X))
+
+        nrows, ncols = X.shape
+        if self.method == 'qr':
+            Q, R = np.linalg.qr(X, mode='reduced')
+            self.leverage_ = np.einsum('ij,ij->i', Q, Q)
+            coef = np.linalg.solve(R, np.dot(Q.T, y))
+        else:
+            gram_inv = np.linalg.pinv(np.dot(X.T, X))
+            self.leverage_ = np.einsum('ij,jk,ik->i', X, gram_inv, X)
+            coef = np.dot(gram_inv, np.dot(X.T, y))
+
+        self.residuals_ = y - np.dot(X, coef)
+        mse = np.dot(self.residuals_, self.residuals_) / (nrows - ncols)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.distance_ = (
+                self.residuals_ ** 2 / (ncols * mse) *
+                self.leverage_ / (1 - self.leverage_) ** 2
+            )
+
+        self.influence_threshold_ = 4.0 / nrows
+        self.outlier_percentage_ = (
+            (self.distance_ > self.influence_threshold_).sum() / float(nrows) * 100
+        )
+
+        self.draw()
+        return self
+
+    def draw(self, **kwargs):
+        """
+        Draws the stems of the top_k most influential instances along with
+        the influence threshold.
+        """
+        if self.ax is None:
+            self.ax = new_axes()
+
+        index = np.arange(self.distance_.size)
+        if self.distance_.size > self.top_k:
+            index = np.argpartition(-np.nan_to_num(self.distance_), self.top_k - 1)
+            index = np.sort(index[:self.top_k])
+
+        distance = self.distance_[index]
+        self.ax.vlines(index, 0, distance, colors=self.colors['stem'], lw=1)
+        self.ax.plot(
+            index, distance, 'o', c=self.colors['stem'], ms=3,
+            label="Cook's distance"
+        )
+        self.ax.axhline(
+            self.influence_threshold_, ls='--', c=self.colors['threshold'],
+            label='{:0.2f}% > $I_t$ ($I_t=4/n$)'.format(self.outlier_percentage_)
+        )
+
+        return self.ax
+
+    def poof(self, outpath=None, **kwargs):
+        """
+        Sets the title, labels and legend of the Cook's distance plot.
+        """
+        if self.ax is None: return
+
+        self.ax.set_title("Cook's Distance Outlier Detection")
+        self.ax.set_xlabel('instance index')
+        self.ax.set_ylabel('influence (I)')
+        self.ax.set_xlim(0, self.distance_.size)
+        self.ax.set_ylim(0, None)
+        self.ax.legend(loc='upper right', frameon=True)
+
+        return self.show(outpath, **kwargs)
+
+
+##########################################################################
+## Alpha Selection
+##########################################################################
+
+class AlphaSelection(RegressionScoreVisualizer):
+    """
+    Plots the cross-validated error of a regularized linear model against
+    the regularization strength (alpha) and marks the best alpha, which is
+    then used to fit the wrapped estimator.
+
+    The error curve is computed without refitting the model per alpha:
+
+        Ridge:      the exact leave-one-out error at every alpha is computed
+                    from a single SVD of the (centered) training data using
+                    the diagonal of the hat matrix (e_i / (1 - h_ii)).
+        Lasso/
+        ElasticNet: the k-fold error along the whole path is computed with
+                    warm-started coordinate descent (LassoCV/ElasticNetCV),
+                    with folds fitted in parallel with ``n_jobs``.
+
+    After fit, calling score marks the mean squared error of the selected
+    alpha on held out data (stored in ``test_error_``).
+
+    Parameters
+    ----------
+    model : an unfitted Ridge, Lasso or ElasticNet estimator
+        Its other parameters (e.g. fit_intercept, l1_ratio) are kept.
+
+    alphas : array-like or None
+        The alphas to evaluate. If None a log-spaced grid is used for Ridge
+        and the path grid of the coordinate descent solver otherwise.
+
+    cv : int, cross-validation generator or None
+        The folds used to score Lasso and ElasticNet paths.
+    """
+
+    def __init__(self, model, alphas=None, cv=None, **kwargs):
+        super(AlphaSelection, self).__init__(model, **kwargs)
+
+        if not isinstance(model, (Ridge, ElasticNet)):
+            raise YellowbrickTypeError(
+                "alpha selection requires a Ridge, Lasso or ElasticNet "
+                "estimator not {}".format(get_model_name(model))
+            )
+
+        self.name = get_model_name(self.estimator)
+        self.alphas = alphas
+        self.cv = cv
+        self.colors = {
+            'line': kwargs.pop('line_color', '#2B94E9'),
+            'alpha': kwargs.pop('alpha_color', '#333333'),
+            'test': kwargs.pop('test_color', '#94BA65'),
+        }
+
+    def fit(self, X, y=None, **kwargs):
+        """
+        Computes the error curve, selects the alpha with the lowest error and
+        fits the estimator with it, then draws the curve.
+        """
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+
+        if isinstance(self.estimator, Ridge):
+            alphas = self.alphas
+            if alphas is None:
+                alphas = np.logspace(-4, 4, 100)
+            self.alphas_ = np.asarray(alphas, dtype=float)
+            self.errors_ = self.ridge_loo_errors(X, y, self.alphas_)
+        else:
+            self.alphas_, self.errors_ = self.path_cv_errors(X, y)
+
+        self.alpha_ = self.alphas_[np.argmin(self.errors_)]
+        self.estimator.set_params(alpha=self.alpha_)
+        self.estimator.fit(X, y, **kwargs)
+
+        self.draw()
+        return self
+
+    def score(self, X, y=None, **kwargs):
+        """
+        Computes the mean squared error on X and y of the estimator fit with
+        the selected alpha and marks it on the error curve.
+        """
+        y_pred = np.asarray(self.predict(X), dtype=float)
+        self.test_error_ = np.mean((np.asarray(y, dtype=float) - y_pred) ** 2)
+
+        if self.ax is None:
+            self.ax = new_axes()
+
+        self.ax.scatter(
+            [self.alpha_], [self.test_error_], c=self.colors['test'], s=40,
+            zorder=3, label='test error={:0.3g}'.format(self.test_error_)
+        )
+        return self.ax
+
+    def ridge_loo_errors(self, X, y, alphas):
+        """
+        Returns the leave-one-out mean squared error of ridge regression at
+        every alpha from one thin SVD, X = U S V^T. The hat matrix of each
+        alpha is U diag(s^2 / (s^2 + alpha)) U^T (plus 1/n for an unpenalized
+        intercept) and only its diagonal is computed.
+        """
+        nrows = X.shape[0]
+        if self.estimator.fit_intercept:
+            X = X - X.mean(axis=0)
+            offset, base = y.mean(), 1.0 / nrows
+        else:
+            offset, base = 0.0, 0.0
+
+        U, s, _ = np.linalg.svd(X, full_matrices=False)
+        shrink  = s[:, np.newaxis] ** 2 / (s[:, np.newaxis] ** 2 + alphas)
+
+        # The fitted values and hat diagonals, one column per alpha
+        fitted  = offset + np.dot(U, shrink * np.dot(U.T, y - offset)[:, np.newaxis])
+        hat     = base + np.dot(U ** 2, shrink)
+        loo     = (y[:, np.newaxis] - fitted) / (1 - hat)
+
+        return (loo ** 2).mean(axis=0)
+
+    def path_cv_errors(self, X, y):
+        """
+        Returns the alphas and the mean k-fold error along the Lasso or
+        ElasticNet regularization path computed with warm starts.
+        """
+        params = dict(
+            cv=self.cv, n_jobs=self.n_jobs,
+            fit_intercept=self.estimator.fit_intercept,
+            max_iter=self.estimator.max_iter, tol=self.estimator.tol,
+        )
+        if self.alphas is not None:
+            params['alphas'] = self.alphas
+
+        if isinstance(self.estimator, Lasso):
+            path = LassoCV(**params)
+        else:
+            path = ElasticNetCV(l1_ratio=self.estimator.l1_ratio, **params)
+
+        path.fit(X, y)
+        return path.alphas_, path.mse_path_.mean(axis=-1)
+
+    def draw(self, **kwargs):
+        """
+        Draws the error curve and marks the selected alpha.
+        """
+        if self.ax is None:
+            self.ax = new_axes()
+
+        self.ax.plot(self.alphas_, self.errors_, c=self.colors['line'], label=self.name)
+        self.ax.axvline(
+            self.alpha_, ls='--', c=self.colors['alpha'],
+            label='$\\alpha={:0.3g}$'.format(self.alpha_)
+        )
 
         return self.ax
+
+    def poof(self, outpath=None, **kwargs):
+        """
+        Sets the title, labels and legend of the alpha selection plot.
+        """
+        if self.ax is None: return
+
+        self.ax.set_title('{} Alpha Error'.format(self.name))
+        self.ax.set_xscale('log')
+        self.ax.set_xlabel('alpha')
+        self.ax.set_ylabel('error (or score)')
+        self.ax.legend(loc='best')
+
+        return self.show(outpath, **kwargs)
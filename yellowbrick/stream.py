@@ -0,0 +1,361 @@
+# yellowbrick.stream
+# Fixed memory summaries of data that arrives in chunks.
+#
+# Copyright (C) 2016 District Data Labs
+# For license information, see LICENSE.txt
+
+"""
+Fixed memory summaries of data that arrives in chunks, used by visualizers
+that accumulate scores over a stream with ``partial_score``.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import numpy as np
+
+from .exceptions import YellowbrickValueError
+
+
+##########################################################################
+## Running Statistics
+##########################################################################
+
+class RunningStats(object):
+    """
+    Exact running count, mean and variance of a stream of values. Each chunk
+    is summarized with numpy and merged into the running totals with the
+    pairwise update of Chan et al., which is numerically stable.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean  = 0.0
+        self.m2    = 0.0
+
+    def update(self, values):
+        """
+        Merges the summary of a chunk of values into the running totals.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        if values.size == 0:
+            return self
+
+        count = values.size
+        mean  = values.mean()
+        m2    = ((values - mean) ** 2).sum()
+
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2   += m2 + delta * delta * self.count * count / total
+        self.count = total
+        return self
+
+    @property
+    def variance(self):
+        """
+        The population variance of all values seen so far.
+        """
+        if self.count == 0:
+            return np.nan
+        return self.m2 / self.count
+
+    @property
+    def std(self):
+        return np.sqrt(self.variance)
+
+
+class RunningRegression(object):
+    """
+    Exact running ordinary least squares fit of y on x, kept as the count,
+    means and co-moments of the stream and merged chunk by chunk in the same
+    manner as ``RunningStats``.
+    """
+
+    def __init__(self):
+        self.count  = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.sxx    = 0.0
+        self.sxy    = 0.0
+
+    def update(self, x, y):
+        """
+        Merges the co-moments of a chunk of (x, y) pairs into the fit.
+        """
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        if x.size == 0:
+            return self
+
+        count  = x.size
+        mean_x = x.mean()
+        mean_y = y.mean()
+        sxx    = ((x - mean_x) ** 2).sum()
+        sxy    = ((x - mean_x) * (y - mean_y)).sum()
+
+        total  = self.count + count
+        dx     = mean_x - self.mean_x
+        dy     = mean_y - self.mean_y
+        scale  = float(self.count) * count / total
+
+        self.sxx    += sxx + dx * dx * scale
+        self.sxy    += sxy + dx * dy * scale
+        self.mean_x += dx * count / total
+        self.mean_y += dy * count / total
+        self.count   = total
+        return self
+
+    @property
+    def slope(self):
+        if self.sxx == 0:
+            return 0.0
+        return self.sxy / self.sxx
+
+    @property
+    def intercept(self):
+        return self.mean_y - self.slope * self.mean_x
+
+    def predict(self, x):
+        """
+        Returns the fitted line evaluated at x.
+        """
+        return self.intercept + self.slope * np.asarray(x, dtype=float)
+
+
+##########################################################################
+## Reservoir Sampling
+##########################################################################
+
+class Reservoir(object):
+    """
+    A uniform random sample of at most ``size`` rows of a stream, maintained
+    with vectorized reservoir sampling (Algorithm R) so that every row seen
+    so far has the same probability of being in the sample.
+
+    Parameters
+    ----------
+    size : int
+        The maximum number of rows to keep.
+
+    ncols : int, default: 1
+        The number of columns of each row.
+
+    random_state : int, RandomState or None
+        Seeds the replacement decisions.
+    """
+
+    def __init__(self, size, ncols=1, random_state=None):
+        if size < 1:
+            raise YellowbrickValueError(
+                "reservoir size must be a positive integer not {}".format(size)
+            )
+
+        self.size  = size
+        self.seen  = 0
+        self.data  = np.empty((size, ncols))
+        self.random_state = random_state
+        self._rng  = (
+            random_state if isinstance(random_state, np.random.RandomState)
+            else np.random.RandomState(random_state)
+        )
+
+    def update(self, rows):
+        """
+        Offers a chunk of rows of shape (n, ncols) to the reservoir.
+        """
+        rows = np.asarray(rows, dtype=float).reshape(-1, self.data.shape[1])
+
+        # Fill the reservoir until it reaches capacity
+        nfill = max(min(self.size - self.seen, rows.shape[0]), 0)
+        self.data[self.seen:self.seen+nfill] = rows[:nfill]
+        self.seen += nfill
+        rows = rows[nfill:]
+
+        if rows.shape[0] == 0:
+            return self
+
+        # The ith remaining row replaces a random slot with probability
+        # size / (seen + i + 1); later rows win when they pick the same slot.
+        slots = (
+            self._rng.random_sample(rows.shape[0]) *
+            (self.seen + np.arange(1, rows.shape[0] + 1))
+        ).astype(np.int64)
+        keep  = np.flatnonzero(slots < self.size)
+        _, last = np.unique(slots[keep][::-1], return_index=True)
+        keep  = keep[keep.size - 1 - last]
+
+        self.data[slots[keep]] = rows[keep]
+        self.seen += rows.shape[0]
+        return self
+
+    @property
+    def sample(self):
+        """
+        The rows currently in the reservoir.
+        """
+        return self.data[:min(self.seen, self.size)]
+
+
+##########################################################################
+## Growable Arrays
+##########################################################################
+
+class GrowableArray(object):
+    """
+    Rows of a stream appended into a buffer whose capacity doubles when it
+    is full, so that appending a chunk costs time proportional to the chunk
+    (amortized) rather than copying every row appended so far. Unlike the
+    other summaries its memory grows with the stream; ``values`` is a view
+    of the filled part of the buffer.
+
+    Parameters
+    ----------
+    ncols : int, default: 2
+        The number of columns of each row.
+
+    capacity : int, default: 1024
+        The initial number of rows the buffer can hold.
+    """
+
+    def __init__(self, ncols=2, capacity=1024):
+        self.size = 0
+        self.data = np.empty((max(capacity, 1), ncols))
+
+    def append(self, rows):
+        """
+        Appends a chunk of rows of shape (n, ncols), doubling the capacity of
+        the buffer as many times as needed to hold them.
+        """
+        rows = np.asarray(rows, dtype=float).reshape(-1, self.data.shape[1])
+        total = self.size + rows.shape[0]
+
+        if total > self.data.shape[0]:
+            capacity = self.data.shape[0]
+            while capacity < total:
+                capacity *= 2
+            data = np.empty((capacity, self.data.shape[1]))
+            data[:self.size] = self.data[:self.size]
+            self.data = data
+
+        self.data[self.size:total] = rows
+        self.size = total
+        return self
+
+    @property
+    def values(self):
+        """
+        The rows appended so far, as a view of the buffer.
+        """
+        return self.data[:self.size]
+
+
+##########################################################################
+## Streaming Histogram
+##########################################################################
+
+class StreamingHistogram(object):
+    """
+    Exact histogram of one or more streams of values (rows) that share the
+    same bins. Bins have a fixed width aligned to zero, set from the spread
+    of the first chunk; the range grows as values arrive and if it would
+    need more than ``max_bins`` bins, adjacent bins are merged pairwise by
+    doubling the width. Counts are therefore always exact for the current
+    bins and memory never exceeds ``nrows x max_bins``.
+
+    Parameters
+    ----------
+    nrows : int, default: 1
+        The number of streams that share the bins.
+
+    max_bins : int, default: 512
+        The maximum number of bins to keep.
+    """
+
+    def __init__(self, nrows=1, max_bins=512):
+        if max_bins < 8:
+            raise YellowbrickValueError("max_bins must be at least 8")
+
+        self.nrows    = nrows
+        self.max_bins = max_bins
+        self.width    = None
+        self.offset   = 0
+        self.counts   = np.zeros((nrows, 0))
+
+    @property
+    def edges(self):
+        """
+        The bin edges of the histogram.
+        """
+        if self.width is None:
+            return np.zeros(1)
+        return (self.offset + np.arange(self.counts.shape[1] + 1)) * self.width
+
+    def update(self, values, row=0):
+        """
+        Adds a chunk of finite values to the counts of the given row.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return self
+
+        if self.width is None:
+            span = values.max() - values.min()
+            scale = span if span > 0 else max(abs(values[0]), 1.0)
+            self.width = scale / (self.max_bins // 4)
+            self.offset = int(np.floor(values.min() / self.width))
+
+        bins = np.floor(values / self.width).astype(np.int64)
+        lo = min(self.offset, bins.min())
+        hi = max(self.offset + self.counts.shape[1], bins.max() + 1)
+
+        # Merge bins pairwise until the range fits into max_bins
+        while hi - lo > self.max_bins:
+            self._coarsen()
+            bins //= 2
+            lo, hi = lo // 2, -(-hi // 2)
+
+        # Grow the counts to cover the new range then add the chunk
+        if lo < self.offset or hi > self.offset + self.counts.shape[1]:
+            counts = np.zeros((self.nrows, hi - lo))
+            start  = self.offset - lo
+            counts[:, start:start+self.counts.shape[1]] = self.counts
+            self.counts, self.offset = counts, lo
+
+        self.counts[row] += np.bincount(
+            bins - self.offset, minlength=self.counts.shape[1]
+        )
+        return self
+
+    def _coarsen(self):
+        """
+        Doubles the bin width, merging the counts of adjacent bins.
+        """
+        index  = (self.offset + np.arange(self.counts.shape[1])) // 2
+        offset = self.offset // 2
+        counts = np.zeros((self.nrows, index[-1] - offset + 1 if index.size else 0))
+        for row in range(self.nrows):
+            counts[row] = np.bincount(
+                index - offset, self.counts[row], counts.shape[1]
+            )
+
+        self.counts, self.offset = counts, offset
+        self.width *= 2
+
+    def quantiles(self, q, row=0):
+        """
+        Estimates the quantiles q of a row by linear interpolation of its
+        cumulative counts within the bins.
+        """
+        counts = np.r_[0, np.cumsum(self.counts[row])]
+        if counts[-1] == 0:
+            return np.full(np.shape(q), np.nan)
+
+        # Drop the flat steps of empty bins so the interpolation is defined
+        mask = np.r_[True, np.diff(counts) > 0]
+        return np.interp(
+            np.asarray(q) * counts[-1], counts[mask], self.edges[mask]
+        )
@@ -97,3 +97,24 @@ def is_dataframe(obj):
 
 # Alias for closer name to isinstance and issubclass
 isdataframe = is_dataframe
+
+
+def is_fitted(estimator):
+    """
+    Returns True if the given estimator has (probably) been fitted, using the
+    Scikit-Learn convention that fit sets attributes with a trailing
+    underscore. Pipelines are fitted if their final step is fitted.
+    """
+    if hasattr(estimator, '__sklearn_is_fitted__'):
+        return estimator.__sklearn_is_fitted__()
+
+    if isinstance(estimator, Pipeline):
+        return is_fitted(estimator.steps[-1][-1])
+
+    return any(
+        attr.endswith('_') and not attr.startswith('__')
+        for attr in vars(estimator)
+    )
+
+# Alias for closer name to isinstance and issubclass
+isfitted = is_fitted